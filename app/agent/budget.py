@@ -0,0 +1,340 @@
+"""
+Prompt budget: what the tools cost in the model's context, and how to cut it.
+
+Every model request carries the tool schemas, and every tool result stays in
+the conversation. `budget_tools` wraps the tools for the agent so that, unless
+`TOOL_VERBOSE` is set, descriptions are cut down to their summary, exclusions
+and argument formats, and results are sent as compact JSON (no nulls, short
+keys, times without seconds). Long event lists are truncated to
+`TOOL_RESULT_MAX_EVENTS` with a cursor for the rest. The full result stays on
+the `ToolMessage` as its artifact.
+
+`PromptBudgetMiddleware` counts the tokens of each turn as sent and as the
+verbose encoding would have sent it; `python -m app.agent.budget` prints the
+per-tool schema sizes.
+"""
+from __future__ import annotations
+
+import inspect
+import json
+import math
+import re
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any
+
+from langchain.agents.middleware import AgentMiddleware
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import BaseTool, StructuredTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from langgraph.config import get_config
+from pydantic import Field, create_model
+
+from app.tools.list_events import list_next_events_tool, list_today_events_tool
+
+# Tools whose `data.events` list is paged with a `cursor` argument.
+_PAGED_TOOLS = {list_next_events_tool.name, list_today_events_tool.name}
+
+_SHORT_KEYS = {
+    "eventId": "id",
+    "conflict_count": "count",
+    "created_count": "created",
+    "deleted_count": "deleted",
+    "failed_count": "failed",
+}
+_ARG_LINE = re.compile(r"(?P<name>\w+) \((?P<type>[^,)]+)[^)]*\): (?P<text>.*)")
+_ISO_TIME = re.compile(r"(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2})(:\d{2}(?:\.\d+)?)?(Z|[+-]\d{2}:\d{2})?")
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # tiktoken downloads its tables on first use; offline, fall back to an estimate.
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Tokens in `text` for current OpenAI chat models (about 4 characters each without tiktoken)."""
+    encoding = _encoding()
+    if encoding is None:
+        return math.ceil(len(text) / 4)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _argument_hints(paragraphs: list[str]) -> str:
+    """One line of argument formats from the docstring's `Args:` section."""
+    args: dict[str, list[str]] = {}
+    for paragraph in paragraphs:
+        if paragraph.startswith("Args:"):
+            for line in paragraph.splitlines()[1:]:
+                match = _ARG_LINE.match(line.strip())
+                if match:
+                    args[match["name"]] = [match["type"], match["text"]]
+                elif args:
+                    args[next(reversed(args))][1] += " " + line.strip()
+    # Nested inputs (create_events_tool's `events`) only mention their fields.
+    times = [name for name, (kind, _) in args.items() if kind == "datetime"]
+    rules = [name for name, (kind, text) in args.items() if kind == "str" and "RRULE" in text]
+    hints = []
+    if times or any("datetime" in text for _, text in args.values()):
+        hints.append(f"{', '.join(times) or 'times'} as ISO 8601 with UTC offset (2026-01-20T14:00:00+02:00)")
+    if rules or any("RRULE" in text for _, text in args.values()):
+        hints.append(f"{', '.join(rules) or 'recurrence'} as an RFC 5545 RRULE (FREQ=WEEKLY;BYDAY=MO)")
+    hints += [
+        f"{name} defaults to {match[1]}"
+        for name, (_, text) in args.items()
+        if (match := re.search(r"Defaults to (.+?)\.?$", text))
+    ]
+    return "; ".join(hints)
+
+
+def compact_description(tool: BaseTool) -> str:
+    """
+    The first paragraph of a tool's docstring, its "Do NOT use" cases on one
+    line, and one line of argument formats (times, RRULEs, defaults).
+    """
+    paragraphs = inspect.cleandoc(tool.description).split("\n\n")
+    summary = " ".join(paragraphs[0].split())
+    summary = re.sub(r"^Use this tool to (\w)", lambda m: m[1].upper(), summary)
+    avoid = [
+        line.strip()[2:]
+        for paragraph in paragraphs
+        if paragraph.startswith("Do NOT use")
+        for line in paragraph.splitlines()[1:]
+        if line.strip().startswith("- ")
+    ]
+    if avoid:
+        summary += " Not for: " + "; ".join(avoid) + "."
+    hints = _argument_hints(paragraphs)
+    if hints:
+        summary += "\nArgs: " + hints + "."
+    return summary
+
+
+def _short_time(value: str) -> str:
+    match = _ISO_TIME.fullmatch(value)
+    if match is None:
+        return value
+    day, minutes, seconds, offset = match.groups()
+    if seconds and seconds.strip(":0."):
+        return value
+    return f"{day}T{minutes}{'Z' if offset == '+00:00' else offset or ''}"
+
+
+def _compact(value: Any) -> Any:
+    if isinstance(value, dict):
+        compacted = {_SHORT_KEYS.get(key, key): _compact(item) for key, item in value.items() if item is not None}
+        start, end = compacted.get("start"), compacted.get("end")
+        # An end on the start's day (same offset) keeps just its time.
+        if isinstance(start, str) and isinstance(end, str) and "T" in start and "T" in end:
+            start_day, start_rest = start.split("T")
+            end_day, end_rest = end.split("T")
+            if start_day == end_day and start_rest[5:] == end_rest[5:]:
+                compacted["end"] = end_rest[:5]
+        return compacted
+    if isinstance(value, list):
+        return [_compact(item) for item in value]
+    if isinstance(value, (datetime, date)):
+        return _short_time(value.isoformat())
+    if isinstance(value, str):
+        return _short_time(value)
+    return value
+
+
+def _page(result: dict, cursor: str | None, max_events: int) -> dict:
+    data = result.get("data")
+    if not isinstance(data, dict) or not isinstance(data.get("events"), list):
+        return result
+    events = data["events"]
+    offset = int(cursor) if cursor and cursor.isdigit() else 0
+    stop = offset + max_events
+    page = {**data, "events": events[offset:stop]}
+    if stop < len(events):
+        page["more"] = {"remaining": len(events) - stop, "cursor": str(stop)}
+    return {**result, "data": page}
+
+
+def encode_result(result: Any, *, cursor: str | None = None, max_events: int = 20, compact: bool = True) -> str:
+    """Serialize a tool result for the model's context."""
+    if isinstance(result, dict):
+        result = _page(result, cursor, max_events)
+    if compact:
+        return json.dumps(_compact(result), separators=(",", ":"), ensure_ascii=False)
+    return json.dumps(result, default=str, ensure_ascii=False)
+
+
+def _budgeted(tool: BaseTool, *, verbose: bool, max_events: int) -> BaseTool:
+    schema = tool.args_schema
+    if tool.name in _PAGED_TOOLS:
+        schema = create_model(
+            f"{schema.__name__}Paged",
+            __base__=schema,
+            cursor=(str | None, Field(default=None, description="`more.cursor` of the previous page.")),
+        )
+
+    def encode(result, cursor):
+        return encode_result(result, cursor=cursor, max_events=max_events, compact=not verbose), result
+
+    def run(**kwargs):
+        cursor = kwargs.pop("cursor", None)
+        return encode(tool.func(**kwargs), cursor)
+
+    async def arun(**kwargs):
+        cursor = kwargs.pop("cursor", None)
+        return encode(await tool.coroutine(**kwargs), cursor)
+
+    return StructuredTool(
+        name=tool.name,
+        description=tool.description if verbose else compact_description(tool),
+        args_schema=schema,
+        func=run,
+        coroutine=arun if tool.coroutine is not None else None,
+        response_format="content_and_artifact",
+    )
+
+
+def budget_tools(tools: list[BaseTool], *, verbose: bool = False, max_events: int = 20) -> list[BaseTool]:
+    """The agent's view of `tools`: compact (or verbose) descriptions and encoded results."""
+    return [_budgeted(tool, verbose=verbose, max_events=max_events) for tool in tools]
+
+
+def schema_tokens(tool: BaseTool | dict) -> int:
+    return count_tokens(json.dumps(convert_to_openai_tool(tool), separators=(",", ":")))
+
+
+@dataclass
+class TurnBudget:
+    """Prompt tokens of one turn (summed over its model calls), as sent and as verbose."""
+
+    model_calls: int = 0
+    compact_tokens: int = 0
+    verbose_tokens: int = 0
+
+
+class PromptBudget:
+    """Process-wide per-turn token counts, reported by `/health`."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.turns = 0
+        self.model_calls = 0
+        self.compact_tokens = 0
+        self.verbose_tokens = 0
+        self.last_turn: TurnBudget | None = None
+
+    def record(self, turn: TurnBudget) -> None:
+        with self._lock:
+            self.turns += 1
+            self.model_calls += turn.model_calls
+            self.compact_tokens += turn.compact_tokens
+            self.verbose_tokens += turn.verbose_tokens
+            self.last_turn = turn
+
+    def stats(self) -> dict:
+        with self._lock:
+            turns = self.turns or 1
+            return {
+                "turns": self.turns,
+                "model_calls": self.model_calls,
+                "tokens_per_turn": round(self.compact_tokens / turns, 1),
+                "verbose_tokens_per_turn": round(self.verbose_tokens / turns, 1),
+                "saved": 1 - self.compact_tokens / self.verbose_tokens if self.verbose_tokens else 0.0,
+                "last_turn": vars(self.last_turn) if self.last_turn else None,
+            }
+
+
+_budget = PromptBudget()
+
+
+def get_prompt_budget() -> PromptBudget:
+    return _budget
+
+
+def _thread_id() -> str | None:
+    try:
+        return get_config()["configurable"].get("thread_id")
+    except RuntimeError:
+        return None
+
+
+class PromptBudgetMiddleware(AgentMiddleware):
+    """
+    Counts each model request's prompt tokens: system prompt, tool schemas and
+    messages as sent, next to the same request with `tools`' full
+    descriptions and verbose (artifact) tool results.
+    """
+
+    def __init__(self, tools: list[BaseTool], *, budget: PromptBudget | None = None):
+        super().__init__()
+        self.budget = budget or get_prompt_budget()
+        self._verbose_schemas = {tool.name: schema_tokens(tool) for tool in tools}
+        self._sent_schemas: dict[str, int] = {}
+        self._turns: dict[str | None, TurnBudget] = {}
+        self._lock = threading.Lock()
+
+    def before_agent(self, state, runtime) -> None:
+        with self._lock:
+            self._turns[_thread_id()] = TurnBudget()
+
+    def after_agent(self, state, runtime) -> None:
+        with self._lock:
+            turn = self._turns.pop(_thread_id(), None)
+        if turn is not None:
+            self.budget.record(turn)
+
+    def _measure(self, request) -> None:
+        system = count_tokens(request.system_message.text) if request.system_message is not None else 0
+        sent = verbose = system
+        for tool in request.tools:
+            name = tool.name if isinstance(tool, BaseTool) else tool.get("name", "")
+            if name not in self._sent_schemas:
+                self._sent_schemas[name] = schema_tokens(tool)
+            sent += self._sent_schemas[name]
+            verbose += self._verbose_schemas.get(name, self._sent_schemas[name])
+        for message in request.messages:
+            tokens = count_tokens(message.text)
+            if isinstance(message, AIMessage) and message.tool_calls:
+                tokens += count_tokens(json.dumps([call["args"] for call in message.tool_calls], default=str))
+            sent += tokens
+            if isinstance(message, ToolMessage) and message.artifact is not None:
+                tokens = count_tokens(encode_result(message.artifact, max_events=10**9, compact=False))
+            verbose += tokens
+
+        with self._lock:
+            turn = self._turns.get(_thread_id())
+        if turn is not None:
+            turn.model_calls += 1
+            turn.compact_tokens += sent
+            turn.verbose_tokens += verbose
+
+    def wrap_model_call(self, request, handler):
+        self._measure(request)
+        return handler(request)
+
+    async def awrap_model_call(self, request, handler):
+        self._measure(request)
+        return await handler(request)
+
+
+def main() -> None:
+    from app.agent.calendar_agent import TOOLS
+
+    print(f"{'tool':<28}{'verbose':>9}{'compact':>9}")
+    totals = [0, 0]
+    for tool, compact in zip(TOOLS, budget_tools(TOOLS)):
+        sizes = schema_tokens(tool), schema_tokens(compact)
+        totals = [total + size for total, size in zip(totals, sizes)]
+        print(f"{tool.name:<28}{sizes[0]:>9}{sizes[1]:>9}")
+    print(f"{'all tools (every request)':<28}{totals[0]:>9}{totals[1]:>9}")
+    if _encoding() is None:
+        print("(tiktoken tables unavailable; counts are estimates)")
+
+
+if __name__ == "__main__":
+    main()
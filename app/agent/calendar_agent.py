@@ -1,25 +1,335 @@
+import json
+import math
+from contextlib import contextmanager, nullcontext
+from datetime import date, datetime, time, timedelta
+from typing import AsyncIterator, Hashable, Iterator, NamedTuple
+from uuid import uuid4
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from langchain_openai import ChatOpenAI
 from langchain.agents import create_agent
 
-from app.tools.create_event import create_event_tool, check_conflicts_tool
+from app.tools.create_event import create_event_tool, create_events_tool, check_conflicts_tool
 from app.tools.list_events import list_next_events_tool, list_today_events_tool
-from app.tools.delete_event import delete_event_tool
+from app.tools.delete_event import delete_event_tool, delete_events_tool
+from app.tools.find_free_slots import find_free_slots_tool
 
 from app.config.settings import load_settings
+from app.services.event_times import to_timestamp
+from app.services.response_cache import Window, get_response_cache
+from app.tools.memo import memoize_calls, session_memo
+
+from app.agent.budget import PromptBudgetMiddleware, budget_tools
+from app.agent.memory import conversation_middleware, get_checkpointer
+from app.agent.prompts import COMPACT_RESULTS, SYSTEM_PROMPT
+from app.agent.router import Route, get_router, when_terms
+from app.agent.tracing import TelemetryMiddleware, turn_span
+from app.agent.streaming import STREAM_MODES, AgentEvent, AgentEventTranslator, tool_result
+
+TOOLS = [
+    create_event_tool,
+    create_events_tool,
+    list_next_events_tool,
+    list_today_events_tool,
+    delete_event_tool,
+    delete_events_tool,
+    check_conflicts_tool,
+    find_free_slots_tool,
+]
+
+# Fast-path intents whose answer only reads the calendar.
+_CACHEABLE_INTENTS = {"list_today", "list_next", "check_conflicts"}
+_READ_ONLY_TOOLS = {
+    list_today_events_tool.name,
+    list_next_events_tool.name,
+    check_conflicts_tool.name,
+    find_free_slots_tool.name,
+}
+
+
+class _CacheSlot(NamedTuple):
+    """Where a turn's reply lives in the response cache (`text`/`group` enable similarity matching)."""
+
+    key: Hashable
+    generation: int
+    text: str | None = None
+    group: Hashable | None = None
+
+
+class _Dispatch(NamedTuple):
+    """How a turn will be answered: from the cache, by a fast-path route, or (neither) by the model."""
+
+    slot: _CacheSlot | None
+    route: Route | None = None
+    cached: str | None = None
+
+    @property
+    def shortcut(self) -> bool:
+        return self.cached is not None or self.route is not None
+
+
+def _call_window(name: str, args: dict, now: datetime) -> Window:
+    """The time range a read-only tool call looked at."""
+    if name == list_today_events_tool.name:
+        midnight = datetime.combine(now.date(), time.min, tzinfo=now.tzinfo)
+        return midnight.timestamp(), (midnight + timedelta(days=1)).timestamp()
+    if name == list_next_events_tool.name:
+        return now.timestamp(), math.inf
+    pad = int(args.get("buffer_minutes") or 0) * 60
+    return to_timestamp(args["start"], now.tzinfo) - pad, to_timestamp(args["end"], now.tzinfo) + pad
+
+
+def _turn_tools(messages: list) -> tuple[list[tuple[str, dict]], list]:
+    """(name, args) of the tool calls made since the last user message, and their results."""
+    start = max((i for i, message in enumerate(messages) if isinstance(message, HumanMessage)), default=-1)
+    calls, results = [], []
+    for message in messages[start + 1:]:
+        if isinstance(message, AIMessage):
+            calls.extend((call["name"], call["args"]) for call in message.tool_calls)
+        elif isinstance(message, ToolMessage):
+            results.append(tool_result(message))
+    return calls, results
 
-from app.agent.prompts import SYSTEM_PROMPT
 
 class CalendarAgent:
-    def __init__(self):
+    def __init__(self, *, checkpointer=None, llm=None):
         self._settings = load_settings()
-        self.llm = ChatOpenAI(model=self._settings.openai_model, temperature=0, api_key=self._settings.openai_api)
-        self.tools = [create_event_tool, list_next_events_tool, list_today_events_tool, delete_event_tool, check_conflicts_tool]
+        # Any LangChain chat model can stand in for OpenAI (benchmarks use a scripted one).
+        self.llm = llm if llm is not None else ChatOpenAI(
+            model=self._settings.openai_model, temperature=0, api_key=self._settings.openai_api
+        )
+        self.tools = list(TOOLS)
+        # Conversations live in the (process-wide) checkpointer, keyed by session id,
+        # so any agent instance can continue any session.
+        self.checkpointer = checkpointer if checkpointer is not None else get_checkpointer()
+        verbose = self._settings.tool_verbose
         self.agent = create_agent(
             model=self.llm,
-            tools=self.tools,
-            system_prompt=SYSTEM_PROMPT
+            tools=budget_tools(self.tools, verbose=verbose, max_events=self._settings.tool_result_max_events),
+            system_prompt=SYSTEM_PROMPT if verbose else SYSTEM_PROMPT + COMPACT_RESULTS,
+            middleware=[
+                *conversation_middleware(self.llm, self._settings),
+                PromptBudgetMiddleware(self.tools),
+                TelemetryMiddleware(self._settings.openai_model),
+            ],
+            checkpointer=self.checkpointer,
             )
-        
-    def run(self, user_prompt: str) -> str:
-        result = self.agent.invoke({"messages": [("user", user_prompt)]})
-        return result["messages"][-1].content
\ No newline at end of file
+        # Simple commands ("list today's events") skip the LLM entirely.
+        self.router = get_router() if self._settings.fast_path_enabled else None
+        # Repeated read-only questions are answered from the (process-wide) response cache.
+        self.cache = get_response_cache() if self._settings.response_cache_enabled else None
+
+    @contextmanager
+    def _session(self, session_id: str | None) -> Iterator[dict]:
+        """
+        Graph config for `session_id`. Without one the turn runs in a throwaway
+        thread that is deleted afterwards, i.e. without memory.
+        """
+        thread_id = session_id or f"oneshot-{uuid4().hex}"
+        try:
+            with self._memo(session_id):
+                yield {"configurable": {"thread_id": thread_id}}
+        finally:
+            if session_id is None:
+                self.checkpointer.delete_thread(thread_id)
+
+    def _memo(self, session_id: str | None):
+        """Let the turn's tool calls reuse each other's calendar reads (see `TOOL_MEMO`)."""
+        mode = self._settings.tool_memo
+        if mode == "off":
+            return nullcontext()
+        if mode == "session" and session_id is not None:
+            # Bounded by the same staleness as the local event store.
+            return memoize_calls(session_memo(session_id, self._settings.event_cache_max_staleness_seconds))
+        return memoize_calls()
+
+    def _route(self, user_prompt: str) -> Route | None:
+        return self.router.match(user_prompt) if self.router is not None else None
+
+    def _fast_turn(self, session_id: str, user_prompt: str, reply: str) -> tuple[dict, dict]:
+        # A fast-path turn is written to the session like any other, so
+        # follow-ups ("delete the second one") can refer to it.
+        config = {"configurable": {"thread_id": session_id}}
+        return config, {"messages": [HumanMessage(user_prompt), AIMessage(reply)]}
+
+    def _cache_slot(self, user_prompt: str, route: Route | None, session_id: str | None) -> _CacheSlot | None:
+        """
+        Cache slot for this turn, or None if its reply must not be shared:
+        a fast-path command that changes the calendar, or a free-form prompt
+        in a session with history (the reply may depend on earlier turns).
+        """
+        if self.cache is None:
+            return None
+        settings = load_settings()
+        day = datetime.now(tz=settings.tzinfo).date().isoformat()
+        generation = self.cache.generation
+        if route is not None:
+            if route.intent not in _CACHEABLE_INTENTS:
+                return None
+            args = json.dumps(route.json_args, sort_keys=True)
+            return _CacheSlot(("route", route.intent, args, settings.timezone, day), generation)
+        if session_id is not None and self.checkpointer.get_tuple({"configurable": {"thread_id": session_id}}):
+            return None
+        text = " ".join(user_prompt.lower().split()).rstrip("?.! ")
+        # Similar wording only shares a reply when the prompts ask about the
+        # same window and count ("this morning" never answers "tomorrow afternoon").
+        group = (settings.timezone, day, when_terms(user_prompt, date.fromisoformat(day)))
+        return _CacheSlot(("prompt", text, *group), generation, text, group)
+
+    def _cached(self, slot: _CacheSlot | None) -> str | None:
+        if slot is None:
+            return None
+        return self.cache.get(slot.key, text=slot.text, group=slot.group)
+
+    def _cache_reply(self, slot: _CacheSlot | None, reply: str, calls: list[tuple[str, dict]], results: list) -> None:
+        # Only turns that called read-only tools, all successfully, are cached.
+        if slot is None or not reply:
+            return
+        if any(name not in _READ_ONLY_TOOLS for name, _ in calls):
+            return
+        if any(not (isinstance(result, dict) and result.get("ok")) for result in results):
+            return
+        now = datetime.now(tz=load_settings().tzinfo)
+        try:
+            windows = [_call_window(name, args, now) for name, args in calls]
+        except (KeyError, TypeError, ValueError):
+            return
+        self.cache.put(slot.key, reply, windows, text=slot.text, group=slot.group, generation=slot.generation)
+
+    def _dispatch(self, user_prompt: str, session_id: str | None, turn) -> _Dispatch:
+        """
+        Pre-dispatch shared by every entry point: route the prompt and look up
+        a cached reply. With neither, the model answers the turn.
+        """
+        route = self._route(user_prompt)
+        slot = self._cache_slot(user_prompt, route, session_id)
+        cached = self._cached(slot)
+        if cached is not None:
+            turn.attributes["path"] = "cache"
+        elif route is not None:
+            turn.attributes["path"] = "fast_path"
+        return _Dispatch(slot, route, cached)
+
+    def _answered(
+        self,
+        dispatch: _Dispatch,
+        user_prompt: str,
+        session_id: str | None,
+        reply: str,
+        result: dict | None = None,
+    ) -> tuple[dict, dict] | None:
+        """
+        Post-reply hook for a turn answered without the model: cache a fast-path
+        reply, and return the state update that records the turn in the session
+        (None without one) for the caller to apply with `update_state`/`aupdate_state`.
+        """
+        if dispatch.cached is None:
+            self._cache_reply(dispatch.slot, reply, [(dispatch.route.tool.name, dispatch.route.json_args)], [result])
+        if session_id is None:
+            return None
+        return self._fast_turn(session_id, user_prompt, reply)
+
+    def run(self, user_prompt: str, *, session_id: str | None = None) -> str:
+        with turn_span(session=session_id is not None) as turn:
+            dispatch = self._dispatch(user_prompt, session_id, turn)
+            if dispatch.shortcut:
+                result, reply = None, dispatch.cached
+                if reply is None:
+                    result, reply = self.router.run(dispatch.route)
+                update = self._answered(dispatch, user_prompt, session_id, reply, result)
+                if update is not None:
+                    self.agent.update_state(*update, as_node="model")
+                return reply
+
+            with self._session(session_id) as config:
+                result = self.agent.invoke({"messages": [("user", user_prompt)]}, config)
+            reply = result["messages"][-1].content
+            self._cache_reply(dispatch.slot, reply, *_turn_tools(result["messages"]))
+            return reply
+
+    async def arun(self, user_prompt: str, *, session_id: str | None = None) -> str:
+        with turn_span(session=session_id is not None) as turn:
+            dispatch = self._dispatch(user_prompt, session_id, turn)
+            if dispatch.shortcut:
+                result, reply = None, dispatch.cached
+                if reply is None:
+                    result, reply = await self.router.arun(dispatch.route)
+                update = self._answered(dispatch, user_prompt, session_id, reply, result)
+                if update is not None:
+                    await self.agent.aupdate_state(*update, as_node="model")
+                return reply
+
+            # Tool calls emitted in the same turn run concurrently through the tools' coroutines.
+            with self._session(session_id) as config:
+                result = await self.agent.ainvoke({"messages": [("user", user_prompt)]}, config)
+            reply = result["messages"][-1].content
+            self._cache_reply(dispatch.slot, reply, *_turn_tools(result["messages"]))
+            return reply
+
+    def stream(self, user_prompt: str, *, session_id: str | None = None) -> Iterator[AgentEvent]:
+        """
+        Run one turn, yielding reply tokens and tool start/finish events as they
+        happen, then a `final` event with the complete reply.
+        """
+        with turn_span(session=session_id is not None) as turn:
+            dispatch = self._dispatch(user_prompt, session_id, turn)
+            if dispatch.shortcut:
+                result, reply = None, dispatch.cached
+                if reply is None:
+                    route = dispatch.route
+                    yield AgentEvent("tool_start", tool=route.tool.name, data=route.json_args)
+                    result, reply = self.router.run(route)
+                    yield AgentEvent("tool_end", tool=route.tool.name, data=result)
+                update = self._answered(dispatch, user_prompt, session_id, reply, result)
+                if update is not None:
+                    self.agent.update_state(*update, as_node="model")
+                yield AgentEvent("final", text=reply)
+                return
+
+            translator = AgentEventTranslator()
+            calls, results = [], []
+            with self._session(session_id) as config:
+                parts = self.agent.stream({"messages": [("user", user_prompt)]}, config, stream_mode=STREAM_MODES)
+                for event in translator.translate(parts):
+                    if event.type == "tool_start":
+                        calls.append((event.tool, event.data))
+                    elif event.type == "tool_end":
+                        results.append(event.data)
+                    elif event.type == "final":
+                        self._cache_reply(dispatch.slot, event.text, calls, results)
+                    yield event
+
+    async def astream(self, user_prompt: str, *, session_id: str | None = None) -> AsyncIterator[AgentEvent]:
+        with turn_span(session=session_id is not None) as turn:
+            dispatch = self._dispatch(user_prompt, session_id, turn)
+            if dispatch.shortcut:
+                result, reply = None, dispatch.cached
+                if reply is None:
+                    route = dispatch.route
+                    yield AgentEvent("tool_start", tool=route.tool.name, data=route.json_args)
+                    result, reply = await self.router.arun(route)
+                    yield AgentEvent("tool_end", tool=route.tool.name, data=result)
+                update = self._answered(dispatch, user_prompt, session_id, reply, result)
+                if update is not None:
+                    await self.agent.aupdate_state(*update, as_node="model")
+                yield AgentEvent("final", text=reply)
+                return
+
+            translator = AgentEventTranslator()
+            calls, results = [], []
+            with self._session(session_id) as config:
+                parts = self.agent.astream({"messages": [("user", user_prompt)]}, config, stream_mode=STREAM_MODES)
+                async for mode, chunk in parts:
+                    for event in translator.feed(mode, chunk):
+                        if event.type == "tool_start":
+                            calls.append((event.tool, event.data))
+                        elif event.type == "tool_end":
+                            results.append(event.data)
+                        yield event
+                final = translator.final()
+                self._cache_reply(dispatch.slot, final.text, calls, results)
+                yield final
+
+    def reset_session(self, session_id: str) -> None:
+        """Forget everything said in `session_id`."""
+        self.checkpointer.delete_thread(session_id)
@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable
+
+from langchain_core.tools import BaseTool
+
+from app.config.settings import load_settings
+from app.tools.create_event import check_conflicts_tool
+from app.tools.delete_event import delete_event_tool
+from app.tools.list_events import list_next_events_tool, list_today_events_tool
+
+
+@dataclass(frozen=True)
+class Route:
+    """A prompt the router understood: which tool to call, with what, and how to phrase the result."""
+
+    intent: str
+    tool: BaseTool
+    args: dict
+    reply: Callable[[dict], str]
+
+    @property
+    def json_args(self) -> dict:
+        """`args` as the model would have sent them (datetimes as ISO strings)."""
+        return {key: value.isoformat() if isinstance(value, datetime) else value for key, value in self.args.items()}
+
+
+_MONTHS = {
+    name: number
+    for number, names in enumerate(
+        [("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"), ("may",),
+         ("jun", "june"), ("jul", "july"), ("aug", "august"), ("sep", "sept", "september"),
+         ("oct", "october"), ("nov", "november"), ("dec", "december")],
+        start=1,
+    )
+    for name in names
+}
+_WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+_NUMBERS = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10}
+
+_MONTH = "|".join(sorted(_MONTHS, key=len, reverse=True))
+_DATE = (
+    rf"(?:today|tomorrow|{'|'.join(_WEEKDAYS)}"
+    rf"|(?:{_MONTH})\.?\s+\d{{1,2}}(?:st|nd|rd|th)?(?:,?\s+\d{{4}})?"
+    rf"|\d{{1,2}}(?:st|nd|rd|th)?\s+(?:{_MONTH})\.?(?:,?\s+\d{{4}})?"
+    rf"|\d{{4}}-\d{{2}}-\d{{2}})"
+)
+# A time needs am/pm or a 24h "HH:MM"; a bare "2" is ambiguous and left to the LLM.
+_TIME = r"(?:noon|midnight|\d{1,2}(?::\d{2})?\s*(?:am|pm)|\d{1,2}:\d{2})"
+
+_POLITE = r"(?:(?:please|can you|could you)\s+)?"
+_SHOW = rf"{_POLITE}(?:list|show|show me|give me|get|what are|what's|whats|what is)"
+_EVENTS = r"(?:events?|meetings?|appointments?|schedule|calendar|agenda)"
+
+_PATTERNS: list[tuple[str, re.Pattern]] = [
+    (
+        "list_today",
+        re.compile(
+            rf"^(?:{_SHOW}\s+(?:all\s+)?(?:of\s+)?(?:my\s+)?(?:today'?s\s+{_EVENTS}|{_EVENTS}\s+(?:for\s+|on\s+)?today)"
+            rf"|what(?:'s|s| is)?\s+on\s+(?:my\s+)?(?:calendar\s+|schedule\s+|agenda\s+)?today)$",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "list_next",
+        re.compile(
+            rf"^{_SHOW}\s+(?:my\s+)?(?:the\s+)?(?:next|upcoming)\s+(?:(?P<n>\d+|{'|'.join(_NUMBERS)})\s+)?"
+            rf"(?:upcoming\s+)?{_EVENTS}$",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "delete_event",
+        re.compile(
+            rf"^{_POLITE}(?:delete|remove|cancel)\s+(?:the\s+)?event\s+(?:with\s+)?(?:the\s+)?id\s+"
+            r"(?P<event_id>[a-z0-9_@.\-]+)$",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "check_conflicts",
+        re.compile(
+            rf"^(?:am i|are we)\s+(?:free|available|busy)\s+(?:on\s+)?(?P<date>{_DATE})\s+"
+            rf"(?:from|between)\s+(?P<start>{_TIME})\s+(?:to|and|until|-)\s+(?P<end>{_TIME})$",
+            re.IGNORECASE,
+        ),
+    ),
+]
+
+
+def _normalize(prompt: str) -> str:
+    # Case is kept (event ids are case-sensitive); the patterns ignore it.
+    text = prompt.strip().replace("’", "'")
+    text = re.sub(r"\s+", " ", text)
+    return text.rstrip("?.! ")
+
+
+def parse_date(text: str, today: date) -> date | None:
+    """
+    Parse the `_DATE` forms. Weekdays and dates without a year mean the next
+    such day (today included); "next monday" is left to the LLM.
+    """
+    text = text.strip().rstrip(".")
+    if text == "today":
+        return today
+    if text == "tomorrow":
+        return today + timedelta(days=1)
+    if text in _WEEKDAYS:
+        return today + timedelta(days=(_WEEKDAYS.index(text) - today.weekday()) % 7)
+    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", text):
+        try:
+            return date.fromisoformat(text)
+        except ValueError:
+            return None
+
+    match = re.fullmatch(
+        rf"(?:(?P<m1>{_MONTH})\.?\s+(?P<d1>\d{{1,2}})|(?P<d2>\d{{1,2}})(?:st|nd|rd|th)?\s+(?P<m2>{_MONTH})\.?)"
+        r"(?:st|nd|rd|th)?(?:,?\s+(?P<year>\d{4}))?",
+        text,
+    )
+    if match is None:
+        return None
+    month = _MONTHS[match["m1"] or match["m2"]]
+    day = int(match["d1"] or match["d2"])
+    try:
+        if match["year"]:
+            return date(int(match["year"]), month, day)
+        parsed = date(today.year, month, day)
+        return parsed if parsed >= today else date(today.year + 1, month, day)
+    except ValueError:
+        return None
+
+
+def parse_time(text: str) -> tuple[int, int] | None:
+    text = text.replace(" ", "")
+    if text == "noon":
+        return 12, 0
+    if text == "midnight":
+        return 0, 0
+    match = re.fullmatch(r"(\d{1,2})(?::(\d{2}))?(am|pm)?", text)
+    if match is None:
+        return None
+    hour, minute, meridiem = int(match[1]), int(match[2] or 0), match[3]
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridiem == "pm" else 0)
+    if hour > 23 or minute > 59:
+        return None
+    return hour, minute
+
+
+# Words that change which window (or question) a prompt is about, beyond its dates and times.
+_SPANS = r"yesterday|tonight|morning|afternoon|evening|night|lunch|weekend|week|month|year|this|next|last|now"
+_ASKS = {"free": "availability", "busy": "availability", "available": "availability", "conflict": "availability",
+         "conflicts": "availability", "slot": "slots", "slots": "slots"}
+
+
+def when_terms(prompt: str, today: date) -> tuple[str, ...]:
+    """
+    What a free-form prompt says about which window and how much: dates
+    resolved against `today`, times, spans ("afternoon", "next week"),
+    counts, and whether it asks for availability. Prompts that differ here
+    ask different questions, however alike they read.
+    """
+    text = _normalize(prompt).lower()
+    terms = set()
+    for match in re.finditer(rf"\b{_DATE}\b", text):
+        day = parse_date(match[0], today)
+        terms.add(day.isoformat() if day else match[0])
+    text = re.sub(rf"\b{_DATE}\b", " ", text)
+    for match in re.finditer(rf"\b{_TIME}\b", text):
+        hour_minute = parse_time(match[0])
+        terms.add(f"{hour_minute[0]:02d}:{hour_minute[1]:02d}" if hour_minute else match[0])
+    text = re.sub(rf"\b{_TIME}\b", " ", text)
+    for word in re.findall(rf"\b(?:{_SPANS}|{'|'.join(_ASKS)}|\d+|{'|'.join(_NUMBERS)})\b", text):
+        terms.add(_ASKS.get(word) or str(_NUMBERS.get(word, word)))
+    return tuple(sorted(terms))
+
+
+def _when(start: str | None, end: str | None, *, with_day: bool) -> str:
+    if not start:
+        return "time unknown"
+    if "T" not in start:
+        return f"{date.fromisoformat(start):%a %b %d}, all day" if with_day else "all day"
+    begin = datetime.fromisoformat(start)
+    text = f"{begin:%a %b %d}, {begin:%H:%M}" if with_day else f"{begin:%H:%M}"
+    if end and "T" in end:
+        text += f"–{datetime.fromisoformat(end):%H:%M}"
+    return text
+
+
+def _failed(what: str, result: dict) -> str:
+    return f"Sorry, I couldn't {what}: {result['error']['message']}"
+
+
+def _events_reply(heading: str, empty: str, *, with_day: bool) -> Callable[[dict], str]:
+    def reply(result: dict) -> str:
+        if not result["ok"]:
+            return _failed("load your events", result)
+        events = result["data"]["events"]
+        if not events:
+            return empty
+        lines = [
+            f"- {_when(e['start'], e['end'], with_day=with_day)} {e['summary']} (id: {e['eventId']})"
+            for e in events
+        ]
+        return "\n".join([heading, *lines])
+
+    return reply
+
+
+def _deleted_reply(event_id: str) -> Callable[[dict], str]:
+    def reply(result: dict) -> str:
+        if not result["ok"]:
+            return _failed(f"delete event {event_id}", result)
+        return f"Deleted \"{result['data']['summary']}\" (id: {event_id})."
+
+    return reply
+
+
+def _conflicts_reply(window: str) -> Callable[[dict], str]:
+    def reply(result: dict) -> str:
+        if not result["ok"]:
+            return _failed("check your calendar", result)
+        conflicts = result["data"]["conflicts"]
+        if not conflicts:
+            return f"You're free on {window}."
+        lines = [f"- {_when(c['start'], c['end'], with_day=False)} {c['summary']}" for c in conflicts]
+        noun = "conflict" if len(conflicts) == 1 else "conflicts"
+        return "\n".join([f"You have {len(conflicts)} {noun} on {window}:", *lines])
+
+    return reply
+
+
+class FastPathRouter:
+    """
+    Answers unambiguous commands (the README examples and close variants)
+    by calling the tool directly, without an LLM round trip.
+
+    Matching is anchored regexes over the whole prompt plus a small date and
+    time parser; anything the patterns don't fully cover, or that parses to
+    something questionable (a bare "at 2", an end before the start), goes to
+    the agent. Counters report how often the fast path is taken.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits: dict[str, int] = {}
+        self.misses = 0
+        self.fast_path_seconds = 0.0
+
+    def match(self, prompt: str, *, now: datetime | None = None) -> Route | None:
+        text = _normalize(prompt)
+        route = None
+        for intent, pattern in _PATTERNS:
+            found = pattern.match(text)
+            if found:
+                route = self._route(intent, found, now or datetime.now(tz=load_settings().tzinfo))
+                break
+        with self._lock:
+            if route is None:
+                self.misses += 1
+            else:
+                self.hits[route.intent] = self.hits.get(route.intent, 0) + 1
+        return route
+
+    def _route(self, intent: str, found: re.Match, now: datetime) -> Route | None:
+        if intent == "list_today":
+            return Route(
+                intent,
+                list_today_events_tool,
+                {},
+                _events_reply("Today's events:", "You have no events today.", with_day=False),
+            )
+        if intent == "list_next":
+            raw = found["n"] and found["n"].lower()
+            n = 5 if raw is None else _NUMBERS.get(raw) or int(raw)
+            if not 1 <= n <= 50:
+                return None
+            noun = "event" if n == 1 else f"{n} events"
+            return Route(
+                intent,
+                list_next_events_tool,
+                {"n": n},
+                _events_reply(f"Your next {noun}:", "You have no upcoming events.", with_day=True),
+            )
+        if intent == "delete_event":
+            event_id = found["event_id"]
+            return Route(intent, delete_event_tool, {"event_id": event_id}, _deleted_reply(event_id))
+        if intent == "check_conflicts":
+            day = parse_date(found["date"].lower(), now.date())
+            start, end = parse_time(found["start"].lower()), parse_time(found["end"].lower())
+            if day is None or start is None or end is None or end <= start:
+                return None
+            begin = datetime.combine(day, datetime.min.time()).replace(hour=start[0], minute=start[1])
+            finish = begin.replace(hour=end[0], minute=end[1])
+            window = f"{begin:%a %b %d}, {begin:%H:%M}–{finish:%H:%M}"
+            return Route(intent, check_conflicts_tool, {"start": begin, "end": finish}, _conflicts_reply(window))
+        return None
+
+    def run(self, route: Route) -> tuple[dict, str]:
+        """Call the route's tool; returns (tool result, reply text)."""
+        started = time.perf_counter()
+        result = route.tool.invoke(route.args)
+        self._timed(started)
+        return result, route.reply(result)
+
+    async def arun(self, route: Route) -> tuple[dict, str]:
+        started = time.perf_counter()
+        result = await route.tool.ainvoke(route.args)
+        self._timed(started)
+        return result, route.reply(result)
+
+    def _timed(self, started: float) -> None:
+        with self._lock:
+            self.fast_path_seconds += time.perf_counter() - started
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = sum(self.hits.values())
+            total = hits + self.misses
+            return {
+                "prompts": total,
+                "fast_path": hits,
+                "llm": self.misses,
+                "hit_rate": hits / total if total else 0.0,
+                "by_intent": dict(self.hits),
+                "fast_path_seconds": round(self.fast_path_seconds, 4),
+            }
+
+
+_router = FastPathRouter()
+
+
+def get_router() -> FastPathRouter:
+    """The process-wide router, so hit counters cover every agent instance."""
+    return _router
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+from langchain_core.messages import AIMessage, ToolMessage
+
+# LangGraph stream modes consumed by `AgentEventTranslator`.
+STREAM_MODES = ["messages", "updates"]
+
+# Name of the agent graph's LLM node; other nodes (e.g. the summarizer
+# middleware) also call a model, but their tokens are not part of the reply.
+_MODEL_NODE = "model"
+_TOOLS_NODE = "tools"
+
+
+@dataclass(frozen=True)
+class AgentEvent:
+    """
+    One step of a streamed agent turn.
+
+    - `token`: a piece of the reply (`text`).
+    - `tool_start`: the model called `tool` with arguments `data`.
+    - `tool_end`: `tool` returned `data` (the tool's response envelope).
+    - `final`: the turn is over; `text` is the complete reply.
+    """
+
+    type: str
+    text: str = ""
+    tool: str | None = None
+    data: Any = None
+
+
+def _text(content) -> str:
+    # Providers send either a string or a list of content blocks.
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content if isinstance(block, dict))
+
+
+def tool_result(message: ToolMessage):
+    # Budgeted tools send the model an encoded result and keep the original as the artifact.
+    if message.artifact is not None:
+        return message.artifact
+    try:
+        return json.loads(message.content)
+    except (TypeError, ValueError):
+        return message.content
+
+
+class AgentEventTranslator:
+    """Turns LangGraph `(mode, chunk)` stream parts into `AgentEvent`s."""
+
+    def __init__(self):
+        self.reply = ""
+
+    def feed(self, mode: str, chunk) -> Iterator[AgentEvent]:
+        if mode == "messages":
+            message, metadata = chunk
+            if metadata.get("langgraph_node") == _MODEL_NODE and not isinstance(message, ToolMessage):
+                text = _text(message.content)
+                if text:
+                    yield AgentEvent("token", text=text)
+            return
+
+        for node, update in chunk.items():
+            for message in (update or {}).get("messages", []):
+                if node == _MODEL_NODE and isinstance(message, AIMessage):
+                    for call in message.tool_calls:
+                        yield AgentEvent("tool_start", tool=call["name"], data=call["args"])
+                    if not message.tool_calls:
+                        self.reply = _text(message.content)
+                elif node == _TOOLS_NODE and isinstance(message, ToolMessage):
+                    yield AgentEvent("tool_end", tool=message.name, data=tool_result(message))
+
+    def translate(self, parts: Iterable[tuple[str, Any]]) -> Iterator[AgentEvent]:
+        for mode, chunk in parts:
+            yield from self.feed(mode, chunk)
+        yield self.final()
+
+    def final(self) -> AgentEvent:
+        return AgentEvent("final", text=self.reply)
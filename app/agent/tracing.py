@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+from langchain.agents.middleware import AgentMiddleware
+from langchain_core.messages import AIMessage
+
+from app.services.telemetry import TOKEN_BUCKETS, Span, current_span, get_metrics, span
+
+_tokens_lock = threading.Lock()
+
+
+@contextmanager
+def turn_span(**attributes) -> Iterator[Span]:
+    """
+    The root span of one agent turn. Set `path` on it to "cache" or
+    "fast_path" when the turn skips the model; `turn_seconds` is labelled by it.
+    """
+    with span("agent.turn", path="llm", **attributes) as turn:
+        yield turn
+    if turn.duration is None:
+        return
+    metrics = get_metrics()
+    metrics.observe("turn_seconds", turn.duration, path=turn.attributes["path"])
+    if turn.attributes["path"] == "llm":
+        for kind in ("input", "output"):
+            metrics.observe("turn_llm_tokens", turn.attributes.get(f"{kind}_tokens", 0), buckets=TOKEN_BUCKETS, kind=kind)
+
+
+def _usage(response) -> dict:
+    messages = response.result if hasattr(response, "result") else [response]
+    usage = {"input_tokens": 0, "output_tokens": 0}
+    for message in messages:
+        if isinstance(message, AIMessage) and message.usage_metadata:
+            for key in usage:
+                usage[key] += message.usage_metadata.get(key, 0)
+    return usage
+
+
+class TelemetryMiddleware(AgentMiddleware):
+    """Times every model call as an `llm.call` span and adds its token usage to the turn."""
+
+    def __init__(self, model: str):
+        super().__init__()
+        self.model = model
+
+    def _record(self, turn: Span | None, call: Span, response) -> None:
+        usage = _usage(response)
+        call.attributes.update(usage)
+        metrics = get_metrics()
+        for key, tokens in usage.items():
+            metrics.increment("llm_tokens_total", tokens, model=self.model, kind=key.removesuffix("_tokens"))
+        if turn is not None:
+            with _tokens_lock:
+                for key, tokens in usage.items():
+                    turn.attributes[key] = turn.attributes.get(key, 0) + tokens
+
+    def wrap_model_call(self, request, handler):
+        turn = current_span()
+        with span("llm.call", metric="llm_seconds", model=self.model) as call:
+            response = handler(request)
+            self._record(turn, call, response)
+            return response
+
+    async def awrap_model_call(self, request, handler):
+        turn = current_span()
+        with span("llm.call", metric="llm_seconds", model=self.model) as call:
+            response = await handler(request)
+            self._record(turn, call, response)
+            return response
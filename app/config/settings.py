@@ -1,25 +1,244 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from datetime import time
+from functools import cached_property
 from pathlib import Path
+from typing import Iterator
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import os
+import threading
 from dotenv import load_dotenv
 load_dotenv()
 
+_TRUE_VALUES = {"1", "true", "yes"}
+
+
 @dataclass(frozen=True)
 class Settings:
     # OpenAI
-    openai_api: str = os.getenv("OPENAI_API_KEY")
-    openai_model: str = os.getenv("OPENAI_MODEL", "gpt-5-mini")
+    openai_api: str | None = None
+    openai_model: str = "gpt-5-mini"
     
     # Google auth files
-    google_credentials_file: Path = Path(os.getenv("GOOGLE_CREDENTIALS_FILE", "secrets/credentials.json"))
-    google_token_file: Path = Path(os.getenv("GOOGLE_TOKEN_FILE", "secrets/token.json"))
+    google_credentials_file: Path = Path("secrets/credentials.json")
+    google_token_file: Path = Path("secrets/token.json")
     
     # Calendar defaults
-    default_calendar_id: str = os.getenv("GOOGLE_CALENDAR_ID", "primary")
-    timezone: str = os.getenv("CALENDAR_TIMEZONE", "Europe/Athens")
+    default_calendar_id: str = "primary"
+    timezone: str = "Europe/Athens"
+    
+    # Other calendars (team, shared resources) read alongside the default one
+    # for listings and conflict checks; events are still created on the default.
+    calendar_ids: tuple[str, ...] = ()
+    
+    # Working hours used when searching for free slots (HH:MM, local time)
+    working_hours_start: str = "09:00"
+    working_hours_end: str = "18:00"
+    
+    # Client-side quota: request rate and share of requests that may be retries
+    calendar_max_qps: float = 10.0
+    calendar_retry_budget_ratio: float = 0.1
+    
+    # Local event cache
+    event_cache_enabled: bool = True
+    event_cache_max_staleness_seconds: float = 60.0
+    
+    # Multi-user mode: per-user token store (directory, or a .db/.sqlite file)
+    google_oauth_interactive: bool = True
+    credential_store: Path | None = None
+    credential_pool_size: int = 128
+    token_refresh_margin_seconds: float = 600.0
     
+    # Conversation memory: "memory" or a SQLite file; older turns are summarized past the cap
+    conversation_store: str = "memory"
+    conversation_max_tokens: int = 6000
+    conversation_keep_tokens: int = 2000
+    
+    # Answer simple commands without the LLM (app/agent/router.py)
+    fast_path_enabled: bool = True
+    
+    # Reuse replies to repeated read-only questions (app/services/response_cache.py)
+    response_cache_enabled: bool = True
+    response_cache_ttl_seconds: float = 120.0
+    response_cache_max_entries: int = 512
+    response_cache_embedding_model: str | None = None
+    response_cache_similarity: float = 0.92
+    
+    # What the tools cost in the prompt (app/agent/budget.py)
+    tool_verbose: bool = False
+    tool_result_max_events: int = 20
+    
+    # Reuse calendar reads across the tool calls of a "turn" or "session" ("off" to disable)
+    tool_memo: str = "turn"
+    
+    # Metrics and spans (app/services/telemetry.py); TRACE_LOG is a file, or "-" for stderr
+    telemetry_enabled: bool = True
+    trace_log: str | None = None
+    
+    # HTTP server (app/server.py)
+    server_workers: int = 4
+    server_max_concurrency: int = 32
+    server_request_timeout_seconds: float = 60.0
+    server_shutdown_grace_seconds: float = 30.0
+    server_max_body_bytes: int = 1_000_000
+
+    @classmethod
+    def from_env(cls) -> Settings:
+        """Read and validate settings from the environment (and `.env`)."""
+        settings = cls(
+            openai_api=os.getenv("OPENAI_API_KEY"),
+            openai_model=os.getenv("OPENAI_MODEL", "gpt-5-mini"),
+            google_credentials_file=Path(os.getenv("GOOGLE_CREDENTIALS_FILE", "secrets/credentials.json")),
+            google_token_file=Path(os.getenv("GOOGLE_TOKEN_FILE", "secrets/token.json")),
+            default_calendar_id=os.getenv("GOOGLE_CALENDAR_ID", "primary"),
+            timezone=os.getenv("CALENDAR_TIMEZONE", "Europe/Athens"),
+            calendar_ids=tuple(filter(None, (part.strip() for part in os.getenv("CALENDAR_IDS", "").split(",")))),
+            working_hours_start=os.getenv("WORKING_HOURS_START", "09:00"),
+            working_hours_end=os.getenv("WORKING_HOURS_END", "18:00"),
+            calendar_max_qps=float(os.getenv("CALENDAR_MAX_QPS", "10")),
+            calendar_retry_budget_ratio=float(os.getenv("CALENDAR_RETRY_BUDGET_RATIO", "0.1")),
+            event_cache_enabled=os.getenv("EVENT_CACHE_ENABLED", "true").lower() in _TRUE_VALUES,
+            event_cache_max_staleness_seconds=float(os.getenv("EVENT_CACHE_MAX_STALENESS_SECONDS", "60")),
+            google_oauth_interactive=os.getenv("GOOGLE_OAUTH_INTERACTIVE", "true").lower() in _TRUE_VALUES,
+            credential_store=Path(os.environ["CREDENTIAL_STORE"]) if os.getenv("CREDENTIAL_STORE") else None,
+            credential_pool_size=int(os.getenv("CREDENTIAL_POOL_SIZE", "128")),
+            token_refresh_margin_seconds=float(os.getenv("TOKEN_REFRESH_MARGIN_SECONDS", "600")),
+            conversation_store=os.getenv("CONVERSATION_STORE", "memory"),
+            conversation_max_tokens=int(os.getenv("CONVERSATION_MAX_TOKENS", "6000")),
+            conversation_keep_tokens=int(os.getenv("CONVERSATION_KEEP_TOKENS", "2000")),
+            fast_path_enabled=os.getenv("FAST_PATH_ENABLED", "true").lower() in _TRUE_VALUES,
+            response_cache_enabled=os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() in _TRUE_VALUES,
+            response_cache_ttl_seconds=float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "120")),
+            response_cache_max_entries=int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512")),
+            response_cache_embedding_model=os.getenv("RESPONSE_CACHE_EMBEDDING_MODEL") or None,
+            response_cache_similarity=float(os.getenv("RESPONSE_CACHE_SIMILARITY", "0.92")),
+            tool_verbose=os.getenv("TOOL_VERBOSE", "false").lower() in _TRUE_VALUES,
+            tool_result_max_events=int(os.getenv("TOOL_RESULT_MAX_EVENTS", "20")),
+            tool_memo=os.getenv("TOOL_MEMO", "turn").lower(),
+            telemetry_enabled=os.getenv("TELEMETRY_ENABLED", "true").lower() in _TRUE_VALUES,
+            trace_log=os.getenv("TRACE_LOG") or None,
+            server_workers=int(os.getenv("SERVER_WORKERS", "4")),
+            server_max_concurrency=int(os.getenv("SERVER_MAX_CONCURRENCY", "32")),
+            server_request_timeout_seconds=float(os.getenv("SERVER_REQUEST_TIMEOUT_SECONDS", "60")),
+            server_shutdown_grace_seconds=float(os.getenv("SERVER_SHUTDOWN_GRACE_SECONDS", "30")),
+            server_max_body_bytes=int(os.getenv("SERVER_MAX_BODY_BYTES", "1000000")),
+        )
+        settings.validate()
+        return settings
+
+    @cached_property
+    def tzinfo(self) -> ZoneInfo:
+        return ZoneInfo(self.timezone)
+
+    @property
+    def read_calendar_ids(self) -> tuple[str, ...]:
+        """The calendars listings and conflict checks read: the default one first."""
+        return tuple(dict.fromkeys((self.default_calendar_id, *self.calendar_ids)))
+
+    def validate(self) -> None:
+        """Fail fast on values that would otherwise break the first tool call."""
+        try:
+            self.tzinfo
+        except (ZoneInfoNotFoundError, ValueError) as exc:
+            raise ValueError(f"Unknown time zone {self.timezone!r} (CALENDAR_TIMEZONE).") from exc
+        try:
+            start = time.fromisoformat(self.working_hours_start)
+            end = time.fromisoformat(self.working_hours_end)
+        except ValueError as exc:
+            raise ValueError("WORKING_HOURS_START/END must be HH:MM.") from exc
+        if start >= end:
+            raise ValueError("WORKING_HOURS_START must be before WORKING_HOURS_END.")
+        if self.calendar_max_qps <= 0:
+            raise ValueError("CALENDAR_MAX_QPS must be positive.")
+        if self.credential_pool_size < 1:
+            raise ValueError("CREDENTIAL_POOL_SIZE must be at least 1.")
+        if not 0 < self.conversation_keep_tokens < self.conversation_max_tokens:
+            raise ValueError("CONVERSATION_KEEP_TOKENS must be positive and below CONVERSATION_MAX_TOKENS.")
+        if self.response_cache_ttl_seconds <= 0 or self.response_cache_max_entries < 1:
+            raise ValueError("RESPONSE_CACHE_TTL_SECONDS must be positive and RESPONSE_CACHE_MAX_ENTRIES at least 1.")
+        if not 0 < self.response_cache_similarity <= 1:
+            raise ValueError("RESPONSE_CACHE_SIMILARITY must be in (0, 1].")
+        if self.tool_result_max_events < 1:
+            raise ValueError("TOOL_RESULT_MAX_EVENTS must be at least 1.")
+        if self.tool_memo not in ("turn", "session", "off"):
+            raise ValueError("TOOL_MEMO must be turn, session or off.")
+        if self.server_workers < 1 or self.server_max_concurrency < 1:
+            raise ValueError("SERVER_WORKERS and SERVER_MAX_CONCURRENCY must be at least 1.")
+        if self.server_request_timeout_seconds <= 0:
+            raise ValueError("SERVER_REQUEST_TIMEOUT_SECONDS must be positive.")
+        if self.server_max_body_bytes < 1:
+            raise ValueError("SERVER_MAX_BODY_BYTES must be at least 1.")
+
+    def with_overrides(self, *, calendar_id: str | None = None, timezone: str | None = None) -> Settings:
+        changes = {}
+        if calendar_id is not None:
+            changes["default_calendar_id"] = calendar_id
+        if timezone is not None:
+            changes["timezone"] = timezone
+        if not changes:
+            return self
+        settings = replace(self, **changes)
+        settings.validate()
+        return settings
+
+
+_lock = threading.Lock()
+_settings: Settings | None = None
+_override: ContextVar[Settings | None] = ContextVar("settings_override", default=None)
+# Process-wide values that win over the environment (see `force_settings`).
+_forced: dict = {}
+
+
 def load_settings() -> Settings:
-    return Settings()
\ No newline at end of file
+    """
+    Return the process settings, read from the environment once and cached.
+    Inside `settings_override(...)` the overridden copy is returned instead.
+    """
+    override = _override.get()
+    if override is not None:
+        return override
+    settings = _settings
+    if settings is None:
+        settings = reload_settings()
+    return settings
+
+
+def reload_settings() -> Settings:
+    """Re-read the environment (and `.env`) and replace the cached settings."""
+    global _settings
+    load_dotenv(override=False)
+    settings = Settings.from_env()
+    with _lock:
+        if _forced:
+            settings = replace(settings, **_forced)
+        _settings = settings
+    return settings
+
+
+def force_settings(**changes) -> Settings:
+    """
+    Pin settings for the whole process, whatever the environment says; they
+    also survive `reload_settings()` and apply under `settings_override`.
+    E.g. the server turns the browser OAuth flow off this way.
+    """
+    with _lock:
+        _forced.update(changes)
+    return reload_settings()
+
+
+@contextmanager
+def settings_override(*, calendar_id: str | None = None, timezone: str | None = None) -> Iterator[Settings]:
+    """
+    Per-request overrides for multi-tenant callers. Applies to everything that
+    calls `load_settings()` in the current context (thread or asyncio task).
+    """
+    settings = load_settings().with_overrides(calendar_id=calendar_id, timezone=timezone)
+    token = _override.set(settings)
+    try:
+        yield settings
+    finally:
+        _override.reset(token)
@@ -1,7 +1,81 @@
-from app.agent.calendar_agent import CalendarAgent
+import logging
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, TextIO
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+
+def build_agent():
+    """
+    Build a `CalendarAgent` and warm the shared Google client.
+
+    Imports happen here so langchain, the OpenAI client and the Google client
+    stack load in the background while the user types their first prompt.
+    """
+    from app.agent.calendar_agent import CalendarAgent
+    from app.config.settings import load_settings
+    from app.services.auth.google_oauth import CredentialsUnavailableError
+    from app.services.client_provider import get_calendar_client
 
-def main():
     agent = CalendarAgent()
+    # Only warm the Google client when a token exists; otherwise the first
+    # tool call runs the interactive OAuth flow in the foreground as before.
+    if load_settings().google_token_file.exists():
+        try:
+            get_calendar_client()
+        except (CredentialsUnavailableError, OSError):
+            # The first tool call builds the client again and reports the error.
+            logger.warning("Could not warm the Google Calendar client", exc_info=True)
+    return agent
+
+
+def _start_agent(eager: bool) -> Future:
+    if eager:
+        future = Future()
+        future.set_result(build_agent())
+        return future
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-warmup")
+    future = executor.submit(build_agent)
+    executor.shutdown(wait=False)
+    return future
+
+
+def render(events: Iterable, out: TextIO = sys.stdout) -> None:
+    """
+    Print a streamed turn as it happens: reply tokens inline, one status line
+    per tool call, and the full reply if the model did not stream tokens.
+    """
+    mid_line = False
+    streamed = False
+    for event in events:
+        if event.type == "token":
+            out.write(event.text)
+            mid_line = streamed = True
+        elif event.type in ("tool_start", "tool_end"):
+            if mid_line:
+                out.write("\n")
+                mid_line = False
+            if event.type == "tool_start":
+                args = ", ".join(f"{key}={value!r}" for key, value in (event.data or {}).items())
+                out.write(f"  [{event.tool}({args})]\n")
+            else:
+                error = (event.data or {}).get("error") if isinstance(event.data, dict) else None
+                status = f"failed: {error.get('message')}" if error else "done"
+                out.write(f"  [{event.tool} {status}]\n")
+        elif event.type == "final":
+            if not streamed:
+                out.write(event.text)
+            out.write("\n")
+        out.flush()
+
+
+def main(eager: bool = False):
+    agent_future = _start_agent(eager)
+    # One conversation per CLI run, so follow-ups ("book anyway") have context.
+    session_id = uuid4().hex
     
     while True:
         try:
@@ -13,9 +87,8 @@ def main():
         if prompt == "exit":
             break
         
-        result = agent.run(prompt)
-        print(result)
+        render(agent_future.result().stream(prompt, session_id=session_id))
     
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,417 @@
+"""
+HTTP/JSON entry point: an ASGI app serving the calendar agent to many users.
+
+    python -m app.server --port 8000       # built-in asyncio HTTP server
+    uvicorn app.server:app                 # or any ASGI server
+
+Endpoints (all responses use the tools' {"ok", "data", "error"} envelope):
+
+    GET  /health
+    GET  /metrics          Prometheus text format (`?format=json` for JSON)
+    POST /chat            {"message": "...", "session_id": "..."}
+    POST /tools/<name>    {<tool arguments>}
+
+Chat turns sharing a `session_id` continue one conversation; without one a
+turn has no memory. Optional headers scope a request: `X-User-Id`
+(multi-user mode, see `CREDENTIAL_STORE`), `X-Calendar-Id` and `X-Timezone`.
+
+`X-User-Id` is trusted as sent: the server does no authentication of its own,
+so it must sit behind a proxy that authenticates callers and sets the header.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import signal
+from contextlib import ExitStack, asynccontextmanager
+from functools import partial
+from http import HTTPStatus
+from typing import AsyncIterator, Callable
+from urllib.parse import unquote
+
+from app.agent.budget import get_prompt_budget
+from app.agent.router import get_router
+from app.config.settings import force_settings, settings_override
+from app.services.client_provider import acting_as
+from app.services.response_cache import get_response_cache
+from app.services.telemetry import get_metrics, prometheus_text
+from app.tools.response import err, ok
+
+logger = logging.getLogger(__name__)
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str, code: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.code = code
+
+
+class AgentPool:
+    """
+    A fixed set of warm agents, each serving one request at a time.
+
+    Agents are built once at startup (off the event loop); requests borrow one
+    and give it back, so no request pays agent or Google client construction.
+    """
+
+    def __init__(self, factory: Callable[[], object], size: int):
+        self._factory = factory
+        self.size = size
+        self._idle: asyncio.Queue = asyncio.Queue()
+
+    @property
+    def idle(self) -> int:
+        return self._idle.qsize()
+
+    async def start(self) -> None:
+        agents = await asyncio.gather(*(asyncio.to_thread(self._factory) for _ in range(self.size)))
+        for agent in agents:
+            self._idle.put_nowait(agent)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[object]:
+        agent = await self._idle.get()
+        try:
+            yield agent
+        finally:
+            self._idle.put_nowait(agent)
+
+
+class CalendarServer:
+    """
+    ASGI application. At most `max_concurrency` requests run at once (more
+    are rejected with 503 rather than queued without bound), chat requests
+    share `workers` warm agents, and every request is cut off after
+    `request_timeout` seconds. On shutdown new requests get 503 while
+    in-flight ones get up to `shutdown_grace` seconds to finish.
+    """
+
+    def __init__(
+        self,
+        *,
+        agent_factory: Callable[[], object] | None = None,
+        tools: list | None = None,
+        workers: int | None = None,
+        max_concurrency: int | None = None,
+        request_timeout: float | None = None,
+        shutdown_grace: float | None = None,
+        max_body_bytes: int | None = None,
+    ):
+        self._agent_factory = agent_factory
+        self._tools = tools
+        self._workers = workers
+        self._max_concurrency = max_concurrency
+        self._request_timeout = request_timeout
+        self._shutdown_grace = shutdown_grace
+        self.max_body_bytes = max_body_bytes
+
+        self._pool: AgentPool | None = None
+        self._started: asyncio.Lock | None = None
+        self._inflight = 0
+        self._drained: asyncio.Event | None = None
+        self._closing = False
+
+    async def startup(self) -> None:
+        """Build the agent pool; safe to call more than once."""
+        if self._started is None:
+            self._started = asyncio.Lock()
+        async with self._started:
+            if self._pool is not None:
+                return
+            # A server has nobody at the keyboard: missing tokens must fail, not
+            # open a browser, however the app is run (`main()`, uvicorn, ...).
+            settings = force_settings(google_oauth_interactive=False)
+            if self._agent_factory is None:
+                from app.main import build_agent
+
+                self._agent_factory = build_agent
+            if self._tools is None:
+                from app.agent.calendar_agent import TOOLS
+
+                self._tools = TOOLS
+            self._workers = self._workers or settings.server_workers
+            self._max_concurrency = self._max_concurrency or settings.server_max_concurrency
+            self._request_timeout = self._request_timeout or settings.server_request_timeout_seconds
+            if self._shutdown_grace is None:
+                self._shutdown_grace = settings.server_shutdown_grace_seconds
+            self.max_body_bytes = self.max_body_bytes or settings.server_max_body_bytes
+            self._drained = asyncio.Event()
+            self._drained.set()
+
+            pool = AgentPool(self._agent_factory, self._workers)
+            await pool.start()
+            self._pool = pool
+
+    async def shutdown(self) -> None:
+        """Stop accepting requests and wait (up to the grace period) for in-flight ones."""
+        self._closing = True
+        if self._drained is not None:
+            try:
+                await asyncio.wait_for(self._drained.wait(), self._shutdown_grace)
+            except asyncio.TimeoutError:
+                pass
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        try:
+            status, body = await self._handle(scope, receive)
+        except _HTTPError as exc:
+            status, body = exc.status, err(exc.message, status=exc.status, code=exc.code)
+        except Exception:
+            # An agent or model failure must still get the client a response.
+            logger.exception("Unhandled error serving %s %s", scope.get("method"), scope.get("path"))
+            status, body = 500, err("Internal server error.", status=500, code="internal_error")
+
+        if isinstance(body, str):
+            payload, content_type = body.encode("utf-8"), b"text/plain; version=0.0.4; charset=utf-8"
+        else:
+            payload, content_type = json.dumps(body, default=str).encode("utf-8"), b"application/json"
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", content_type),
+                    (b"content-length", str(len(payload)).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.startup()
+                except Exception as exc:
+                    await send({"type": "lifespan.startup.failed", "message": str(exc)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _handle(self, scope, receive) -> tuple[int, dict | str]:
+        if self._closing:
+            raise _HTTPError(503, "Server is shutting down.", "shutting_down")
+        await self.startup()
+
+        method, path = scope["method"], scope["path"]
+        if path == "/health":
+            if method != "GET":
+                raise _HTTPError(405, "Use GET.", "method_not_allowed")
+            return 200, ok(
+                {
+                    "workers": self._pool.size,
+                    "idle": self._pool.idle,
+                    "inflight": self._inflight,
+                    "fast_path": get_router().stats(),
+                    "response_cache": get_response_cache().stats(),
+                    "prompt_budget": get_prompt_budget().stats(),
+                }
+            )
+        if path == "/metrics":
+            if method != "GET":
+                raise _HTTPError(405, "Use GET.", "method_not_allowed")
+            if "format=json" in scope.get("query_string", b"").decode("latin-1"):
+                return 200, ok(get_metrics().snapshot())
+            return 200, prometheus_text(get_metrics())
+        if path == "/chat" or path.startswith("/tools/"):
+            if method != "POST":
+                raise _HTTPError(405, "Use POST.", "method_not_allowed")
+        else:
+            raise _HTTPError(404, f"No route for {path}.", "not_found")
+
+        if self._inflight >= self._max_concurrency:
+            raise _HTTPError(503, "Too many concurrent requests; retry shortly.", "overloaded")
+        self._inflight += 1
+        self._drained.clear()
+        try:
+            body = await _read_json(scope, receive, self.max_body_bytes)
+            with _request_context(scope):
+                try:
+                    if path == "/chat":
+                        user_id = _headers(scope).get("x-user-id")
+                        return 200, await asyncio.wait_for(self._chat(body, user_id), self._request_timeout)
+                    return 200, await asyncio.wait_for(self._tool(path[len("/tools/"):], body), self._request_timeout)
+                except asyncio.TimeoutError:
+                    raise _HTTPError(504, "Request timed out.", "timeout") from None
+        finally:
+            self._inflight -= 1
+            if self._inflight == 0:
+                self._drained.set()
+
+    async def _chat(self, body: dict, user_id: str | None) -> dict:
+        message = body.get("message")
+        if not isinstance(message, str) or not message.strip():
+            raise _HTTPError(400, "Body must include a non-empty 'message'.", "bad_request")
+        session_id = body.get("session_id")
+        if session_id is not None and not isinstance(session_id, str):
+            raise _HTTPError(400, "'session_id' must be a string.", "bad_request")
+        # Sessions are per user, so one user cannot continue another's conversation.
+        thread_id = f"{user_id}:{session_id}" if session_id and user_id else session_id
+        async with self._pool.acquire() as agent:
+            reply = await agent.arun(message, session_id=thread_id)
+        return ok({"reply": reply, "session_id": session_id})
+
+    async def _tool(self, name: str, body: dict) -> dict:
+        tool = next((t for t in self._tools if t.name == name), None)
+        if tool is None:
+            raise _HTTPError(404, f"Unknown tool {name!r}.", "not_found")
+        try:
+            return await tool.ainvoke(body)
+        except ValueError as exc:
+            # Argument validation (pydantic's ValidationError is a ValueError).
+            raise _HTTPError(400, str(exc), "bad_request") from exc
+
+
+async def _read_json(scope, receive, max_bytes: int) -> dict:
+    too_large = _HTTPError(413, f"Body must be at most {max_bytes} bytes.", "payload_too_large")
+    declared = _headers(scope).get("content-length", "")
+    if declared.isdigit() and int(declared) > max_bytes:
+        raise too_large
+    chunks, size = [], 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > max_bytes:
+            raise too_large
+        chunks.append(chunk)
+        if not message.get("more_body"):
+            break
+    raw = b"".join(chunks)
+    try:
+        body = json.loads(raw) if raw else {}
+    except ValueError:
+        raise _HTTPError(400, "Body must be JSON.", "bad_request") from None
+    if not isinstance(body, dict):
+        raise _HTTPError(400, "Body must be a JSON object.", "bad_request")
+    return body
+
+
+def _headers(scope) -> dict[str, str]:
+    return {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in scope.get("headers", [])}
+
+
+def _request_context(scope) -> ExitStack:
+    headers = _headers(scope)
+    stack = ExitStack()
+    user_id = headers.get("x-user-id")
+    if user_id:
+        stack.enter_context(acting_as(user_id))
+    calendar_id = headers.get("x-calendar-id")
+    timezone = headers.get("x-timezone")
+    if calendar_id or timezone:
+        try:
+            stack.enter_context(settings_override(calendar_id=calendar_id, timezone=timezone))
+        except ValueError as exc:
+            stack.close()
+            raise _HTTPError(400, str(exc), "bad_request") from exc
+    return stack
+
+
+app = CalendarServer()
+
+
+async def _serve_connection(asgi_app, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    # Minimal HTTP/1.1: one request per connection, Content-Length bodies only.
+    try:
+        request_line = await reader.readline()
+        if not request_line:
+            return
+        method, target, _ = request_line.decode("latin-1").split(" ", 2)
+        headers = []
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers.append((name.strip().lower().encode("latin-1"), value.strip().encode("latin-1")))
+        length = int(dict(headers).get(b"content-length", b"0"))
+        # Oversized bodies are never read; the app answers 413 from the header.
+        body = await reader.readexactly(length) if 0 < length <= asgi_app.max_body_bytes else b""
+
+        path, _, query = target.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method.upper(),
+            "path": unquote(path),
+            "raw_path": path.encode("latin-1"),
+            "query_string": query.encode("latin-1"),
+            "headers": headers,
+        }
+        pending = [{"type": "http.request", "body": body, "more_body": False}]
+        response: dict = {}
+        chunks: list[bytes] = []
+
+        async def receive():
+            return pending.pop() if pending else {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                response.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await asgi_app(scope, receive, send)
+
+        status = response["status"]
+        head = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+        head += [f"{name.decode('latin-1')}: {value.decode('latin-1')}" for name, value in response.get("headers", [])]
+        head.append("connection: close")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + b"".join(chunks))
+        await writer.drain()
+    except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+        pass
+    except Exception:
+        logger.exception("Unhandled error on connection")
+    finally:
+        writer.close()
+
+
+async def serve(asgi_app: CalendarServer, *, host: str = "127.0.0.1", port: int = 8000) -> None:
+    """Run `asgi_app` on a small built-in HTTP server until SIGINT/SIGTERM."""
+    await asgi_app.startup()
+    server = await asyncio.start_server(partial(_serve_connection, asgi_app), host, port)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass
+
+    print(f"Serving on http://{host}:{port}")
+    async with server:
+        await stop.wait()
+        # Stop listening first; open connections finish under the grace period.
+        server.close()
+        await asgi_app.shutdown()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    asyncio.run(serve(app, host=args.host, port=args.port))
+
+
+if __name__ == "__main__":
+    main()
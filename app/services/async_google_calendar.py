@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from google.auth.exceptions import RefreshError
+from googleapiclient.errors import HttpError
+
+from app.services.conflicts import Window
+from app.services.events import Event
+from app.config.settings import load_settings
+from app.services.google_calendar import BatchItemResult, GoogleCalendarClient
+
+
+class AsyncGoogleCalendarClient:
+    """
+    Awaitable front end with the same surface as `GoogleCalendarClient`.
+
+    Single-request calls go through an async `_execute`: the blocking
+    `request.execute()` runs on a thread pool (each worker thread gets its own
+    transport from the wrapped client) under the wrapped client's `ApiCall`
+    retry policy, with rate-limit waits and backoff on `asyncio.sleep`, so
+    concurrent callers never block the event loop. Paged, cached and batched
+    calls run the wrapped client's method on the same pool.
+    """
+
+    def __init__(
+        self,
+        client: GoogleCalendarClient,
+        *,
+        max_workers: int = 8,
+        executor: ThreadPoolExecutor | None = None,
+    ):
+        self._client = client
+        # Per-user clients in multi-user mode share one pool instead of one each.
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="calendar-async")
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        # Carry the task's context (settings overrides) into the worker thread.
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(self._executor, partial(context.run, func, *args, **kwargs))
+
+    async def _execute(self, operation: str, request):
+        # Same policy as the wrapped client's `_execute` (`ApiCall`), waiting with asyncio.
+        with self._client.api_call(operation) as call:
+            while True:
+                wait = call.throttle()
+                if wait:
+                    await asyncio.sleep(wait)
+                try:
+                    result = await self._run(self._client.execute_once, request)
+                except (HttpError, RefreshError) as exc:
+                    await asyncio.sleep(call.failed(exc))
+                    continue
+                call.succeeded()
+                return result
+
+    async def create_event(
+        self,
+        summary,
+        start_time,
+        end_time,
+        *,
+        recurrence: list[str] | None = None,
+        fields: str | None = None,
+    ):
+        created = await self._execute(
+            "create_event",
+            self._client.insert_request(summary, start_time, end_time, fields, recurrence),
+        )
+        self._client.write_through(created, recurrence)
+        return created
+
+    async def get_event(self, event_id: str, *, fields: str | None = None):
+        return await self._execute("get_event", self._client.get_request(event_id, fields))
+
+    async def delete_event(self, event_id: str):
+        result = await self._execute("delete_event", self._client.delete_request(event_id))
+        self._client.forget(event_id)
+        return result
+
+    async def free_busy(self, time_min, time_max, calendar_ids: list[str] | None = None) -> dict[str, list[dict]]:
+        calendar_ids = calendar_ids or [load_settings().default_calendar_id]
+        response = await self._execute(
+            "free_busy",
+            self._client.free_busy_request(time_min, time_max, calendar_ids),
+        )
+        return self._client.parse_free_busy(response, calendar_ids)
+
+    async def list_events(
+        self,
+        time_min,
+        max_results=5,
+        *,
+        fields: str | None = None,
+        calendar_ids: list[str] | None = None,
+    ):
+        return await self._run(
+            self._client.list_events, time_min, max_results, fields=fields, calendar_ids=calendar_ids
+        )
+
+    async def list_from_to(
+        self,
+        time_min,
+        time_max,
+        *,
+        fields: str | None = None,
+        calendar_ids: list[str] | None = None,
+    ):
+        return await self._run(
+            self._client.list_from_to, time_min, time_max, fields=fields, calendar_ids=calendar_ids
+        )
+
+    async def find_conflicts(
+        self,
+        windows: list[Window],
+        *,
+        include_all_day: bool = False,
+        calendar_ids: list[str] | None = None,
+    ) -> list[list[Event]]:
+        return await self._run(
+            self._client.find_conflicts, windows, include_all_day=include_all_day, calendar_ids=calendar_ids
+        )
+
+    async def create_events(self, events: list[dict]) -> list[BatchItemResult]:
+        return await self._run(self._client.create_events, events)
+
+    async def get_events(self, event_ids: list[str]) -> list[BatchItemResult]:
+        return await self._run(self._client.get_events, event_ids)
+
+    async def delete_events(self, event_ids: list[str]) -> list[BatchItemResult]:
+        return await self._run(self._client.delete_events, event_ids)
+
+    async def sync(self, calendar_id: str | None = None) -> None:
+        await self._run(self._client.sync, calendar_id)
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol, Sequence
+from urllib.parse import quote
+
+from google.auth.exceptions import RefreshError
+
+from app.services.auth.google_oauth import DEFAULT_SCOPES, CredentialsUnavailableError
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+logger = logging.getLogger(__name__)
+
+
+class TokenStore(Protocol):
+    """Where serialized tokens (`Credentials.to_json()`) live, keyed by user id."""
+
+    def load(self, user_id: str) -> str | None: ...
+
+    def save(self, user_id: str, token: str) -> None: ...
+
+    def delete(self, user_id: str) -> None: ...
+
+
+class FileTokenStore:
+    """One `<user>.json` token file per user in `directory`."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def _path(self, user_id: str) -> Path:
+        return self.directory / f"{quote(user_id, safe='@.-_')}.json"
+
+    def load(self, user_id: str) -> str | None:
+        path = self._path(user_id)
+        return path.read_text(encoding="utf-8") if path.exists() else None
+
+    def save(self, user_id: str, token: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(user_id)
+        # Write then rename so a concurrent reader never sees half a token.
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_text(token, encoding="utf-8")
+        os.replace(tmp, path)
+
+    def delete(self, user_id: str) -> None:
+        self._path(user_id).unlink(missing_ok=True)
+
+
+class SqliteTokenStore:
+    """All tokens in one SQLite table; safe to share between threads."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS tokens (user_id TEXT PRIMARY KEY, token TEXT NOT NULL)")
+
+    def load(self, user_id: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute("SELECT token FROM tokens WHERE user_id = ?", (user_id,)).fetchone()
+        return row[0] if row else None
+
+    def save(self, user_id: str, token: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO tokens (user_id, token) VALUES (?, ?) "
+                "ON CONFLICT(user_id) DO UPDATE SET token = excluded.token",
+                (user_id, token),
+            )
+
+    def delete(self, user_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tokens WHERE user_id = ?", (user_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_token_store(location: str | Path) -> TokenStore:
+    """A `.db`/`.sqlite`/`.sqlite3` path opens a SQLite store; anything else is a directory."""
+    path = Path(location)
+    if path.suffix in {".db", ".sqlite", ".sqlite3"}:
+        return SqliteTokenStore(path)
+    return FileTokenStore(path)
+
+
+def _utcnow() -> datetime:
+    # google-auth keeps `expiry` as a naive UTC datetime.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class CredentialPool:
+    """
+    Live `Credentials` for many users, backed by a `TokenStore`.
+
+    At most `capacity` users are kept in memory (least recently used are
+    dropped and reloaded from the store on their next request). Refreshes for
+    one user are serialized by a per-user lock, so concurrent requests never
+    refresh the same token twice, and `refresh_due()` lets a
+    `TokenRefreshScheduler` renew tokens before any request needs them.
+    Nothing here ever opens a browser: users without a usable token get a
+    `CredentialsUnavailableError`.
+    """
+
+    def __init__(
+        self,
+        store: TokenStore,
+        *,
+        scopes: Sequence[str] = DEFAULT_SCOPES,
+        capacity: int = 128,
+        refresh_margin_seconds: float = 600.0,
+    ):
+        self._store = store
+        self._scopes = scopes
+        self.capacity = capacity
+        self._margin = timedelta(seconds=refresh_margin_seconds)
+        self._lock = threading.Lock()
+        self._live: OrderedDict[str, Credentials] = OrderedDict()
+        self._user_locks: dict[str, threading.Lock] = {}
+
+        self.loads = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._live
+
+    def _user_lock(self, user_id: str) -> threading.Lock:
+        with self._lock:
+            lock = self._user_locks.get(user_id)
+            if lock is None:
+                lock = self._user_locks[user_id] = threading.Lock()
+            return lock
+
+    def _cached(self, user_id: str) -> Credentials | None:
+        with self._lock:
+            creds = self._live.get(user_id)
+            if creds is not None:
+                self._live.move_to_end(user_id)
+            return creds
+
+    def _remember(self, user_id: str, creds: Credentials) -> None:
+        with self._lock:
+            self._live[user_id] = creds
+            self._live.move_to_end(user_id)
+            while len(self._live) > self.capacity:
+                evicted, _ = self._live.popitem(last=False)
+                self._drop_user_lock(evicted)
+
+    def _drop_user_lock(self, user_id: str) -> None:
+        # Caller holds `_lock`. A held lock stays, so its waiters still serialize.
+        lock = self._user_locks.get(user_id)
+        if lock is not None and not lock.locked():
+            del self._user_locks[user_id]
+
+    def _needs_refresh(self, creds: Credentials, margin: timedelta) -> bool:
+        if not creds.token:
+            return True
+        if creds.expiry is None:
+            return False
+        return creds.expiry - _utcnow() <= margin
+
+    def get(self, user_id: str) -> Credentials:
+        """Return valid credentials for `user_id`, loading or refreshing as needed."""
+        creds = self._cached(user_id)
+        if creds is not None and creds.valid:
+            return creds
+        with self._user_lock(user_id):
+            # Another request may have loaded or refreshed while we waited.
+            creds = self._cached(user_id) or self._load(user_id)
+            if not creds.valid:
+                self._refresh(user_id, creds)
+            self._remember(user_id, creds)
+            return creds
+
+    def put(self, user_id: str, creds: Credentials) -> None:
+        """Store freshly authorized credentials (e.g. from a web OAuth flow)."""
+        with self._user_lock(user_id):
+            self._store.save(user_id, creds.to_json())
+            self._remember(user_id, creds)
+
+    def evict(self, user_id: str) -> None:
+        with self._lock:
+            self._live.pop(user_id, None)
+            self._drop_user_lock(user_id)
+
+    def refresh_due(self) -> int:
+        """
+        Refresh every live token that expires within the refresh margin.
+        Returns how many were refreshed. A failure is logged and skips only
+        that user (revoked tokens also drop the user from the pool).
+        """
+        with self._lock:
+            candidates = list(self._live.items())
+        refreshed = 0
+        for user_id, creds in candidates:
+            if not creds.refresh_token or not self._needs_refresh(creds, self._margin):
+                continue
+            with self._user_lock(user_id):
+                if not self._needs_refresh(creds, self._margin):
+                    continue
+                try:
+                    self._refresh(user_id, creds)
+                except Exception:
+                    # Transport errors, revoked tokens, a failing store: the
+                    # other users still get refreshed; transient failures retry next tick.
+                    logger.warning("Could not refresh the token of user %r", user_id, exc_info=True)
+                    continue
+                refreshed += 1
+        return refreshed
+
+    def _load(self, user_id: str) -> Credentials:
+        from google.oauth2.credentials import Credentials
+
+        token = self._store.load(user_id)
+        if token is None:
+            raise CredentialsUnavailableError(f"No Google authorization stored for user {user_id!r}.")
+        self.loads += 1
+        return Credentials.from_authorized_user_info(json.loads(token), scopes=self._scopes)
+
+    def _refresh(self, user_id: str, creds: Credentials) -> None:
+        # Caller holds the user's lock.
+        from google.auth.transport.requests import Request
+
+        if not creds.refresh_token:
+            self.evict(user_id)
+            raise CredentialsUnavailableError(
+                f"Google authorization for user {user_id!r} expired and cannot be refreshed; "
+                "the user must authorize again."
+            )
+        try:
+            creds.refresh(Request())
+        except RefreshError as exc:
+            self.refresh_failures += 1
+            self.evict(user_id)
+            raise CredentialsUnavailableError(
+                f"Google authorization for user {user_id!r} was revoked or is invalid; "
+                "the user must authorize again."
+            ) from exc
+        self.refreshes += 1
+        self._store.save(user_id, creds.to_json())
+
+
+class TokenRefreshScheduler:
+    """
+    Daemon thread calling `pool.refresh_due()` every `interval_seconds`.
+
+    Keep the pool's refresh margin comfortably above the interval so tokens
+    are renewed at least one tick before they would expire.
+    """
+
+    def __init__(self, pool: CredentialPool, *, interval_seconds: float = 60.0):
+        self._pool = pool
+        self._interval = interval_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> TokenRefreshScheduler:
+        if not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="token-refresh", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self._interval):
+            try:
+                self._pool.refresh_due()
+            except Exception:
+                # A flaky store must not kill the scheduler; the next tick retries.
+                logger.exception("Token refresh pass failed")
+                continue
+
+    def __enter__(self) -> TokenRefreshScheduler:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
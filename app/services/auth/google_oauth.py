@@ -1,24 +1,42 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
+from google.auth.exceptions import RefreshError
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 DEFAULT_SCOPES: Sequence[str] = ("https://www.googleapis.com/auth/calendar",)
 
+
+class CredentialsUnavailableError(RefreshError):
+    """
+    No usable token and no way to get one without a browser. Subclasses
+    `RefreshError` so the calendar client reports it like any other
+    credentials failure instead of crashing the request.
+    """
+
+
 def load_google_credentials(
     *,
     credentials_file: Path,
     token_file: Path,
     scopes: Sequence[str] = DEFAULT_SCOPES,
+    interactive: bool = True,
 ) -> Credentials:
     """
     Load stored user credentials (token), refresh if needed, or run local OAuth flow.
-    Single user.
+    Single user; see `credential_store.CredentialPool` for the multi-user variant.
+
+    With `interactive=False` (server mode) a missing or unrefreshable token
+    raises `CredentialsUnavailableError` instead of opening a browser.
     """
+    # google-auth pulls in requests/oauthlib; import on first use to keep startup fast.
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     creds: Credentials | None = None
 
     if token_file.exists():
@@ -28,15 +46,34 @@ def load_google_credentials(
         return creds
 
     if creds and creds.expired and creds.refresh_token:
-        creds.refresh(Request())
-        token_file.parent.mkdir(parents=True, exist_ok=True)
-        token_file.write_text(creds.to_json(), encoding="utf-8")
-        return creds
+        return refresh_google_credentials(creds, token_file=token_file)
+
+    if not interactive:
+        raise CredentialsUnavailableError(
+            f"No valid Google token at {token_file}; authorize once with the CLI "
+            "(python -m app.main) before starting the server."
+        )
 
     # First-time auth (Desktop app flow). This matches Google’s Python quickstart pattern.
     flow = InstalledAppFlow.from_client_secrets_file(str(credentials_file), scopes=scopes)
     creds = flow.run_local_server(port=0)
 
+    _save_token(creds, token_file)
+    return creds
+
+
+def refresh_google_credentials(creds: Credentials, *, token_file: Path) -> Credentials:
+    """
+    Refresh `creds` in place and persist the new token so the next process
+    start does not pay the refresh round trip again.
+    """
+    from google.auth.transport.requests import Request
+
+    creds.refresh(Request())
+    _save_token(creds, token_file)
+    return creds
+
+
+def _save_token(creds: Credentials, token_file: Path) -> None:
     token_file.parent.mkdir(parents=True, exist_ok=True)
     token_file.write_text(creds.to_json(), encoding="utf-8")
-    return creds
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import math
+from datetime import datetime, time, timedelta, tzinfo
+from typing import Iterable
+
+WEEKDAYS = frozenset(range(5))
+
+
+def merge_intervals(intervals: Iterable[tuple[float, float]]) -> list[tuple[float, float]]:
+    """Sort-and-sweep merge of overlapping or touching [start, end) intervals."""
+    merged: list[list[float]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def _working_windows(
+    window_start: datetime,
+    window_end: datetime,
+    working_hours: tuple[time, time],
+    working_days: frozenset[int],
+    tz: tzinfo,
+) -> list[tuple[float, float]]:
+    day_start, day_end = working_hours
+    lo, hi = window_start.timestamp(), window_end.timestamp()
+    windows = []
+    day = window_start.astimezone(tz).date()
+    last_day = window_end.astimezone(tz).date()
+    while day <= last_day:
+        if day.weekday() in working_days:
+            open_at = datetime.combine(day, day_start, tzinfo=tz).timestamp()
+            close_at = datetime.combine(day, day_end, tzinfo=tz).timestamp()
+            open_at, close_at = max(open_at, lo), min(close_at, hi)
+            if open_at < close_at:
+                windows.append((open_at, close_at))
+        day += timedelta(days=1)
+    return windows
+
+
+def _align(timestamp: float, step: float, tz: tzinfo) -> float:
+    """The first local-time multiple of `step` at or after `timestamp`."""
+    offset = datetime.fromtimestamp(timestamp, tz).utcoffset().total_seconds()
+    return math.ceil((timestamp + offset) / step) * step - offset
+
+
+def find_free_slots(
+    busy: Iterable[tuple[float, float]],
+    *,
+    window_start: datetime,
+    window_end: datetime,
+    duration: timedelta,
+    tz: tzinfo,
+    working_hours: tuple[time, time] = (time(9), time(18)),
+    working_days: frozenset[int] = WEEKDAYS,
+    buffer: timedelta = timedelta(0),
+    granularity: timedelta = timedelta(minutes=15),
+    limit: int = 5,
+) -> list[tuple[float, float]]:
+    """
+    Return up to `limit` earliest (start, end) epoch-second slots of length
+    `duration` inside working hours that keep `buffer` clear of every busy
+    interval. Slot starts are aligned to `granularity` in local time (so
+    :00/:15/:30/:45 also in zones like +05:30).
+    """
+    length = duration.total_seconds()
+    pad = buffer.total_seconds()
+    step = granularity.total_seconds() or 1.0
+    blocked = merge_intervals((start - pad, end + pad) for start, end in busy)
+
+    slots: list[tuple[float, float]] = []
+    cursor = 0
+    for open_at, close_at in _working_windows(window_start, window_end, working_hours, working_days, tz):
+        # Busy intervals are sorted, so the sweep pointer never moves backwards.
+        while cursor < len(blocked) and blocked[cursor][1] <= open_at:
+            cursor += 1
+        free_from = open_at
+        position = cursor
+        while free_from < close_at and len(slots) < limit:
+            next_busy = blocked[position] if position < len(blocked) else None
+            gap_end = min(close_at, next_busy[0]) if next_busy else close_at
+            slot_start = _align(free_from, step, tz)
+            while slot_start + length <= gap_end and len(slots) < limit:
+                slots.append((slot_start, slot_start + length))
+                slot_start = _align(slot_start + length, step, tz)
+            if next_busy is None or next_busy[0] >= close_at:
+                break
+            free_from = max(free_from, next_busy[1])
+            position += 1
+        if len(slots) >= limit:
+            break
+    return slots
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from app.config.settings import load_settings
+from app.services.async_google_calendar import AsyncGoogleCalendarClient
+from app.services.auth.credential_store import CredentialPool, TokenRefreshScheduler, open_token_store
+from app.services.auth.google_oauth import CredentialsUnavailableError
+from app.services.discovery import calendar_discovery_document
+from app.services.google_calendar import GoogleCalendarClient
+
+_lock = threading.Lock()
+_client: GoogleCalendarClient | None = None
+_async_client: AsyncGoogleCalendarClient | None = None
+
+_current_user: ContextVar[str | None] = ContextVar("calendar_user", default=None)
+_pool: CredentialPool | None = None
+_scheduler: TokenRefreshScheduler | None = None
+_user_clients: OrderedDict[str, AsyncGoogleCalendarClient] = OrderedDict()
+_user_executor: ThreadPoolExecutor | None = None
+
+
+def get_calendar_client() -> GoogleCalendarClient:
+    """
+    Return the process-wide calendar client, building it on first use.
+
+    Credentials are loaded and the Calendar service is built once per process;
+    the client hands out per-thread transports, so the same instance can be
+    shared by every tool call. Inside `acting_as(user_id)` the client for that
+    user is returned instead.
+    """
+    user_id = _current_user.get()
+    if user_id is not None:
+        return _user_client(user_id)._client
+
+    global _client
+    client = _client
+    if client is None:
+        with _lock:
+            if _client is None:
+                _client = GoogleCalendarClient()
+            client = _client
+    return client
+
+
+def get_async_calendar_client() -> AsyncGoogleCalendarClient:
+    """Return the process-wide async client, wrapping the shared sync client."""
+    user_id = _current_user.get()
+    if user_id is not None:
+        return _user_client(user_id)
+
+    global _async_client
+    client = _async_client
+    if client is None:
+        sync_client = get_calendar_client()
+        with _lock:
+            if _async_client is None:
+                _async_client = AsyncGoogleCalendarClient(sync_client)
+            client = _async_client
+    return client
+
+
+def set_calendar_client(client: GoogleCalendarClient | None) -> None:
+    """Install `client` as the shared instance (e.g. a fake in tests)."""
+    global _client, _async_client
+    with _lock:
+        _client = client
+        _async_client = None
+
+
+def reset_calendar_client() -> None:
+    """Drop the shared instance so the next call builds a fresh one."""
+    set_calendar_client(None)
+
+
+class _PooledCalendarClient(GoogleCalendarClient):
+    """Client for one user whose credentials come from a `CredentialPool`."""
+
+    def __init__(self, pool: CredentialPool, user_id: str):
+        self._pool = pool
+        self.user_id = user_id
+        super().__init__()
+
+    def _build_service(self):
+        # Credentials are resolved per request (see `_refresh_credentials`), so
+        # building the client never touches the store or the network.
+        import httplib2
+        from googleapiclient.discovery import build_from_document
+
+        from app.services.response_model import OrjsonModel
+
+        return build_from_document(calendar_discovery_document(), http=httplib2.Http(), model=OrjsonModel())
+
+    def _refresh_credentials(self) -> None:
+        # The pool refreshes under a per-user lock and usually ahead of time;
+        # a missing or revoked token raises a RefreshError subclass, which
+        # `_execute` reports as a credentials error.
+        self._credentials = self._pool.get(self.user_id)
+
+
+def get_credential_pool() -> CredentialPool:
+    """
+    Return the multi-user credential pool configured by `CREDENTIAL_STORE`,
+    starting its background refresh scheduler on first use.
+    """
+    global _pool, _scheduler
+    pool = _pool
+    if pool is None:
+        with _lock:
+            if _pool is None:
+                settings = load_settings()
+                if settings.credential_store is None:
+                    raise CredentialsUnavailableError("Multi-user mode requires CREDENTIAL_STORE to be set.")
+                _pool = CredentialPool(
+                    open_token_store(settings.credential_store),
+                    capacity=settings.credential_pool_size,
+                    refresh_margin_seconds=settings.token_refresh_margin_seconds,
+                )
+                _scheduler = TokenRefreshScheduler(_pool).start()
+            pool = _pool
+    return pool
+
+
+def set_credential_pool(pool: CredentialPool | None, *, scheduler: TokenRefreshScheduler | None = None) -> None:
+    """Install `pool` (and optionally its scheduler), dropping every per-user client."""
+    global _pool, _scheduler
+    with _lock:
+        if _scheduler is not None and _scheduler is not scheduler:
+            _scheduler.stop()
+        _pool = pool
+        _scheduler = scheduler
+        _user_clients.clear()
+
+
+def _user_client(user_id: str) -> AsyncGoogleCalendarClient:
+    global _user_executor
+    pool = get_credential_pool()
+    with _lock:
+        client = _user_clients.get(user_id)
+        if client is not None:
+            _user_clients.move_to_end(user_id)
+            return client
+        if _user_executor is None:
+            _user_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="calendar-async")
+        client = AsyncGoogleCalendarClient(_PooledCalendarClient(pool, user_id), executor=_user_executor)
+        _user_clients[user_id] = client
+        # Same bound as the pool: a client without live credentials is just a reload away.
+        while len(_user_clients) > pool.capacity:
+            _user_clients.popitem(last=False)
+        return client
+
+
+def current_user() -> str | None:
+    """The user set by `acting_as` in the current context, if any."""
+    return _current_user.get()
+
+
+@contextmanager
+def acting_as(user_id: str) -> Iterator[None]:
+    """
+    Route `get_calendar_client()` / `get_async_calendar_client()` in the current
+    context (thread or asyncio task) to `user_id`'s calendar.
+    """
+    token = _current_user.set(user_id)
+    try:
+        yield
+    finally:
+        _current_user.reset(token)
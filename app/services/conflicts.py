@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+from datetime import datetime, tzinfo
+from typing import TYPE_CHECKING, Generic, Iterable, Iterator, Sequence, TypeVar
+
+from app.services.event_times import to_timestamp
+
+if TYPE_CHECKING:
+    from app.services.events import Event
+
+T = TypeVar("T")
+
+Window = tuple["str | datetime", "str | datetime"]
+
+
+class IntervalIndex(Generic[T]):
+    """
+    Static sorted-array index over half-open [start, end) intervals.
+
+    Intervals up to `long_span` seconds (a day by default, so all-day events
+    included) are sorted by start; an overlap query bisects to the first one
+    that could still be running (start >= lo - longest such span) and to the
+    first one starting at or after `hi`, then filters that slice. Longer
+    blocks (multi-day trips, leave) sit in a separate short list that every
+    query scans, so one of them never widens the slice. A query costs
+    O(log n + k + long blocks).
+    """
+
+    def __init__(self, intervals: Iterable[tuple[float, float, T]] = (), *, long_span: float = 86400.0):
+        entries = sorted(intervals, key=_entry_order)
+        self._entries = [entry for entry in entries if entry[1] - entry[0] <= long_span]
+        self._long = [entry for entry in entries if entry[1] - entry[0] > long_span]
+        self._starts = [entry[0] for entry in self._entries]
+        self._max_span = max((end - start for start, end, _ in self._entries), default=0.0)
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._long)
+
+    def overlapping(self, lo: float, hi: float) -> list[T]:
+        """Values whose interval overlaps [lo, hi), ordered by start."""
+        return list(self.iter_overlapping(lo, hi))
+
+    def iter_overlapping(self, lo: float, hi: float) -> Iterator[T]:
+        """`overlapping`, lazily: stop early (e.g. with `islice`) to skip the rest."""
+        first = bisect.bisect_left(self._starts, lo - self._max_span)
+        last = bisect.bisect_left(self._starts, hi)
+        entries = self._entries
+        short = (entries[i] for i in range(first, last) if _overlaps(entries[i], lo, hi))
+        if not self._long:
+            return (value for _, _, value in short)
+        long = [entry for entry in self._long if _overlaps(entry, lo, hi)]
+        return (value for _, _, value in heapq.merge(short, long, key=_entry_order))
+
+    def overlapping_many(self, windows: Sequence[tuple[float, float]]) -> list[list[T]]:
+        """Answer several overlap queries against the same index in one call."""
+        return [self.overlapping(lo, hi) for lo, hi in windows]
+
+
+def _entry_order(entry: tuple[float, float, object]) -> tuple[float, float]:
+    return entry[0], entry[1]
+
+
+def _overlaps(entry: tuple[float, float, object], lo: float, hi: float) -> bool:
+    start, end, _ = entry
+    return start < hi and (end > lo or (start == end and start >= lo))
+
+
+def busy_index(events: Iterable[Event], *, include_all_day: bool = False) -> IntervalIndex[Event]:
+    """Build an index over the events that actually block time (see `Event.is_busy`)."""
+    return IntervalIndex(
+        (event.start, event.end, event)
+        for event in events
+        if event.is_busy(include_all_day=include_all_day)
+    )
+
+
+def find_conflicts(index: IntervalIndex[Event], windows: Sequence[Window], tz: tzinfo) -> list[list[Event]]:
+    """Busy events overlapping each candidate window, one list per window."""
+    return index.overlapping_many(
+        [(to_timestamp(start, tz), to_timestamp(end, tz)) for start, end in windows]
+    )
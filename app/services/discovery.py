@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from importlib import resources
+
+# google-api-python-client ships static discovery documents for every API it
+# knows about; loading ours from there keeps service construction offline.
+_DISCOVERY_PACKAGE = "googleapiclient.discovery_cache.documents"
+_CALENDAR_DOCUMENT = "calendar.v3.json"
+
+
+@lru_cache(maxsize=1)
+def calendar_discovery_document() -> dict:
+    """
+    Return the bundled Calendar v3 discovery document, parsed once per process.
+
+    The parsed dict is handed straight to `build_from_document`, which skips
+    both the network fetch and the JSON parse on every later client build.
+    """
+    raw = resources.files(_DISCOVERY_PACKAGE).joinpath(_CALENDAR_DOCUMENT).read_text(encoding="utf-8")
+    return json.loads(raw)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import threading
+import time
+from itertools import islice
+from datetime import datetime, tzinfo
+from typing import Callable
+
+from app.services.conflicts import IntervalIndex, busy_index
+from app.services.event_times import to_timestamp
+from app.services.events import Event
+
+
+class EventStore:
+    """
+    In-memory copy of one calendar's events, kept fresh with sync tokens.
+
+    Events are parsed into `Event`s once, as they arrive, and kept in an
+    `IntervalIndex` so window queries are a bisect plus a short scan. The
+    store itself never talks to the API; `GoogleCalendarClient` feeds it full
+    and incremental sync results (through `refresh`) and writes its own
+    mutations through to it.
+    """
+
+    def __init__(self, calendar_id: str, tz: tzinfo):
+        self.calendar_id = calendar_id
+        self._tz = tz
+        self._lock = threading.RLock()
+        # Serializes syncs only: readers keep using `_lock` while one is fetching.
+        self._sync_lock = threading.Lock()
+        self._events: dict[str, Event] = {}
+        self._index: IntervalIndex[Event] = IntervalIndex()
+        self._busy: dict[bool, IntervalIndex[Event]] = {}
+        self._dirty = False
+        self.sync_token: str | None = None
+        self.synced_at: float | None = None
+
+    @property
+    def synced(self) -> bool:
+        return self.synced_at is not None
+
+    def is_stale(self, max_staleness_seconds: float) -> bool:
+        if self.synced_at is None:
+            return True
+        return time.monotonic() - self.synced_at > max_staleness_seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._dirty = True
+            self.sync_token = None
+            self.synced_at = None
+
+    def expire(self) -> None:
+        """
+        Force a sync before the next read, keeping the sync token so it is an
+        incremental one (e.g. after creating a recurring series, whose
+        instances only the sync listing expands).
+        """
+        with self._lock:
+            self.synced_at = None
+
+    def refresh(
+        self,
+        fetch: Callable[[str | None], tuple[list[dict], str | None, bool]],
+        *,
+        max_staleness_seconds: float | None = None,
+    ) -> bool:
+        """
+        Sync through `fetch(sync_token) -> (items, next_sync_token, full)`, one
+        caller at a time. With `max_staleness_seconds`, a caller that waited
+        for another's sync finds the store fresh and does not fetch again.
+        Reads are served from the current contents while `fetch` runs.
+        Returns whether this call synced.
+        """
+        with self._sync_lock:
+            if max_staleness_seconds is not None and not self.is_stale(max_staleness_seconds):
+                return False
+            items, sync_token, full = fetch(self.sync_token)
+            self.apply_sync(items, sync_token=sync_token, full=full)
+            return True
+
+    def apply_sync(self, items: list[dict], *, sync_token: str | None, full: bool = False) -> None:
+        """
+        Apply one sync result and mark the store fresh. A `full` result
+        replaces the contents instead of updating them.
+        """
+        with self._lock:
+            if full:
+                self._events.clear()
+                self._dirty = True
+            for event in items:
+                if event.get("status") == "cancelled":
+                    self.remove(event["id"])
+                else:
+                    self.upsert(event)
+            self.sync_token = sync_token
+            self.synced_at = time.monotonic()
+
+    def upsert(self, resource: dict) -> None:
+        with self._lock:
+            if resource.get("status") == "cancelled":
+                self.remove(resource["id"])
+                return
+            self._events[resource["id"]] = Event.from_api(resource, self._tz)
+            self._dirty = True
+
+    def remove(self, event_id: str) -> None:
+        with self._lock:
+            if self._events.pop(event_id, None) is not None:
+                self._dirty = True
+
+    def window(self, time_min: str | datetime, time_max: str | datetime) -> list[Event]:
+        """Events overlapping [time_min, time_max), ordered by start time."""
+        lo = to_timestamp(time_min, self._tz)
+        hi = to_timestamp(time_max, self._tz)
+        with self._lock:
+            self._reindex()
+            return self._index.overlapping(lo, hi)
+
+    def upcoming(self, time_min: str | datetime, limit: int) -> list[Event]:
+        """The first `limit` events ending after `time_min`, ordered by start time."""
+        lo = to_timestamp(time_min, self._tz)
+        with self._lock:
+            self._reindex()
+            return list(islice(self._index.iter_overlapping(lo, float("inf")), limit))
+
+    def busy_index(self, *, include_all_day: bool = False) -> IntervalIndex[Event]:
+        """Index over the events that actually block time, rebuilt only after changes."""
+        with self._lock:
+            self._reindex()
+            index = self._busy.get(include_all_day)
+            if index is None:
+                index = busy_index(self._events.values(), include_all_day=include_all_day)
+                self._busy[include_all_day] = index
+            return index
+
+    def _reindex(self) -> None:
+        if not self._dirty:
+            return
+        self._index = IntervalIndex((event.start, event.end, event) for event in self._events.values())
+        self._busy.clear()
+        self._dirty = False
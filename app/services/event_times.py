@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import heapq
+from datetime import date, datetime, time, tzinfo
+from operator import attrgetter
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from app.services.events import Event
+
+
+def ensure_tz(dt: datetime, tz: tzinfo) -> datetime:
+    """`dt` in `tz`: naive values are taken to be in `tz`, aware ones converted."""
+    if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
+        return dt.replace(tzinfo=tz)
+    return dt.astimezone(tz)
+
+
+def to_timestamp(value: str | datetime, tz: tzinfo) -> float:
+    """Convert an RFC 3339 string or datetime to epoch seconds (naive values use `tz`)."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None or value.tzinfo.utcoffset(value) is None:
+        value = value.replace(tzinfo=tz)
+    return value.timestamp()
+
+
+def _boundary_timestamp(boundary: dict, tz: tzinfo) -> float:
+    if boundary.get("dateTime"):
+        return to_timestamp(boundary["dateTime"], tz)
+    # All-day events carry a bare date that starts at midnight in the calendar's zone.
+    day = date.fromisoformat(boundary["date"])
+    return datetime.combine(day, time.min, tzinfo=tz).timestamp()
+
+
+def event_bounds(event: dict, tz: tzinfo) -> tuple[float, float]:
+    """Return the (start, end) epoch seconds of a Calendar API event resource."""
+    return _boundary_timestamp(event["start"], tz), _boundary_timestamp(event["end"], tz)
+
+
+def merge_by_start(listings: dict[str, Iterable[Event]]) -> Iterator[Event]:
+    """
+    K-way merge per-calendar listings, each already in start order, into one
+    start-ordered stream. Every event is tagged with its `calendar_id`.
+    """
+    tagged = [_tagged(calendar_id, events) for calendar_id, events in listings.items()]
+    return heapq.merge(*tagged, key=attrgetter("start"))
+
+
+def _tagged(calendar_id: str, events: Iterable[Event]) -> Iterator[Event]:
+    for event in events:
+        yield event.tagged(calendar_id)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from datetime import tzinfo
+
+from app.services.event_times import event_bounds
+
+
+@dataclass(slots=True)
+class Event:
+    """
+    A calendar event, parsed once from its API resource.
+
+    `start`/`end` are epoch seconds (all-day events start at midnight in the
+    calendar's zone), so ordering, overlap and busy checks never re-parse;
+    `start_iso`/`end_iso` keep the API's own strings for display. Instances
+    are shared by the event store, the memo and the caches, so treat them as
+    read-only (`tagged` returns a copy). Not frozen: a frozen dataclass'
+    `__init__` costs more than the parse itself on a full sync.
+    """
+
+    id: str
+    summary: str | None
+    start: float
+    end: float
+    start_iso: str
+    end_iso: str
+    all_day: bool = False
+    status: str = "confirmed"
+    transparency: str = "opaque"
+    declined: bool = False
+    calendar_id: str | None = None
+
+    @classmethod
+    def from_api(cls, resource: dict, tz: tzinfo) -> Event:
+        """
+        Parse an event resource (`tz` places all-day and naive times). Raises
+        KeyError, TypeError or ValueError when it has no usable start/end.
+        """
+        start, end = event_bounds(resource, tz)
+        start_iso = resource["start"].get("dateTime")
+        attendees = resource.get("attendees")
+        # Positional: this runs once per event on every sync and listing.
+        return cls(
+            resource.get("id", ""),
+            resource.get("summary"),
+            start,
+            end,
+            start_iso or resource["start"]["date"],
+            resource["end"].get("dateTime") or resource["end"]["date"],
+            not start_iso,
+            resource.get("status", "confirmed"),
+            resource.get("transparency", "opaque"),
+            bool(attendees) and any(
+                attendee.get("self") and attendee.get("responseStatus") == "declined" for attendee in attendees
+            ),
+        )
+
+    def is_busy(self, *, include_all_day: bool = False) -> bool:
+        """
+        Whether the event actually blocks time: cancelled, transparent ("free"),
+        declined and (by default) all-day entries do not.
+        """
+        if self.status == "cancelled" or self.transparency == "transparent" or self.declined:
+            return False
+        return include_all_day or not self.all_day
+
+    def tagged(self, calendar_id: str) -> Event:
+        return replace(self, calendar_id=calendar_id)
+
+    def to_dict(self, *, with_id: bool = True) -> dict:
+        """The event as tools report it."""
+        data = {
+            "summary": "Untitled event" if self.summary is None else self.summary,
+            "start": self.start_iso,
+            "end": self.end_iso,
+        }
+        if with_id:
+            data["eventId"] = self.id
+        if self.calendar_id:
+            data["calendar"] = self.calendar_id
+        return data
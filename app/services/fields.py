@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+# Event-level fields each caller actually reads. The Calendar API returns the
+# full resource (description, attendees, conferenceData, attachments, ...) unless
+# a `fields=` partial-response mask says otherwise.
+_LISTED = ("id", "summary", "start", "end")
+_BUSY = (*_LISTED, "status", "transparency", "attendees(self,responseStatus)")
+
+PRESETS: dict[str, tuple[str, ...]] = {
+    "list_events": _LISTED,
+    "list_from_to": _LISTED,
+    "conflicts": _BUSY,
+    # The local store serves both listings and conflict checks.
+    "sync_events": _BUSY,
+    "create_event": _LISTED,
+    # Deletes look the event up first; its times scope cache invalidation.
+    "get_event": ("id", "summary", "start", "end"),
+}
+
+FREE_BUSY_FIELDS = "calendars"
+
+
+def _event_fields(preset: str, extra: tuple[str, ...]) -> str:
+    fields = PRESETS[preset]
+    return ",".join(dict.fromkeys((*fields, *extra)))
+
+
+def event_mask(preset: str, *extra: str) -> str:
+    """Mask for calls returning one event (get/insert), widened by `extra` fields."""
+    return _event_fields(preset, extra)
+
+
+def list_mask(preset: str, *extra: str, sync: bool = False) -> str:
+    """Mask for `events().list` pages, widened by `extra` event fields."""
+    mask = f"items({_event_fields(preset, extra)}),nextPageToken"
+    return f"{mask},nextSyncToken" if sync else mask
@@ -2,13 +2,43 @@ from __future__ import annotations
 
 from app.config.settings import load_settings
 
-from app.services.auth.google_oauth import load_google_credentials
+from app.services.auth.google_oauth import load_google_credentials, refresh_google_credentials
+from app.services.conflicts import Window, busy_index, find_conflicts
+from app.services.discovery import calendar_discovery_document
+from app.services.event_store import EventStore
+from app.services.event_times import merge_by_start, to_timestamp
+from app.services.events import Event
+from app.services.fields import FREE_BUSY_FIELDS, event_mask, list_mask
+from app.services.rate_limit import get_rate_limiter, retry_after_seconds
+from app.services.telemetry import record_error, record_retry, span
 from google.auth.exceptions import RefreshError
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from httplib2 import HttpLib2Error
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterator, TypeVar
+import contextvars
 import random
+import threading
 import time
 
+if TYPE_CHECKING:
+    from app.config.settings import Settings
+    from google.oauth2.credentials import Credentials
+    from google_auth_httplib2 import AuthorizedHttp
+
+
+_T = TypeVar("_T")
+
+_STORE_MASKS = {list_mask("list_events"), list_mask("list_from_to"), list_mask("conflicts")}
+
+
+def _isoformat(value: str | datetime) -> str:
+    return value if isinstance(value, str) else value.isoformat(timespec="seconds")
+
 
 class GoogleCalendarError(RuntimeError):
     def __init__(self, message: str, *, status: int | None = None, reason: str | None = None):
@@ -17,24 +47,148 @@ class GoogleCalendarError(RuntimeError):
         self.status = status
         self.reason = reason
 
+
+def _credentials_error(exc: RefreshError) -> GoogleCalendarError:
+    return GoogleCalendarError(
+        "Google Calendar credentials expired or invalid.",
+        reason=str(exc),
+    )
+
+
+@dataclass(frozen=True)
+class BatchItemResult:
+    response: dict | None = None
+    error: GoogleCalendarError | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ApiCall:
+    """
+    The retry policy for one Calendar API call, shared by `GoogleCalendarClient`
+    and its async wrapper so both honor the rate limiter, the retry budget and
+    telemetry the same way; only how they wait differs. Use as a context
+    manager (the call's span), then per attempt:
+
+        wait = call.throttle()            # sleep this long, then execute
+        ... on HttpError/RefreshError:    sleep call.failed(exc) and retry
+        ... on success:                   call.succeeded()
+    """
+
+    def __init__(self, client: GoogleCalendarClient, operation: str, *, cost: int = 1):
+        self._client = client
+        self.operation = operation
+        self._cost = cost
+        self._attempt = 0
+        self._span = None
+        self._current = None
+
+    def __enter__(self) -> ApiCall:
+        self._span = span(f"calendar.{self.operation}", metric="calendar_api_seconds", operation=self.operation)
+        self._current = self._span.__enter__()
+        return self
+
+    def __exit__(self, *exc_info) -> bool | None:
+        return self._span.__exit__(*exc_info)
+
+    def throttle(self) -> float:
+        """Take this attempt's rate-limit tokens; returns the seconds to wait first."""
+        return self._client._limiter.reserve(self._cost)
+
+    def failed(self, exc: Exception) -> float:
+        """
+        Seconds to back off before retrying after `exc`, or raise the
+        `GoogleCalendarError` to report when the call should give up.
+        """
+        client, operation = self._client, self.operation
+        if isinstance(exc, RefreshError):
+            record_error(self._current, operation, "credentials")
+            raise _credentials_error(exc) from exc
+        if not isinstance(exc, HttpError):
+            raise exc
+        status, reason = client._http_error_details(exc)
+        delay = client._retry_delay(exc, status, reason, self._attempt)
+        if delay is None:
+            record_error(self._current, operation, status)
+            raise GoogleCalendarError(
+                f"Google Calendar API error during {operation}.",
+                status=status,
+                reason=reason,
+            ) from exc
+        self._attempt += 1
+        record_retry(self._current, operation, delay)
+        return delay
+
+    def succeeded(self) -> None:
+        self._client._limiter.on_success()
+
+
 class GoogleCalendarClient:
     _MAX_RETRIES = 3
     _BASE_BACKOFF_SECONDS = 0.5
+    _MAX_PAGE_SIZE = 2500
+    _MAX_BATCH_SIZE = 50
+    _MAX_FAN_OUT = 8
+    _RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
 
-    def __init__(self):
-        self._settings = load_settings()
+    def __init__(self, credentials: Credentials | None = None):
+        self._credentials = credentials
+        # httplib2.Http is not thread-safe, so every thread gets its own transport.
+        self._local = threading.local()
+        self._refresh_lock = threading.Lock()
+        self._stores: dict[str, EventStore] = {}
+        self._stores_lock = threading.Lock()
+        self._limiter = get_rate_limiter()
         self._service = self._build_service()
         
+    @property
+    def _settings(self) -> Settings:
+        # Looked up per call so per-request overrides (calendar id, time zone) apply
+        # to the shared client; the cached settings make this a cheap read.
+        return load_settings()
+
     def _build_service(self):
-        creds = load_google_credentials(
-            credentials_file=self._settings.google_credentials_file,
-            token_file=self._settings.google_token_file,
-        )
+        if self._credentials is None:
+            self._credentials = load_google_credentials(
+                credentials_file=self._settings.google_credentials_file,
+                token_file=self._settings.google_token_file,
+                interactive=self._settings.google_oauth_interactive,
+            )
         
-        return build("calendar", "v3", credentials=creds)
+        # The discovery client is heavy to import and only needed once per process.
+        from googleapiclient.discovery import build_from_document
+
+        from app.services.response_model import OrjsonModel
+
+        return build_from_document(calendar_discovery_document(), credentials=self._credentials, model=OrjsonModel())
+
+    def _http(self) -> AuthorizedHttp | None:
+        if self._credentials is None:
+            return None
+        http = getattr(self._local, "http", None)
+        # Pooled clients may swap in a reloaded Credentials object.
+        if http is None or http.credentials is not self._credentials:
+            import httplib2
+            from google_auth_httplib2 import AuthorizedHttp
+
+            http = AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+
+    def _refresh_credentials(self) -> None:
+        creds = self._credentials
+        if creds is None or creds.valid:
+            return
+        with self._refresh_lock:
+            # Another thread may have refreshed while we waited for the lock.
+            if creds.valid or not creds.refresh_token:
+                return
+            refresh_google_credentials(creds, token_file=self._settings.google_token_file)
     
-    def create_event(self, summary, start_time, end_time):
-        event = {
+    def _event_body(self, summary, start_time, end_time, recurrence: list[str] | None = None) -> dict:
+        body = {
             "summary": summary,
             "start": {
                 "dateTime": start_time,
@@ -45,58 +199,452 @@ class GoogleCalendarClient:
                 "timeZone": self._settings.timezone,
             },
         }
+        if recurrence:
+            # RRULE/EXDATE lines; Google expands them in `timeZone`, so one insert creates the series.
+            body["recurrence"] = list(recurrence)
+        return body
+
+    def insert_request(
+        self,
+        summary,
+        start_time,
+        end_time,
+        fields: str | None = None,
+        recurrence: list[str] | None = None,
+    ):
+        return self._service.events().insert(
+            calendarId=self._settings.default_calendar_id,
+            body=self._event_body(summary, start_time, end_time, recurrence),
+            fields=fields or event_mask("create_event"),
+        )
 
-        return self._execute(
+    def get_request(self, event_id: str, fields: str | None = None):
+        return self._service.events().get(
+            calendarId=self._settings.default_calendar_id,
+            eventId=event_id,
+            fields=fields or event_mask("get_event"),
+        )
+
+    def delete_request(self, event_id: str):
+        return self._service.events().delete(
+            calendarId=self._settings.default_calendar_id,
+            eventId=event_id,
+        )
+
+    def create_event(
+        self,
+        summary,
+        start_time,
+        end_time,
+        *,
+        recurrence: list[str] | None = None,
+        fields: str | None = None,
+    ):
+        created = self._execute(
             "create_event",
-            self._service.events().insert(
-                calendarId=self._settings.default_calendar_id,
-                body=event,
-            ),
+            self.insert_request(summary, start_time, end_time, fields, recurrence),
         )
+        self.write_through(created, recurrence)
+        return created
 
-    def list_events(self, time_min, max_results=5):
-        response = self._execute(
-            "list_events",
-            self._service.events().list(
-                calendarId=self._settings.default_calendar_id,
-                timeMin=time_min,
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy="startTime",
-            ),
+    def create_events(self, events: list[dict]) -> list[BatchItemResult]:
+        """
+        Create many events with batched HTTP requests. Each item is a dict with
+        `summary`, `start_time`, `end_time` and optionally `recurrence`; results
+        are in input order.
+        """
+        results = self.batch(
+            [
+                (
+                    "create_event",
+                    self.insert_request(
+                        event["summary"],
+                        event["start_time"],
+                        event["end_time"],
+                        recurrence=event.get("recurrence"),
+                    ),
+                )
+                for event in events
+            ]
         )
-        return response.get("items", [])
+        for event, result in zip(events, results):
+            if result.ok:
+                self.write_through(result.response, event.get("recurrence"))
+        return results
+
+    def get_events(self, event_ids: list[str]) -> list[BatchItemResult]:
+        """Fetch many events with batched HTTP requests, in input order."""
+        return self.batch([("get_event", self.get_request(event_id)) for event_id in event_ids])
+
+    def delete_events(self, event_ids: list[str]) -> list[BatchItemResult]:
+        """Delete many events with batched HTTP requests, in input order."""
+        results = self.batch([("delete_event", self.delete_request(event_id)) for event_id in event_ids])
+        for event_id, result in zip(event_ids, results):
+            if result.ok:
+                self.forget(event_id)
+        return results
+
+    def batch(self, operations: list[tuple[str, object]]) -> list[BatchItemResult]:
+        """
+        Run (operation, request) pairs through `new_batch_http_request`, at most
+        50 sub-requests per HTTP call. Sub-requests failing with a transient
+        status are retried on their own with the same backoff as `_execute`;
+        every other outcome is reported per item, in input order. A failed HTTP
+        call fails only its own chunk's items, so results of earlier chunks
+        (already applied by Google) are never lost.
+        """
+        results: list[BatchItemResult | None] = [None] * len(operations)
+        pending = list(range(len(operations)))
+
+        for attempt in range(self._MAX_RETRIES + 1):
+            retry = []
+            delay = 0.0
+            for offset in range(0, len(pending), self._MAX_BATCH_SIZE):
+                chunk = pending[offset:offset + self._MAX_BATCH_SIZE]
+                failures: dict[int, HttpError] = {}
+
+                def collect(request_id, response, exception, failures=failures):
+                    index = int(request_id)
+                    if exception is None:
+                        results[index] = BatchItemResult(response=response)
+                    else:
+                        failures[index] = exception
+
+                batch = self._service.new_batch_http_request(callback=collect)
+                for index in chunk:
+                    batch.add(operations[index][1], request_id=str(index))
+                # Google bills every sub-request against the quota, not the envelope.
+                try:
+                    self._execute("batch", batch, cost=len(chunk))
+                except (GoogleCalendarError, OSError, HttpLib2Error) as exc:
+                    error = exc if isinstance(exc, GoogleCalendarError) else GoogleCalendarError(
+                        "Network error during batch.", reason=str(exc)
+                    )
+                    for index in chunk:
+                        if results[index] is None:
+                            results[index] = BatchItemResult(error=error)
+                    continue
+
+                for index, exception in failures.items():
+                    status, reason = self._http_error_details(exception)
+                    retry_delay = self._retry_delay(exception, status, reason, attempt)
+                    if retry_delay is not None:
+                        retry.append(index)
+                        delay = max(delay, retry_delay)
+                        continue
+                    results[index] = BatchItemResult(
+                        error=GoogleCalendarError(
+                            f"Google Calendar API error during {operations[index][0]}.",
+                            status=status,
+                            reason=reason,
+                        )
+                    )
+            if not retry:
+                break
+            time.sleep(delay)
+            pending = sorted(retry)
+        return results
+
+    def write_through(self, event: dict, recurrence: list[str] | None = None) -> None:
+        store = self._stores.get(self._settings.default_calendar_id)
+        if store is None or not store.synced:
+            return
+        if recurrence:
+            # The store holds single instances; let the next (incremental) sync bring the series in.
+            store.expire()
+        else:
+            store.upsert(event)
+
+    def forget(self, event_id: str) -> None:
+        store = self._stores.get(self._settings.default_calendar_id)
+        if store is not None:
+            store.remove(event_id)
+
+    def list_events(
+        self,
+        time_min,
+        max_results=5,
+        *,
+        fields: str | None = None,
+        calendar_ids: list[str] | None = None,
+    ):
+        """
+        The next `max_results` events from `time_min`. With several calendars
+        (`calendar_ids`, or the configured `CALENDAR_IDS`) each is read
+        concurrently and the results are merged, tagged with `calendar_id`.
+        """
+        calendar_ids = self._calendar_ids(calendar_ids)
+        tz = self._settings.tzinfo
+
+        def read(calendar_id: str) -> list[Event]:
+            store = self._store_for(fields, calendar_id)
+            if store is not None:
+                return store.upcoming(time_min, max_results)
+
+            # Ask for just enough items that a single page usually answers the call.
+            page_size = min(max_results, self._MAX_PAGE_SIZE)
+            params = self._list_params(time_min, None, page_size, fields or list_mask("list_events"), calendar_id)
+            return list(islice(self._iter_parsed("list_events", params, tz), max_results))
+
+        if len(calendar_ids) == 1:
+            return read(calendar_ids[0])
+        listings = self._each_calendar(calendar_ids, read)
+        return list(islice(merge_by_start(listings), max_results))
         
-    def list_from_to(self, time_min, time_max):
-        response = self._execute(
-            "list_from_to",
-            self._service.events().list(
-                calendarId=self._settings.default_calendar_id,
-                timeMin=time_min,
-                timeMax=time_max,
-                singleEvents=True,
-                orderBy="startTime",
-            ),
+    def list_from_to(
+        self,
+        time_min,
+        time_max,
+        *,
+        fields: str | None = None,
+        calendar_ids: list[str] | None = None,
+    ):
+        """The events overlapping [time_min, time_max), merged across calendars like `list_events`."""
+        calendar_ids = self._calendar_ids(calendar_ids)
+        tz = self._settings.tzinfo
+
+        def read(calendar_id: str) -> list[Event]:
+            store = self._store_for(fields, calendar_id)
+            if store is not None:
+                return store.window(time_min, time_max)
+
+            params = self._list_params(time_min, time_max, 250, fields or list_mask("list_from_to"), calendar_id)
+            return list(self._iter_parsed("list_from_to", params, tz))
+
+        if len(calendar_ids) == 1:
+            return read(calendar_ids[0])
+        return list(merge_by_start(self._each_calendar(calendar_ids, read)))
+
+    def _calendar_ids(self, calendar_ids: list[str] | None) -> list[str]:
+        return list(dict.fromkeys(calendar_ids or self._settings.read_calendar_ids))
+
+    def _each_calendar(self, calendar_ids: list[str], read: Callable[[str], _T]) -> dict[str, _T]:
+        """Run `read` for every calendar on its own thread; results keep `calendar_ids`' order."""
+        workers = min(len(calendar_ids), self._MAX_FAN_OUT)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="calendar-fan-out") as executor:
+            # Each thread must see the caller's settings overrides and acting user.
+            futures = {
+                calendar_id: executor.submit(contextvars.copy_context().run, read, calendar_id)
+                for calendar_id in calendar_ids
+            }
+            return {calendar_id: future.result() for calendar_id, future in futures.items()}
+
+    def iter_events(
+        self,
+        time_min=None,
+        time_max=None,
+        *,
+        page_size: int = 250,
+        fields: str | None = None,
+        prefetch: bool = False,
+        operation: str = "iter_events",
+        calendar_id: str | None = None,
+    ) -> Iterator[dict]:
+        """
+        Stream the events between `time_min` and `time_max` in start order,
+        following `nextPageToken` lazily so only one page is held at a time.
+
+        With `prefetch=True` the next page is requested on a background thread
+        while the current one is being consumed. `fields` defaults to the
+        listing mask; pass "*" for full event resources.
+        """
+        params = self._list_params(time_min, time_max, page_size, fields or list_mask("list_events"), calendar_id)
+        for response in self._iter_pages(operation, params, prefetch=prefetch):
+            yield from response.get("items", [])
+
+    def _iter_parsed(self, operation: str, params: dict, tz) -> Iterator[Event]:
+        """Like `iter_events`, but each page's items are decoded straight into `Event`s."""
+        from app.services.response_model import EventListModel
+
+        for response in self._iter_pages(operation, params, model=EventListModel(tz)):
+            yield from response.get("items", [])
+
+    def _list_params(self, time_min, time_max, page_size: int, fields: str, calendar_id: str | None) -> dict:
+        params = {
+            "calendarId": calendar_id or self._settings.default_calendar_id,
+            "singleEvents": True,
+            "orderBy": "startTime",
+            "maxResults": page_size,
+            "fields": fields,
+        }
+        if time_min is not None:
+            params["timeMin"] = time_min
+        if time_max is not None:
+            params["timeMax"] = time_max
+        return params
+
+    def _iter_pages(self, operation: str, params: dict, *, prefetch: bool = False, model=None) -> Iterator[dict]:
+        def fetch(page_token: str | None) -> dict:
+            request = self._service.events().list(pageToken=page_token, **params)
+            if model is not None:
+                request.postproc = model.response
+            return self._execute(operation, request)
+
+        if not prefetch:
+            page_token = None
+            while True:
+                response = fetch(page_token)
+                yield response
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    return
+
+        # The prefetch thread must see the caller's settings overrides.
+        context = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="calendar-prefetch") as executor:
+            pending = executor.submit(context.run, fetch, None)
+            while pending is not None:
+                response = pending.result()
+                page_token = response.get("nextPageToken")
+                pending = executor.submit(context.run, fetch, page_token) if page_token else None
+                yield response
+
+    def find_conflicts(
+        self,
+        windows: list[Window],
+        *,
+        include_all_day: bool = False,
+        calendar_ids: list[str] | None = None,
+    ) -> list[list[Event]]:
+        """
+        Return the busy events overlapping each (start, end) window, one list per
+        window. Transparent, declined and cancelled events never conflict.
+        Several calendars are checked concurrently; their conflicts are merged
+        in start order and tagged with `calendar_id`.
+        """
+        if not windows:
+            return []
+        tz = self._settings.tzinfo
+        calendar_ids = self._calendar_ids(calendar_ids)
+
+        def check(calendar_id: str) -> list[list[Event]]:
+            store = self._fresh_store(calendar_id)
+            if store is not None:
+                index = store.busy_index(include_all_day=include_all_day)
+            else:
+                time_min = min(windows, key=lambda window: to_timestamp(window[0], tz))[0]
+                time_max = max(windows, key=lambda window: to_timestamp(window[1], tz))[1]
+                listing = self.list_from_to(
+                    _isoformat(time_min),
+                    _isoformat(time_max),
+                    fields=list_mask("conflicts"),
+                    calendar_ids=[calendar_id],
+                )
+                index = busy_index(listing, include_all_day=include_all_day)
+            return find_conflicts(index, windows, tz)
+
+        if len(calendar_ids) == 1:
+            return check(calendar_ids[0])
+        per_calendar = self._each_calendar(calendar_ids, check)
+        return [
+            list(merge_by_start({calendar_id: found[i] for calendar_id, found in per_calendar.items()}))
+            for i in range(len(windows))
+        ]
+
+    def free_busy(self, time_min, time_max, calendar_ids: list[str] | None = None) -> dict[str, list[dict]]:
+        """
+        Return the busy intervals of each calendar in one `freebusy().query`
+        call, keyed by calendar id.
+        """
+        calendar_ids = calendar_ids or [self._settings.default_calendar_id]
+        response = self._execute("free_busy", self.free_busy_request(time_min, time_max, calendar_ids))
+        return self.parse_free_busy(response, calendar_ids)
+
+    def free_busy_request(self, time_min, time_max, calendar_ids: list[str]):
+        return self._service.freebusy().query(
+            body={
+                "timeMin": time_min,
+                "timeMax": time_max,
+                "timeZone": self._settings.timezone,
+                "items": [{"id": calendar_id} for calendar_id in calendar_ids],
+            },
+            fields=FREE_BUSY_FIELDS,
         )
-        return response.get("items", [])
-        
+
+    @staticmethod
+    def parse_free_busy(response: dict, calendar_ids: list[str]) -> dict[str, list[dict]]:
+        busy = {}
+        for calendar_id in calendar_ids:
+            calendar = response.get("calendars", {}).get(calendar_id, {})
+            if calendar.get("errors"):
+                raise GoogleCalendarError(
+                    f"Google Calendar could not read free/busy for {calendar_id}.",
+                    reason="; ".join(str(error.get("reason")) for error in calendar["errors"]),
+                )
+            busy[calendar_id] = calendar.get("busy", [])
+        return busy
+
     def delete_event(self, event_id: str):
-        return self._execute(
-            "delete_event",
-            self._service.events().delete(
-                calendarId=self._settings.default_calendar_id,
-                eventId=event_id,
-            ),
-        )
+        result = self._execute("delete_event", self.delete_request(event_id))
+        self.forget(event_id)
+        return result
         
-    def get_event(self, event_id: str):
-        return self._execute(
-            "get_event",
-            self._service.events().get(
-                calendarId=self._settings.default_calendar_id,
-                eventId=event_id,
-            ),
-        )
+    def get_event(self, event_id: str, *, fields: str | None = None):
+        return self._execute("get_event", self.get_request(event_id, fields))
+
+    def _store_for(self, fields: str | None, calendar_id: str) -> EventStore | None:
+        # The store keeps the busy-time fields, so it answers the listing and
+        # conflict masks; a caller asking for another mask may need fields it lacks.
+        if fields is not None and fields not in _STORE_MASKS:
+            return None
+        return self._fresh_store(calendar_id)
+
+    def _fresh_store(self, calendar_id: str) -> EventStore | None:
+        """
+        Return the local store for `calendar_id`, syncing it first if it is older
+        than the configured staleness bound. Returns None when caching is off.
+        """
+        if not self._settings.event_cache_enabled:
+            return None
+        store = self._store(calendar_id)
+        max_staleness = self._settings.event_cache_max_staleness_seconds
+        if store.is_stale(max_staleness):
+            # Concurrent readers of a stale store share one sync: the others
+            # wait for it and then find the store fresh.
+            store.refresh(partial(self._sync_changes, calendar_id), max_staleness_seconds=max_staleness)
+        return store
+
+    def _store(self, calendar_id: str) -> EventStore:
+        with self._stores_lock:
+            store = self._stores.get(calendar_id)
+            if store is None:
+                store = self._stores[calendar_id] = EventStore(calendar_id, self._settings.tzinfo)
+            return store
+
+    def sync(self, calendar_id: str | None = None) -> None:
+        """
+        Bring the local store up to date now: a full sync the first time, then
+        incremental syncs driven by Google's `nextSyncToken`.
+        """
+        calendar_id = calendar_id or self._settings.default_calendar_id
+        self._store(calendar_id).refresh(partial(self._sync_changes, calendar_id))
+
+    def _sync_changes(self, calendar_id: str, sync_token: str | None) -> tuple[list[dict], str | None, bool]:
+        """`EventStore.refresh` fetcher: changes since `sync_token`, or everything."""
+        try:
+            return (*self._fetch_changes(calendar_id, sync_token), sync_token is None)
+        except GoogleCalendarError as exc:
+            if exc.status != 410 or sync_token is None:
+                raise
+        # 410 Gone: the sync token expired, start over with a full sync.
+        return (*self._fetch_changes(calendar_id, None), True)
+
+    def _fetch_changes(self, calendar_id: str, sync_token: str | None) -> tuple[list[dict], str | None]:
+        params = {
+            "calendarId": calendar_id,
+            "singleEvents": True,
+            "maxResults": self._MAX_PAGE_SIZE,
+            "fields": list_mask("sync_events", sync=True),
+        }
+        if sync_token:
+            params["syncToken"] = sync_token
+
+        items: list[dict] = []
+        next_sync_token = None
+        for response in self._iter_pages("sync_events", params, prefetch=True):
+            items.extend(response.get("items", []))
+            next_sync_token = response.get("nextSyncToken")
+        return items, next_sync_token
 
     @staticmethod
     def _http_error_details(error: HttpError) -> tuple[int | None, str | None]:
@@ -108,24 +656,48 @@ class GoogleCalendarClient:
             reason = str(error.content)
         return status, reason
 
-    def _execute(self, operation: str, request):
-        for attempt in range(self._MAX_RETRIES + 1):
-            try:
-                return request.execute()
-            except HttpError as exc:
-                status, reason = self._http_error_details(exc)
-                if status in {429, 500, 502, 503, 504} and attempt < self._MAX_RETRIES:
-                    # Exponential backoff with jitter for transient failures.
-                    backoff = self._BASE_BACKOFF_SECONDS * (2 ** attempt)
-                    time.sleep(backoff + random.uniform(0, backoff))
+    def _backoff_seconds(self, attempt: int) -> float:
+        # Exponential backoff with jitter for transient failures.
+        backoff = self._BASE_BACKOFF_SECONDS * (2 ** attempt)
+        return backoff + random.uniform(0, backoff)
+
+    @staticmethod
+    def _is_throttled(status: int | None, reason: str | None) -> bool:
+        # Calendar reports quota exhaustion as 429 or as 403 rateLimitExceeded.
+        return status == 429 or (status == 403 and "ratelimitexceeded" in (reason or "").lower())
+
+    def _retry_delay(self, error: HttpError, status: int | None, reason: str | None, attempt: int) -> float | None:
+        """
+        Seconds to wait before retrying a failed attempt, or None to give up.
+        Throttling slows the shared limiter down and honors Retry-After.
+        """
+        throttled = self._is_throttled(status, reason)
+        retry_after = retry_after_seconds(error.resp)
+        if throttled:
+            self._limiter.on_throttle(retry_after)
+        if not (throttled or status in self._RETRYABLE_STATUSES) or attempt >= self._MAX_RETRIES:
+            return None
+        if not self._limiter.try_retry():
+            return None
+        return max(self._backoff_seconds(attempt), retry_after or 0.0)
+
+    def execute_once(self, request):
+        self._refresh_credentials()
+        return request.execute(http=self._http())
+
+    def api_call(self, operation: str, *, cost: int = 1) -> ApiCall:
+        return ApiCall(self, operation, cost=cost)
+
+    def _execute(self, operation: str, request, *, cost: int = 1):
+        with self.api_call(operation, cost=cost) as call:
+            while True:
+                wait = call.throttle()
+                if wait:
+                    time.sleep(wait)
+                try:
+                    result = self.execute_once(request)
+                except (HttpError, RefreshError) as exc:
+                    time.sleep(call.failed(exc))
                     continue
-                raise GoogleCalendarError(
-                    f"Google Calendar API error during {operation}.",
-                    status=status,
-                    reason=reason,
-                ) from exc
-            except RefreshError as exc:
-                raise GoogleCalendarError(
-                    "Google Calendar credentials expired or invalid.",
-                    reason=str(exc),
-                ) from exc
+                call.succeeded()
+                return result
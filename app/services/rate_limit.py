@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from app.config.settings import load_settings
+
+
+class RateLimiter:
+    """
+    Process-wide token bucket with AIMD rate control and a retry budget.
+
+    Every HTTP attempt takes `cost` tokens; the refill rate grows additively
+    after successes and is halved on throttling (429 / rate-limit 403), so
+    concurrent callers back off together instead of in lockstep. Retries draw
+    from a separate budget that earns `retry_ratio` tokens per request, which
+    caps retries at roughly that fraction of traffic.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = 10.0,
+        min_rate: float = 0.5,
+        max_rate: float | None = None,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+        retry_ratio: float = 0.1,
+        retry_burst: float = 10.0,
+    ):
+        self._lock = threading.Lock()
+        self._max_rate = max_rate if max_rate is not None else rate
+        self._min_rate = min(min_rate, self._max_rate)
+        self._increase = increase
+        self._decrease = decrease
+        self._retry_ratio = retry_ratio
+        self._retry_burst = retry_burst
+
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._retry_tokens = retry_burst
+
+        self.requests = 0
+        self.retries = 0
+        self.retries_denied = 0
+        self.throttled = 0
+        self.waited_seconds = 0.0
+
+    def reserve(self, cost: float = 1.0) -> float:
+        """Take `cost` tokens and return how long the caller must wait first."""
+        with self._lock:
+            now = time.monotonic()
+            capacity = max(self.rate, 1.0)
+            self._tokens = min(capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= cost
+            delay = max(0.0, -self._tokens / self.rate, self._paused_until - now)
+
+            self.requests += int(cost)
+            self._retry_tokens = min(self._retry_burst, self._retry_tokens + cost * self._retry_ratio)
+            self.waited_seconds += delay
+            return delay
+
+    def acquire(self, cost: float = 1.0) -> None:
+        delay = self.reserve(cost)
+        if delay:
+            time.sleep(delay)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self._max_rate, self.rate + self._increase)
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        """Halve the rate and, if the server said so, hold every caller back."""
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self._min_rate, self.rate * self._decrease)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+    def try_retry(self) -> bool:
+        """Spend one token from the retry budget; False means give up now."""
+        with self._lock:
+            if self._retry_tokens < 1.0 - 1e-9:
+                self.retries_denied += 1
+                return False
+            self._retry_tokens -= 1.0
+            self.retries += 1
+            return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "rate": round(self.rate, 3),
+                "requests": self.requests,
+                "retries": self.retries,
+                "retries_denied": self.retries_denied,
+                "throttled": self.throttled,
+                "waited_seconds": round(self.waited_seconds, 3),
+                "retry_budget": round(self._retry_tokens, 3),
+            }
+
+
+def retry_after_seconds(headers) -> float | None:
+    """Parse a Retry-After header (delta seconds or HTTP date) from a response."""
+    getter = getattr(headers, "get", None)
+    value = getter("retry-after") if getter else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+_lock = threading.Lock()
+_limiter: RateLimiter | None = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the limiter shared by every calendar client in this process."""
+    global _limiter
+    limiter = _limiter
+    if limiter is None:
+        settings = load_settings()
+        with _lock:
+            if _limiter is None:
+                _limiter = RateLimiter(
+                    rate=settings.calendar_max_qps,
+                    retry_ratio=settings.calendar_retry_budget_ratio,
+                )
+            limiter = _limiter
+    return limiter
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import calendar
+import math
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone, tzinfo
+
+from app.services.event_times import to_timestamp
+
+_WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+_FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+_SUPPORTED = {"FREQ", "INTERVAL", "COUNT", "UNTIL", "BYDAY", "BYMONTHDAY", "BYMONTH", "WKST"}
+
+# Expansion stops here for rules without COUNT/UNTIL (and as a guard for long ones).
+MAX_OCCURRENCES = 1000
+
+
+class RecurrenceError(ValueError):
+    """An RRULE this module can't parse or expand."""
+
+
+@dataclass(frozen=True)
+class RRule:
+    """
+    The subset of RFC 5545 recurrence rules the agent creates: FREQ with
+    INTERVAL, COUNT or UNTIL, and BYDAY / BYMONTHDAY / BYMONTH filters
+    ("every weekday", "the last Friday of each month", "every 15th").
+    """
+
+    freq: str
+    interval: int = 1
+    count: int | None = None
+    until: datetime | date | None = None
+    by_day: tuple[tuple[int | None, int], ...] = ()
+    by_month_day: tuple[int, ...] = ()
+    by_month: tuple[int, ...] = ()
+
+    @property
+    def bounded(self) -> bool:
+        return self.count is not None or self.until is not None
+
+
+def _int_list(value: str, name: str, low: int, high: int, *, signed: bool = False) -> tuple[int, ...]:
+    try:
+        numbers = tuple(int(part) for part in value.split(","))
+    except ValueError:
+        raise RecurrenceError(f"{name} must be a list of numbers.") from None
+    for number in numbers:
+        if not (low <= abs(number) <= high if signed else low <= number <= high):
+            raise RecurrenceError(f"{name} value {number} is out of range.")
+    return numbers
+
+
+def _until(value: str) -> datetime | date:
+    try:
+        if "T" not in value:
+            return datetime.strptime(value, "%Y%m%d").date()
+        if value.endswith("Z"):
+            return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+        return datetime.strptime(value, "%Y%m%dT%H%M%S")
+    except ValueError:
+        raise RecurrenceError(f"UNTIL {value!r} must be YYYYMMDD or YYYYMMDDTHHMMSS[Z].") from None
+
+
+def parse_rrule(text: str) -> RRule:
+    """Parse `FREQ=WEEKLY;BYDAY=MO,WE` (an `RRULE:` prefix is allowed)."""
+    body = text.strip()
+    if body.upper().startswith("RRULE:"):
+        body = body[len("RRULE:"):]
+    parts = {}
+    for part in filter(None, body.split(";")):
+        name, sep, value = part.partition("=")
+        if not sep or not value:
+            raise RecurrenceError(f"Malformed RRULE part {part!r}.")
+        parts[name.strip().upper()] = value.strip().upper()
+
+    unsupported = set(parts) - _SUPPORTED
+    if unsupported:
+        raise RecurrenceError(f"Unsupported RRULE parts: {', '.join(sorted(unsupported))}.")
+    freq = parts.get("FREQ")
+    if freq not in _FREQUENCIES:
+        raise RecurrenceError("FREQ must be DAILY, WEEKLY, MONTHLY or YEARLY.")
+    if "COUNT" in parts and "UNTIL" in parts:
+        raise RecurrenceError("COUNT and UNTIL can't both be set.")
+    if parts.get("WKST", "MO") != "MO":
+        raise RecurrenceError("Only WKST=MO is supported.")
+
+    by_day = []
+    for item in filter(None, parts.get("BYDAY", "").split(",")):
+        weekday = _WEEKDAYS.get(item[-2:])
+        ordinal = item[:-2]
+        if weekday is None or (ordinal and not ordinal.lstrip("+-").isdigit()):
+            raise RecurrenceError(f"BYDAY value {item!r} is not valid.")
+        number = int(ordinal) if ordinal else None
+        if number is not None and (freq not in ("MONTHLY", "YEARLY") or not 1 <= abs(number) <= 5):
+            raise RecurrenceError("Numbered BYDAY values (e.g. 1MO, -1FR) need FREQ=MONTHLY or YEARLY and -5..5.")
+        by_day.append((number, weekday))
+
+    rule = RRule(
+        freq=freq,
+        interval=_int_list(parts.get("INTERVAL", "1"), "INTERVAL", 1, 1000)[0],
+        count=_int_list(parts["COUNT"], "COUNT", 1, MAX_OCCURRENCES)[0] if "COUNT" in parts else None,
+        until=_until(parts["UNTIL"]) if "UNTIL" in parts else None,
+        by_day=tuple(by_day),
+        by_month_day=_int_list(parts["BYMONTHDAY"], "BYMONTHDAY", 1, 31, signed=True) if "BYMONTHDAY" in parts else (),
+        by_month=_int_list(parts["BYMONTH"], "BYMONTH", 1, 12) if "BYMONTH" in parts else (),
+    )
+    if rule.freq == "YEARLY" and any(n is not None for n, _ in rule.by_day) and not rule.by_month:
+        raise RecurrenceError("Numbered BYDAY values with FREQ=YEARLY need BYMONTH.")
+    if rule.freq == "WEEKLY" and rule.by_month_day:
+        raise RecurrenceError("BYMONTHDAY can't be used with FREQ=WEEKLY.")
+    return rule
+
+
+def format_rrule(rule: str) -> str:
+    """Validate `rule` and return it as a Calendar API recurrence line."""
+    parse_rrule(rule)
+    body = rule.strip()
+    if body.upper().startswith("RRULE:"):
+        body = body[len("RRULE:"):]
+    return f"RRULE:{body.upper()}"
+
+
+def _month_days(year: int, month: int, rule: RRule, default_day: int) -> list[int]:
+    """Days of one month matched by a MONTHLY/YEARLY rule."""
+    length = calendar.monthrange(year, month)[1]
+    if rule.by_month_day:
+        days = {day if day > 0 else length + day + 1 for day in rule.by_month_day}
+        days = {day for day in days if 1 <= day <= length}
+        if rule.by_day:
+            days = {day for day in days if date(year, month, day).weekday() in {w for _, w in rule.by_day}}
+        return sorted(days)
+    if rule.by_day:
+        days = set()
+        for ordinal, weekday in rule.by_day:
+            matching = [day for day in range(1, length + 1) if date(year, month, day).weekday() == weekday]
+            if ordinal is None:
+                days.update(matching)
+            elif abs(ordinal) <= len(matching):
+                days.add(matching[ordinal - 1] if ordinal > 0 else matching[ordinal])
+        return sorted(days)
+    # e.g. the 31st of a shorter month: no occurrence that month (RFC 5545).
+    return [default_day] if default_day <= length else []
+
+
+def _periods(rule: RRule, first: date):
+    """Candidate dates, one period (day, week, month, year) at a time, in order."""
+    step = rule.interval
+    if rule.freq == "DAILY":
+        day = first
+        while True:
+            yield [day]
+            day += timedelta(days=step)
+    elif rule.freq == "WEEKLY":
+        weekdays = sorted({w for _, w in rule.by_day}) or [first.weekday()]
+        monday = first - timedelta(days=first.weekday())
+        while True:
+            yield [monday + timedelta(days=w) for w in weekdays]
+            monday += timedelta(weeks=step)
+    elif rule.freq == "MONTHLY":
+        year, month = first.year, first.month
+        while True:
+            yield [date(year, month, day) for day in _month_days(year, month, rule, first.day)]
+            month += step
+            year, month = year + (month - 1) // 12, (month - 1) % 12 + 1
+    else:
+        # Without BYMONTH, BYDAY/BYMONTHDAY match in every month of the year
+        # (FREQ=YEARLY;BYDAY=MO is every Monday); a bare rule keeps DTSTART's month.
+        months = rule.by_month or (range(1, 13) if rule.by_day or rule.by_month_day else (first.month,))
+        year = first.year
+        while True:
+            days = []
+            for month in months:
+                days.extend(date(year, month, day) for day in _month_days(year, month, rule, first.day))
+            yield sorted(days)
+            year += step
+
+
+def _matches(rule: RRule, day: date) -> bool:
+    if rule.by_month and day.month not in rule.by_month:
+        return False
+    if rule.freq == "DAILY":
+        if rule.by_day and day.weekday() not in {w for _, w in rule.by_day}:
+            return False
+        if rule.by_month_day:
+            length = calendar.monthrange(day.year, day.month)[1]
+            if not {d if d > 0 else length + d + 1 for d in rule.by_month_day} & {day.day}:
+                return False
+    return True
+
+
+def _past_until(rule: RRule, occurrence: datetime) -> bool:
+    if rule.until is None:
+        return False
+    if isinstance(rule.until, datetime):
+        if rule.until.tzinfo is None:
+            return occurrence.replace(tzinfo=None) > rule.until
+        return occurrence > rule.until
+    return occurrence.date() > rule.until
+
+
+# The sparsest satisfiable rules (Feb 29 on a given weekday) recur about every 28 years.
+_SEARCH_YEARS = 30
+_PERIODS_PER_YEAR = {"DAILY": 366, "WEEKLY": 53, "MONTHLY": 12, "YEARLY": 1}
+
+
+def expand(rule: RRule, start: datetime, *, limit: int = MAX_OCCURRENCES) -> list[datetime]:
+    """
+    Start times of the series beginning at `start` (an aware datetime), in
+    order. Occurrences keep `start`'s wall-clock time in its zone, so a 9:00
+    standup stays at 9:00 across DST changes. At most `limit` are returned.
+    """
+    tz: tzinfo = start.tzinfo
+    wanted = min(limit, rule.count or limit)
+    # Give up on rules that match nothing (e.g. BYMONTHDAY=31;BYMONTH=2) instead
+    # of looping forever, after a calendar span without a match rather than a
+    # fixed number of periods, so sparse DAILY rules are not cut short.
+    max_empty_periods = math.ceil(_SEARCH_YEARS * _PERIODS_PER_YEAR[rule.freq] / rule.interval)
+    empty_periods = 0
+    occurrences: list[datetime] = []
+    for period in _periods(rule, start.date()):
+        found = False
+        for day in period:
+            if day < start.date() or not _matches(rule, day):
+                continue
+            found = True
+            occurrence = datetime.combine(day, start.time(), tzinfo=tz)
+            if _past_until(rule, occurrence):
+                return occurrences
+            occurrences.append(occurrence)
+            if len(occurrences) >= wanted:
+                return occurrences
+        empty_periods = 0 if found else empty_periods + 1
+        if empty_periods > max_empty_periods:
+            return occurrences
+    return occurrences
+
+
+def series_window(start_time: str, end_time: str, recurrence: list[str] | None, tz: tzinfo) -> tuple[float, float]:
+    """
+    Epoch seconds from the first start to the last end of an event being
+    created: its own bounds, or the whole series (open-ended when the RRULE
+    has no COUNT/UNTIL). EXDATE lines only remove instances, so they are ignored.
+    """
+    start, end = to_timestamp(start_time, tz), to_timestamp(end_time, tz)
+    rules = [line for line in recurrence or () if line.upper().startswith("RRULE:")]
+    if not rules:
+        return start, end
+    first = datetime.fromtimestamp(start, tz)
+    last = start
+    for line in rules:
+        rule = parse_rrule(line)
+        occurrences = expand(rule, first)
+        if not rule.bounded or len(occurrences) >= MAX_OCCURRENCES:
+            return start, math.inf
+        if occurrences:
+            last = max(last, occurrences[-1].timestamp())
+    return start, last + (end - start)
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Iterable
+
+from app.config.settings import Settings, load_settings
+from app.services.client_provider import current_user
+from app.services.event_times import event_bounds
+from app.services.recurrence import series_window
+
+# A time range in epoch seconds; open-ended ranges use +/- infinity.
+Window = tuple[float, float]
+EVERYTHING: Window = (-math.inf, math.inf)
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+@dataclass
+class _Entry:
+    reply: str
+    windows: tuple[Window, ...]
+    expires_at: float
+    group: Hashable | None
+    embedding: list[float] | None
+
+
+class ResponseCache:
+    """
+    Replies to read-only questions, reused while the answer can't have changed.
+
+    Entries are scoped to the acting user and calendar, and remember the time
+    windows the answer was computed from. Mutating tools call `invalidate`
+    with the window they touched, which drops every overlapping entry; TTL
+    covers changes made outside this process, and LRU order bounds the size.
+
+    With an `embed` function, a lookup that misses its exact key falls back
+    to the most similar cached prompt of the same `group`, provided the cosine
+    similarity reaches `similarity`. The group must pin down everything the
+    embedding may blur: the agent uses the day plus the prompt's resolved
+    dates, times, spans and counts (`router.when_terms`).
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 120.0,
+        max_entries: int = 512,
+        embed: Callable[[str], list[float]] | None = None,
+        similarity: float = 0.92,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.similarity = similarity
+        self._embed = embed
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        # Prompt embeddings, so the vector computed for a miss is reused by the `put` that follows.
+        self._embeddings: OrderedDict[str, list[float]] = OrderedDict()
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        # Bumped by every `invalidate`; `put` skips answers computed before a mutation.
+        self.generation = 0
+
+    @staticmethod
+    def scope() -> tuple[str | None, str]:
+        """Whose answers are being cached: (acting user, calendar id)."""
+        return current_user(), load_settings().default_calendar_id
+
+    def get(self, key: Hashable, *, text: str | None = None, group: Hashable | None = None) -> str | None:
+        scope = self.scope()
+        now = self._clock()
+        with self._lock:
+            entry = self._live((scope, key), now)
+            if entry is not None:
+                self._entries.move_to_end((scope, key))
+                self.hits += 1
+                return entry.reply
+        if self._embed is None or text is None or group is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        vector = self._embedding(text)
+        with self._lock:
+            best, best_score = None, self.similarity
+            for (entry_scope, entry_key), entry in self._entries.items():
+                if entry_scope != scope or entry.group != group or entry.embedding is None:
+                    continue
+                if entry.expires_at <= now:
+                    continue
+                score = _cosine(vector, entry.embedding)
+                if score >= best_score:
+                    best, best_score = (entry_scope, entry_key), score
+            if best is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(best)
+            self.similar_hits += 1
+            return self._entries[best].reply
+
+    def put(
+        self,
+        key: Hashable,
+        reply: str,
+        windows: Iterable[Window],
+        *,
+        text: str | None = None,
+        group: Hashable | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Cache `reply`, computed from `windows`. Pass the `generation` read before
+        computing it so an answer that raced a mutation is not stored.
+        """
+        embedding = None
+        if self._embed is not None and text is not None and group is not None:
+            embedding = self._embedding(text)
+        entry = _Entry(reply, tuple(windows), self._clock() + self.ttl_seconds, group, embedding)
+        scoped = (self.scope(), key)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[scoped] = entry
+            self._entries.move_to_end(scoped)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, start: float, end: float) -> int:
+        """Drop the current scope's entries computed from anything overlapping [start, end)."""
+        scope = self.scope()
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if key[0] == scope and any(w_start < end and start < w_end for w_start, w_end in entry.windows)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.generation += 1
+            self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._embeddings.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.similar_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "similar_hits": self.similar_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.similar_hits) / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+    def _live(self, key: tuple, now: float) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= now:
+            del self._entries[key]
+            return None
+        return entry
+
+    def _embedding(self, text: str) -> list[float]:
+        with self._lock:
+            vector = self._embeddings.get(text)
+        if vector is None:
+            # Outside the lock: this is usually a network call.
+            vector = self._embed(text)
+        with self._lock:
+            self._embeddings[text] = vector
+            self._embeddings.move_to_end(text)
+            while len(self._embeddings) > self.max_entries:
+                self._embeddings.popitem(last=False)
+        return vector
+
+
+def _embedder(settings: Settings) -> Callable[[str], list[float]] | None:
+    if not settings.response_cache_embedding_model:
+        return None
+    from langchain_openai import OpenAIEmbeddings
+
+    return OpenAIEmbeddings(model=settings.response_cache_embedding_model, api_key=settings.openai_api).embed_query
+
+
+_lock = threading.Lock()
+_cache: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache, so every agent shares (and invalidates) one."""
+    global _cache
+    cache = _cache
+    if cache is None:
+        with _lock:
+            if _cache is None:
+                settings = load_settings()
+                _cache = ResponseCache(
+                    ttl_seconds=settings.response_cache_ttl_seconds,
+                    max_entries=settings.response_cache_max_entries,
+                    embed=_embedder(settings),
+                    similarity=settings.response_cache_similarity,
+                )
+            cache = _cache
+    return cache
+
+
+def set_response_cache(cache: ResponseCache | None) -> None:
+    """Install `cache` as the shared instance (e.g. in tests)."""
+    global _cache
+    with _lock:
+        _cache = cache
+
+
+def invalidate_window(start: float, end: float) -> None:
+    """Tell the cache (if one is in use) that events in [start, end) changed."""
+    cache = _cache
+    if cache is not None:
+        cache.invalidate(start, end)
+
+
+def invalidate_times(start_time: str, end_time: str, recurrence: list[str] | None = None) -> None:
+    """`invalidate_window` for the RFC 3339 bounds of an event (or series) being created."""
+    invalidate_window(*series_window(start_time, end_time, recurrence, load_settings().tzinfo))
+
+
+def invalidate_event(event: dict) -> None:
+    """`invalidate_window` for an event resource; without usable times, the whole calendar."""
+    try:
+        start, end = event_bounds(event, load_settings().tzinfo)
+    except (KeyError, TypeError, ValueError):
+        start, end = EVERYTHING
+    invalidate_window(start, end)
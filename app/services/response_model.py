@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from datetime import tzinfo
+
+import orjson
+from googleapiclient.model import JsonModel
+
+from app.services.events import Event
+
+
+class OrjsonModel(JsonModel):
+    """
+    `JsonModel` that decodes response bodies with orjson, straight from the
+    bytes httplib2 hands over. Request bodies are small and still go through
+    the stdlib encoder.
+    """
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Same fallback as `JsonModel`: hand back the undecoded text.
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+class EventListModel(OrjsonModel):
+    """
+    Decodes an `events().list` page with its `items` already parsed into
+    `Event`s, so a listing never holds the resource dicts. Set per request
+    (`request.postproc = EventListModel(tz).response`), since only listings
+    that return `Event`s want it.
+    """
+
+    def __init__(self, tz: tzinfo):
+        super().__init__()
+        self._tz = tz
+
+    def deserialize(self, content):
+        body = super().deserialize(content)
+        if isinstance(body, dict) and "items" in body:
+            tz = self._tz
+            body["items"] = [Event.from_api(item, tz) for item in body["items"]]
+        return body
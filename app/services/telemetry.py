@@ -0,0 +1,307 @@
+"""
+Metrics and tracing: where a slow turn spent its time.
+
+`span(name, metric=..., **labels)` times a block and, when it closes, records
+its duration in the `metric` histogram. Spans nest through a context variable
+(which worker threads and asyncio tasks inherit), so one agent turn becomes a
+tree: the turn, its model calls and tool calls, and the Calendar API requests
+each tool made. Finished root spans go to the exporters (`TRACE_LOG` writes
+them as JSON lines); `prometheus_text` renders the metrics for `/metrics`.
+
+Recorded metrics:
+
+    calendar_api_seconds{operation}             per API operation, retries included
+    calendar_api_retries_total{operation}
+    calendar_api_backoff_seconds_total{operation}
+    calendar_api_errors_total{operation,status}
+    tool_seconds{tool}, tool_errors_total{tool}
+    llm_seconds{model}, llm_tokens_total{model,kind}
+    turn_seconds{path}, turn_llm_tokens{kind}   path: cache, fast_path or llm
+"""
+from __future__ import annotations
+
+import bisect
+import functools
+import inspect
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Protocol, TextIO
+
+from app.config.settings import load_settings
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2500, 5000, 10000, 25000)
+
+_Labels = tuple[tuple[str, str], ...]
+
+
+def _labels(labels: dict[str, Any]) -> _Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+class Histogram:
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else 0.0,
+            "max": round(self.max, 6),
+            "buckets": dict(zip([*map(str, self.bounds), "+Inf"], self.counts)),
+        }
+
+
+class Metrics:
+    """Process-wide histograms and counters, keyed by name and labels."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: dict[str, dict[_Labels, Histogram]] = {}
+        self._counters: dict[str, dict[_Labels, float]] = {}
+
+    def observe(self, name: str, value: float, *, buckets: tuple[float, ...] = LATENCY_BUCKETS, **labels) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def increment(self, name: str, amount: float = 1.0, **labels) -> None:
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+
+    def snapshot(self) -> dict:
+        """JSON-ready copy: {"histograms": {name: [...]}, "counters": {name: [...]}}."""
+        with self._lock:
+            return {
+                "histograms": {
+                    name: [{"labels": dict(key), **histogram.snapshot()} for key, histogram in series.items()]
+                    for name, series in self._histograms.items()
+                },
+                "counters": {
+                    name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                    for name, series in self._counters.items()
+                },
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+def _prometheus_labels(labels: dict[str, str], **extra: str) -> str:
+    pairs = {**labels, **extra}
+    if not pairs:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in pairs.values())
+    return "{" + ",".join(f'{key}="{value}"' for key, value in zip(pairs, escaped)) + "}"
+
+
+def prometheus_text(metrics: Metrics) -> str:
+    """Render `metrics` in the Prometheus text exposition format."""
+    snapshot = metrics.snapshot()
+    lines = []
+    for name, series in sorted(snapshot["histograms"].items()):
+        lines.append(f"# TYPE {name} histogram")
+        for item in series:
+            cumulative = 0
+            for bound, count in item["buckets"].items():
+                cumulative += count
+                lines.append(f"{name}_bucket{_prometheus_labels(item['labels'], le=bound)} {cumulative}")
+            lines.append(f"{name}_sum{_prometheus_labels(item['labels'])} {item['sum']}")
+            lines.append(f"{name}_count{_prometheus_labels(item['labels'])} {item['count']}")
+    for name, series in sorted(snapshot["counters"].items()):
+        lines.append(f"# TYPE {name} counter")
+        for item in series:
+            lines.append(f"{name}{_prometheus_labels(item['labels'])} {item['value']:g}")
+    return "\n".join(lines) + "\n"
+
+
+@dataclass
+class Span:
+    name: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.time)
+    duration: float | None = None
+    error: str | None = None
+    children: list[Span] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        data = {
+            "name": self.name,
+            "started_at": round(self.started_at, 6),
+            "duration_ms": round(self.duration * 1000, 3) if self.duration is not None else None,
+        }
+        if self.attributes:
+            data["attributes"] = self.attributes
+        if self.error:
+            data["error"] = self.error
+        if self.children:
+            data["children"] = [child.to_dict() for child in sorted(self.children, key=lambda s: s.started_at)]
+        return data
+
+
+class Exporter(Protocol):
+    def export(self, span: Span) -> None:
+        """Receive a finished root span (with its whole tree)."""
+
+
+class JsonLogExporter:
+    """Writes each finished root span as one JSON line."""
+
+    def __init__(self, stream: TextIO | None = None):
+        self._stream = stream or sys.stderr
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str, separators=(",", ":"))
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+
+_lock = threading.Lock()
+_metrics = Metrics()
+_exporters: list[Exporter] | None = None
+_current: ContextVar[Span | None] = ContextVar("telemetry_span", default=None)
+
+
+def get_metrics() -> Metrics:
+    return _metrics
+
+
+def _trace_sink(path: str) -> TextIO:
+    return sys.stderr if path == "-" else open(path, "a", encoding="utf-8")
+
+
+def get_exporters() -> list[Exporter]:
+    """The span exporters, built from `TRACE_LOG` on first use."""
+    global _exporters
+    exporters = _exporters
+    if exporters is None:
+        with _lock:
+            if _exporters is None:
+                trace_log = load_settings().trace_log
+                _exporters = [JsonLogExporter(_trace_sink(trace_log))] if trace_log else []
+            exporters = _exporters
+    return exporters
+
+
+def set_exporters(exporters: list[Exporter] | None) -> None:
+    """Install span exporters (None re-reads `TRACE_LOG` on next use)."""
+    global _exporters
+    with _lock:
+        _exporters = exporters
+
+
+def current_span() -> Span | None:
+    return _current.get()
+
+
+def enabled() -> bool:
+    return load_settings().telemetry_enabled
+
+
+@contextmanager
+def span(name: str, *, metric: str | None = None, **attributes) -> Iterator[Span]:
+    """
+    Time a block as a child of the current span; a span without a parent is
+    exported when it ends. With `metric`, the duration is also recorded in
+    that histogram, labelled with `attributes` as given here (attributes set
+    on the span later are not labels). Disabled telemetry yields a detached span.
+    """
+    current = Span(name, dict(attributes))
+    if not enabled():
+        yield current
+        return
+    parent = _current.get()
+    token = _current.set(current)
+    started = time.perf_counter()
+    try:
+        yield current
+    except BaseException as exc:
+        current.error = type(exc).__name__
+        raise
+    finally:
+        current.duration = time.perf_counter() - started
+        try:
+            _current.reset(token)
+        except ValueError:
+            # A generator closed from another context; its span still ends here.
+            pass
+        if metric is not None:
+            _metrics.observe(metric, current.duration, **attributes)
+        if parent is not None:
+            parent.children.append(current)
+        else:
+            for exporter in get_exporters():
+                exporter.export(current)
+
+
+def record_retry(current: Span, operation: str, delay: float) -> None:
+    """Count one retried Calendar API attempt and the backoff it waits."""
+    current.attributes["retries"] = current.attributes.get("retries", 0) + 1
+    current.attributes["backoff_seconds"] = round(current.attributes.get("backoff_seconds", 0.0) + delay, 6)
+    _metrics.increment("calendar_api_retries_total", operation=operation)
+    _metrics.increment("calendar_api_backoff_seconds_total", delay, operation=operation)
+
+
+def record_error(current: Span, operation: str, status) -> None:
+    current.attributes["status"] = status
+    _metrics.increment("calendar_api_errors_total", operation=operation, status=status)
+
+
+def _record_tool(current: Span, name: str, result) -> None:
+    if isinstance(result, dict) and result.get("ok") is False:
+        current.attributes["ok"] = False
+        _metrics.increment("tool_errors_total", tool=name)
+
+
+def instrument_tool(tool) -> None:
+    """Time every call of `tool` (sync and async) as a `tool.<name>` span and in `tool_seconds`."""
+    func, coroutine = tool.func, tool.coroutine
+    if getattr(func, "__instrumented__", False):
+        return
+
+    @functools.wraps(func)
+    def run(*args, **kwargs):
+        with span(f"tool.{tool.name}", metric="tool_seconds", tool=tool.name) as current:
+            result = func(*args, **kwargs)
+            _record_tool(current, tool.name, result)
+            return result
+
+    run.__instrumented__ = True
+    tool.func = run
+    if coroutine is not None and inspect.iscoroutinefunction(coroutine):
+
+        @functools.wraps(coroutine)
+        async def arun(*args, **kwargs):
+            with span(f"tool.{tool.name}", metric="tool_seconds", tool=tool.name) as current:
+                result = await coroutine(*args, **kwargs)
+                _record_tool(current, tool.name, result)
+                return result
+
+        tool.coroutine = arun
@@ -1,18 +1,24 @@
 from langchain.tools import tool
-from app.services.google_calendar import GoogleCalendarClient, GoogleCalendarError
-from app.tools.response import ok, err
+from pydantic import BaseModel, Field
+from app.services.client_provider import get_async_calendar_client, get_calendar_client
+from app.services.event_times import ensure_tz
+from app.services.events import Event
+from app.services.google_calendar import GoogleCalendarError
+from app.services.recurrence import RecurrenceError, expand, format_rrule, parse_rrule
+from app.services.response_cache import invalidate_times
+from app.services.telemetry import instrument_tool
+from app.tools.response import calendar_err, err, ok
 from app.config.settings import load_settings
+from app.tools.memo import amemoized, memoized
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 
-def _ensure_tz(dt: datetime, tz: ZoneInfo) -> datetime:
-    if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
-        return dt.replace(tzinfo=tz)
-    return dt.astimezone(tz)
+# Open-ended series are conflict-checked this far ahead.
+_SERIES_HORIZON = timedelta(days=365)
+
 
 @tool
-def create_event_tool(title: str, start: datetime, end: datetime) -> dict:
+def create_event_tool(title: str, start: datetime, end: datetime, recurrence: str | None = None) -> dict:
     """
     Use this tool to create a calendar event when a user asks to schedule,
     book, add, or create an event or meeting at a specific date and time.
@@ -20,16 +26,21 @@ def create_event_tool(title: str, start: datetime, end: datetime) -> dict:
     The tool requires a clear event title, a start datetime, and an end datetime.
     Datetimes must be concrete (not relative) and will be converted to ISO-8601
     format with second-level precision before being sent to Google Calendar.
+    For a repeating event, pass an RRULE as `recurrence`: the whole series is
+    created in one call, with `start`/`end` as its first occurrence.
 
     Do NOT use this tool if:
     - The user is only asking questions about availability
     - The user provides incomplete or ambiguous time information
     - The user is asking to edit or delete an existing event
+    - Several events are being created at once (use create_events_tool)
 
     Args:
         title (str): A concise event title (e.g., "Team Sync", "Doctor Appointment").
         start (datetime): The exact start datetime of the event.
         end (datetime): The exact end datetime of the event.
+        recurrence (str, optional): An RFC 5545 RRULE for a repeating event,
+            e.g. "FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10" or "FREQ=MONTHLY;BYDAY=-1FR".
 
     Returns:
         dict: A structured response with {"ok": bool, "data": {...}, "error": {...}}.
@@ -42,44 +53,97 @@ def create_event_tool(title: str, start: datetime, end: datetime) -> dict:
                 start=datetime(2026, 1, 20, 10, 0),
                 end=datetime(2026, 1, 20, 11, 0)
             )
+        User: "Add a standup every weekday at 9:30 for the next four weeks"
+        Tool call:
+            create_event_tool(
+                title="Standup",
+                start=datetime(2026, 1, 19, 9, 30),
+                end=datetime(2026, 1, 19, 9, 45),
+                recurrence="FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR;COUNT=20"
+            )
     """
-    settings = load_settings()
-    tz = ZoneInfo(settings.timezone)
-    start_tz = _ensure_tz(start, tz)
-    end_tz = _ensure_tz(end, tz)
+    try:
+        args = _create_args(title, start, end, recurrence)
+    except RecurrenceError as exc:
+        return _invalid_recurrence(exc)
 
-    service = GoogleCalendarClient()
+    service = memoized(get_calendar_client())
     try:
-        event = service.create_event(
-            summary=title,
-            start_time=start_tz.isoformat(timespec="seconds"),
-            end_time=end_tz.isoformat(timespec="seconds"),
-        )
+        event = service.create_event(**args)
     except GoogleCalendarError as exc:
-        return err(
-            exc.message,
-            status=exc.status,
-            reason=exc.reason,
-            code="google_calendar_error",
-        )
+        return calendar_err(exc)
 
-    return ok(
-        {
-            "summary": event["summary"],
-            "start": start,
-            "end": end,
-        }
+    invalidate_times(args["start_time"], args["end_time"], args.get("recurrence"))
+    return _created(event, start, end, recurrence)
+
+
+async def _acreate_event(title: str, start: datetime, end: datetime, recurrence: str | None = None) -> dict:
+    try:
+        args = _create_args(title, start, end, recurrence)
+    except RecurrenceError as exc:
+        return _invalid_recurrence(exc)
+
+    service = amemoized(get_async_calendar_client())
+    try:
+        event = await service.create_event(**args)
+    except GoogleCalendarError as exc:
+        return calendar_err(exc)
+
+    invalidate_times(args["start_time"], args["end_time"], args.get("recurrence"))
+    return _created(event, start, end, recurrence)
+
+
+def _create_args(title: str, start: datetime, end: datetime, recurrence: str | None = None) -> dict:
+    settings = load_settings()
+    tz = settings.tzinfo
+    args = {
+        "summary": title,
+        "start_time": ensure_tz(start, tz).isoformat(timespec="seconds"),
+        "end_time": ensure_tz(end, tz).isoformat(timespec="seconds"),
+    }
+    if recurrence:
+        args["recurrence"] = [format_rrule(recurrence)]
+    return args
+
+
+def _invalid_recurrence(exc: RecurrenceError) -> dict:
+    return err(
+        f"Please give a valid RRULE for the recurrence: {exc}",
+        status="invalid_argument",
+        reason="invalid_recurrence",
+        code="invalid_argument",
     )
 
+
+def _created(event: dict, start: datetime, end: datetime, recurrence: str | None = None) -> dict:
+    data = {
+        "summary": event["summary"],
+        "start": start,
+        "end": end,
+    }
+    if recurrence:
+        data["recurrence"] = recurrence
+    return ok(data)
+
 @tool
-def check_conflicts_tool(start: datetime, end: datetime, buffer_minutes: int = 0) -> dict:
+def check_conflicts_tool(
+    start: datetime,
+    end: datetime,
+    buffer_minutes: int = 0,
+    recurrence: str | None = None,
+    calendar_ids: list[str] | None = None,
+) -> dict:
     """
     Use this tool to check for existing calendar events that conflict with a
     proposed time window before creating or rescheduling an event.
 
     The tool expands the requested window by `buffer_minutes` on both sides
-    to capture near-miss conflicts, then lists any events found in that range.
-    If no events are found, it returns a safe-to-proceed message.
+    to capture near-miss conflicts, then reports the busy events overlapping
+    that range. Events marked as free, events the user declined and all-day
+    entries are not conflicts. If none are found, it is safe to proceed.
+    With `recurrence`, every occurrence of the series is checked in one call
+    and each conflict names the occurrence it hits. Conflicts on any of the
+    user's calendars count, and name the `calendar` they are on.
 
     Do NOT use this tool if:
     - The user is explicitly asking to create, edit, or delete an event
@@ -90,6 +154,10 @@ def check_conflicts_tool(start: datetime, end: datetime, buffer_minutes: int = 0
         end (datetime): The proposed end datetime to check.
         buffer_minutes (int, optional): Minutes to pad before and after the
             window when searching for conflicts. Defaults to 0.
+        recurrence (str, optional): The RRULE of a proposed repeating event;
+            `start`/`end` are its first occurrence.
+        calendar_ids (list[str], optional): Calendars to check (e.g. a team or
+            room calendar). Defaults to the user's configured calendars.
         
     Returns:
         dict: A structured response with {"ok": bool, "data": {...}, "error": {...}}.
@@ -103,50 +171,206 @@ def check_conflicts_tool(start: datetime, end: datetime, buffer_minutes: int = 0
                 buffer_minutes=15
             )
     """
-    settings = load_settings()
-    tz = ZoneInfo(settings.timezone)
-    start_tz = _ensure_tz(start, tz)
-    end_tz = _ensure_tz(end, tz)
+    if recurrence:
+        try:
+            occurrences = _occurrences(start, end, recurrence)
+        except RecurrenceError as exc:
+            return _invalid_recurrence(exc)
+        service = memoized(get_calendar_client())
+        windows = [_conflict_window(lo, hi, buffer_minutes) for lo, hi in occurrences]
+        try:
+            found = service.find_conflicts(windows, calendar_ids=calendar_ids)
+        except GoogleCalendarError as exc:
+            return calendar_err(exc)
+        return _series_conflicts(occurrences, found)
 
-    time_min = start_tz - timedelta(minutes=buffer_minutes)
-    time_end = end_tz + timedelta(minutes=buffer_minutes)
-    
-    service = GoogleCalendarClient()
+    service = memoized(get_calendar_client())
     try:
-        events = service.list_from_to(
-            time_min=time_min.isoformat(timespec="seconds"),
-            time_max=time_end.isoformat(timespec="seconds"),
+        (events,) = service.find_conflicts(
+            [_conflict_window(start, end, buffer_minutes)],
+            calendar_ids=calendar_ids,
         )
     except GoogleCalendarError as exc:
-        return err(
-            exc.message,
-            status=exc.status,
-            reason=exc.reason,
-            code="google_calendar_error",
-        )
-    
-    if not events:
-        return ok(
-            {
-                "conflict_count": 0,
-                "conflicts": [],
-            }
+        return calendar_err(exc)
+
+    return _conflicts(events)
+
+
+async def _acheck_conflicts(
+    start: datetime,
+    end: datetime,
+    buffer_minutes: int = 0,
+    recurrence: str | None = None,
+    calendar_ids: list[str] | None = None,
+) -> dict:
+    if recurrence:
+        try:
+            occurrences = _occurrences(start, end, recurrence)
+        except RecurrenceError as exc:
+            return _invalid_recurrence(exc)
+        service = amemoized(get_async_calendar_client())
+        windows = [_conflict_window(lo, hi, buffer_minutes) for lo, hi in occurrences]
+        try:
+            found = await service.find_conflicts(windows, calendar_ids=calendar_ids)
+        except GoogleCalendarError as exc:
+            return calendar_err(exc)
+        return _series_conflicts(occurrences, found)
+
+    service = amemoized(get_async_calendar_client())
+    try:
+        (events,) = await service.find_conflicts(
+            [_conflict_window(start, end, buffer_minutes)],
+            calendar_ids=calendar_ids,
         )
-    
+    except GoogleCalendarError as exc:
+        return calendar_err(exc)
+
+    return _conflicts(events)
+
+
+def _occurrences(start: datetime, end: datetime, recurrence: str) -> list[tuple[datetime, datetime]]:
+    """(start, end) of each occurrence of the series, up to `_SERIES_HORIZON` ahead."""
+    tz = load_settings().tzinfo
+    first = ensure_tz(start, tz)
+    duration = ensure_tz(end, tz) - first
+    horizon = first + _SERIES_HORIZON
+    return [
+        (occurrence, occurrence + duration)
+        for occurrence in expand(parse_rrule(recurrence), first)
+        if occurrence < horizon
+    ]
+
+
+def _conflict_window(start: datetime, end: datetime, buffer_minutes: int) -> tuple[str, str]:
+    settings = load_settings()
+    tz = settings.tzinfo
+    start_tz = ensure_tz(start, tz)
+    end_tz = ensure_tz(end, tz)
+
+    time_min = start_tz - timedelta(minutes=buffer_minutes)
+    time_end = end_tz + timedelta(minutes=buffer_minutes)
+    return time_min.isoformat(timespec="seconds"), time_end.isoformat(timespec="seconds")
+
+
+def _conflicts(events: list[Event]) -> dict:
+    return ok(
+        {
+            "conflict_count": len(events),
+            "conflicts": [event.to_dict(with_id=False) for event in events],
+        }
+    )
+
+
+def _series_conflicts(occurrences: list[tuple[datetime, datetime]], found: list[list[Event]]) -> dict:
     conflicts = []
-    for event in events:
-        start = event.get("start", {}).get("dateTime") or event.get("start", {}).get("date")
-        end = event.get("end", {}).get("dateTime") or event.get("end", {}).get("date")
-        summary = event.get("summary", "Untitled event")
-        conflicts.append({
-            "summary": summary,
-            "start": start,
-            "end": end
-        })
+    for (occurrence, _), events in zip(occurrences, found):
+        for event in events:
+            conflicts.append({**event.to_dict(with_id=False), "occurrence": occurrence.isoformat(timespec="seconds")})
 
     return ok(
         {
             "conflict_count": len(conflicts),
             "conflicts": conflicts,
+            "occurrences_checked": len(occurrences),
+        }
+    )
+
+
+class EventInput(BaseModel):
+    title: str = Field(description="A concise event title.")
+    start: datetime = Field(description="The exact start datetime of the event.")
+    end: datetime = Field(description="The exact end datetime of the event.")
+    recurrence: str | None = Field(default=None, description="An RRULE if the event repeats.")
+
+
+@tool
+def create_events_tool(events: list[EventInput]) -> dict:
+    """
+    Use this tool to create several calendar events at once, e.g. "block out
+    every Friday afternoon this month" or a list of meetings the user gave.
+
+    All events are sent in batched requests instead of one tool call per event.
+    Each event is reported separately, so some may succeed while others fail.
+
+    Do NOT use this tool if:
+    - Only one event is being created (use create_event_tool)
+    - Any of the times are incomplete or ambiguous
+
+    Args:
+        events (list[EventInput]): The events to create, each with a title,
+            start datetime, end datetime and optional recurrence RRULE.
+
+    Returns:
+        dict: A structured response with {"ok": bool, "data": {...}, "error": {...}};
+        data["results"] holds one {"ok", "data", "error"} entry per event.
+
+    Example usage:
+        User: "Block Friday 2-5pm on Jan 23 and Jan 30"
+        Tool call:
+            create_events_tool(events=[
+                {"title": "Focus time", "start": datetime(2026, 1, 23, 14, 0), "end": datetime(2026, 1, 23, 17, 0)},
+                {"title": "Focus time", "start": datetime(2026, 1, 30, 14, 0), "end": datetime(2026, 1, 30, 17, 0)},
+            ])
+    """
+    service = memoized(get_calendar_client())
+    try:
+        batch = [_create_args(event.title, event.start, event.end, event.recurrence) for event in events]
+    except RecurrenceError as exc:
+        return _invalid_recurrence(exc)
+
+    try:
+        results = service.create_events(batch)
+    except GoogleCalendarError as exc:
+        return calendar_err(exc)
+
+    return _created_many(events, batch, results)
+
+
+async def _acreate_events(events: list[EventInput]) -> dict:
+    service = amemoized(get_async_calendar_client())
+    try:
+        batch = [_create_args(event.title, event.start, event.end, event.recurrence) for event in events]
+    except RecurrenceError as exc:
+        return _invalid_recurrence(exc)
+
+    try:
+        results = await service.create_events(batch)
+    except GoogleCalendarError as exc:
+        return calendar_err(exc)
+
+    return _created_many(events, batch, results)
+
+
+def _created_many(events: list[EventInput], batch: list[dict], results: list) -> dict:
+    items = []
+    for event, args, result in zip(events, batch, results):
+        if result.ok:
+            invalidate_times(args["start_time"], args["end_time"], args.get("recurrence"))
+            created = {
+                "summary": result.response.get("summary", event.title),
+                "start": event.start,
+                "end": event.end,
+                "eventId": result.response.get("id"),
+            }
+            if event.recurrence:
+                created["recurrence"] = event.recurrence
+            items.append(ok(created))
+        else:
+            items.append(calendar_err(result.error))
+
+    return ok(
+        {
+            "created_count": sum(1 for result in results if result.ok),
+            "failed_count": sum(1 for result in results if not result.ok),
+            "results": items,
         }
     )
+
+
+create_event_tool.coroutine = _acreate_event
+check_conflicts_tool.coroutine = _acheck_conflicts
+create_events_tool.coroutine = _acreate_events
+
+instrument_tool(create_event_tool)
+instrument_tool(check_conflicts_tool)
+instrument_tool(create_events_tool)
@@ -1,7 +1,11 @@
 from langchain.tools import tool
 
-from app.services.google_calendar import GoogleCalendarClient, GoogleCalendarError
-from app.tools.response import ok, err
+from app.services.client_provider import get_async_calendar_client, get_calendar_client
+from app.services.google_calendar import GoogleCalendarError
+from app.services.response_cache import invalidate_event
+from app.services.telemetry import instrument_tool
+from app.tools.memo import amemoized, memoized
+from app.tools.response import calendar_err, ok
 
 @tool
 def delete_event_tool(event_id: str) -> dict:
@@ -16,6 +20,7 @@ def delete_event_tool(event_id: str) -> dict:
     - The user is only asking to view events or availability
     - The user is asking to edit, reschedule, or update an event
     - The event id is missing or ambiguous
+    - Several events are being deleted at once (use delete_events_tool)
 
     Args:
         event_id (str): The unique Google Calendar event id to delete.
@@ -28,7 +33,7 @@ def delete_event_tool(event_id: str) -> dict:
         Tool call:
             delete_event_tool(event_id="abc123")
     """
-    service = GoogleCalendarClient()
+    service = memoized(get_calendar_client())
 
     try:
         event = service.get_event(event_id=event_id)
@@ -36,16 +41,117 @@ def delete_event_tool(event_id: str) -> dict:
 
         service.delete_event(event_id=event_id)
     except GoogleCalendarError as exc:
-        return err(
-            exc.message,
-            status=exc.status,
-            reason=exc.reason,
-            code="google_calendar_error",
-        )
+        return calendar_err(exc)
 
+    invalidate_event(event)
+    return _deleted(summary, event_id)
+
+
+async def _adelete_event(event_id: str) -> dict:
+    service = amemoized(get_async_calendar_client())
+
+    try:
+        event = await service.get_event(event_id=event_id)
+        summary = event.get("summary", "Untitled Event")
+
+        await service.delete_event(event_id=event_id)
+    except GoogleCalendarError as exc:
+        return calendar_err(exc)
+
+    invalidate_event(event)
+    return _deleted(summary, event_id)
+
+
+def _deleted(summary: str, event_id: str) -> dict:
     return ok(
         {
             "summary": summary,
             "eventId": event_id,
         }
     )
+
+
+@tool
+def delete_events_tool(event_ids: list[str]) -> dict:
+    """
+    Use this tool to delete several calendar events at once when the user
+    explicitly asks to cancel or remove multiple specific events. Repeated
+    ids are deleted once.
+
+    All events are looked up and deleted in batched requests instead of one
+    tool call per event. Each event is reported separately, so some may be
+    deleted while others fail (for example, an unknown id).
+
+    Do NOT use this tool if:
+    - Only one event is being deleted (use delete_event_tool)
+    - Any event id is missing or ambiguous
+
+    Args:
+        event_ids (list[str]): The unique Google Calendar event ids to delete.
+
+    Returns:
+        dict: A structured response with {"ok": bool, "data": {...}, "error": {...}};
+        data["results"] holds one {"ok", "data", "error"} entry per event id.
+
+    Example usage:
+        User: "Cancel events abc123 and def456"
+        Tool call:
+            delete_events_tool(event_ids=["abc123", "def456"])
+    """
+    service = memoized(get_calendar_client())
+    # An id given twice is deleted (and reported) once.
+    event_ids = list(dict.fromkeys(event_ids))
+
+    try:
+        lookups = service.get_events(event_ids)
+        found = _found(event_ids, lookups)
+        deletions = dict(zip(found, service.delete_events(found)))
+    except GoogleCalendarError as exc:
+        return calendar_err(exc)
+
+    return _deleted_many(event_ids, lookups, deletions)
+
+
+async def _adelete_events(event_ids: list[str]) -> dict:
+    service = amemoized(get_async_calendar_client())
+    event_ids = list(dict.fromkeys(event_ids))
+
+    try:
+        lookups = await service.get_events(event_ids)
+        found = _found(event_ids, lookups)
+        deletions = dict(zip(found, await service.delete_events(found)))
+    except GoogleCalendarError as exc:
+        return calendar_err(exc)
+
+    return _deleted_many(event_ids, lookups, deletions)
+
+
+def _found(event_ids: list[str], lookups: list) -> list[str]:
+    return [event_id for event_id, lookup in zip(event_ids, lookups) if lookup.ok]
+
+
+def _deleted_many(event_ids: list[str], lookups: list, deletions: dict) -> dict:
+    items = []
+    for event_id, lookup in zip(event_ids, lookups):
+        outcome = deletions.get(event_id, lookup)
+        if outcome.ok:
+            invalidate_event(lookup.response)
+            items.append(_deleted(lookup.response.get("summary", "Untitled Event"), event_id))
+        else:
+            items.append(calendar_err(outcome.error))
+
+    deleted_count = sum(1 for item in items if item["ok"])
+    return ok(
+        {
+            "deleted_count": deleted_count,
+            "failed_count": len(items) - deleted_count,
+            "results": items,
+        }
+    )
+
+
+delete_event_tool.coroutine = _adelete_event
+delete_events_tool.coroutine = _adelete_events
+
+instrument_tool(delete_event_tool)
+instrument_tool(delete_events_tool)
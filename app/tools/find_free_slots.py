@@ -0,0 +1,165 @@
+from datetime import datetime, time, timedelta
+
+from langchain.tools import tool
+
+from app.config.settings import load_settings
+from app.services.availability import WEEKDAYS, find_free_slots
+from app.services.client_provider import get_async_calendar_client, get_calendar_client
+from app.services.event_times import ensure_tz, to_timestamp
+from app.services.google_calendar import GoogleCalendarError
+from app.services.telemetry import instrument_tool
+from app.tools.memo import amemoized, memoized
+from app.tools.response import calendar_err, err, ok
+
+
+@tool
+def find_free_slots_tool(
+    start: datetime,
+    end: datetime,
+    duration_minutes: int,
+    attendees: list[str] | None = None,
+    buffer_minutes: int = 0,
+    max_results: int = 5,
+    include_weekends: bool = False,
+) -> dict:
+    """
+    Use this tool to find open time slots when a user asks when they (and
+    optionally other people) are free, or asks to schedule something "whenever
+    works" within a date range.
+
+    The tool checks the user's calendars and every attendee calendar in a single
+    free/busy lookup, keeps `buffer_minutes` clear around existing events, and
+    returns the earliest slots inside working hours. Prefer this over probing
+    individual windows with check_conflicts_tool.
+
+    Do NOT use this tool if:
+    - The user already gave an exact time (use check_conflicts_tool instead)
+    - The user is asking to create, edit, or delete an event
+
+    Args:
+        start (datetime): Beginning of the search range.
+        end (datetime): End of the search range.
+        duration_minutes (int): Length of the slot needed.
+        attendees (list[str], optional): Extra calendar ids or emails whose
+            busy time must also be avoided.
+        buffer_minutes (int, optional): Minutes to keep free before and after
+            existing events. Defaults to 0.
+        max_results (int, optional): Maximum number of slots. Defaults to 5.
+        include_weekends (bool, optional): Also search Saturdays and Sundays.
+
+    Returns:
+        dict: A structured response with {"ok": bool, "data": {...}, "error": {...}}.
+
+    Example usage:
+        User: "Find an hour next week when Anna and I are both free"
+        Tool call:
+            find_free_slots_tool(
+                start=datetime(2026, 1, 26, 0, 0),
+                end=datetime(2026, 1, 31, 0, 0),
+                duration_minutes=60,
+                attendees=["anna@example.com"]
+            )
+    """
+    if duration_minutes <= 0 or max_results <= 0:
+        return _invalid_arguments()
+
+    service = memoized(get_calendar_client())
+    try:
+        busy_by_calendar = service.free_busy(**_free_busy_query(start, end, attendees, buffer_minutes))
+    except GoogleCalendarError as exc:
+        return calendar_err(exc)
+
+    return _slots(busy_by_calendar, start, end, duration_minutes, buffer_minutes, max_results, include_weekends)
+
+
+async def _afind_free_slots(
+    start: datetime,
+    end: datetime,
+    duration_minutes: int,
+    attendees: list[str] | None = None,
+    buffer_minutes: int = 0,
+    max_results: int = 5,
+    include_weekends: bool = False,
+) -> dict:
+    if duration_minutes <= 0 or max_results <= 0:
+        return _invalid_arguments()
+
+    service = amemoized(get_async_calendar_client())
+    try:
+        busy_by_calendar = await service.free_busy(**_free_busy_query(start, end, attendees, buffer_minutes))
+    except GoogleCalendarError as exc:
+        return calendar_err(exc)
+
+    return _slots(busy_by_calendar, start, end, duration_minutes, buffer_minutes, max_results, include_weekends)
+
+
+def _invalid_arguments() -> dict:
+    return err(
+        "Please request a positive duration and number of slots.",
+        status="invalid_argument",
+        reason="duration_and_max_results_must_be_positive",
+        code="invalid_argument",
+    )
+
+
+def _free_busy_query(start: datetime, end: datetime, attendees: list[str] | None, buffer_minutes: int) -> dict:
+    settings = load_settings()
+    tz = settings.tzinfo
+    # Busy time just outside the range still eats into the buffer of a slot at its edge.
+    pad = timedelta(minutes=max(buffer_minutes, 0))
+    return {
+        "time_min": (ensure_tz(start, tz) - pad).isoformat(timespec="seconds"),
+        "time_max": (ensure_tz(end, tz) + pad).isoformat(timespec="seconds"),
+        # The user's configured calendars (CALENDAR_IDS) block time too, as in conflict checks.
+        "calendar_ids": list(dict.fromkeys((*settings.read_calendar_ids, *(attendees or [])))),
+    }
+
+
+def _slots(
+    busy_by_calendar: dict[str, list[dict]],
+    start: datetime,
+    end: datetime,
+    duration_minutes: int,
+    buffer_minutes: int,
+    max_results: int,
+    include_weekends: bool,
+) -> dict:
+    settings = load_settings()
+    tz = settings.tzinfo
+    busy = [
+        (to_timestamp(interval["start"], tz), to_timestamp(interval["end"], tz))
+        for intervals in busy_by_calendar.values()
+        for interval in intervals
+    ]
+    slots = find_free_slots(
+        busy,
+        window_start=ensure_tz(start, tz),
+        window_end=ensure_tz(end, tz),
+        duration=timedelta(minutes=duration_minutes),
+        tz=tz,
+        working_hours=(
+            time.fromisoformat(settings.working_hours_start),
+            time.fromisoformat(settings.working_hours_end),
+        ),
+        working_days=frozenset(range(7)) if include_weekends else WEEKDAYS,
+        buffer=timedelta(minutes=buffer_minutes),
+        limit=max_results,
+    )
+
+    return ok(
+        {
+            "calendars": list(busy_by_calendar),
+            "slots": [
+                {
+                    "start": datetime.fromtimestamp(slot_start, tz).isoformat(timespec="seconds"),
+                    "end": datetime.fromtimestamp(slot_end, tz).isoformat(timespec="seconds"),
+                }
+                for slot_start, slot_end in slots
+            ],
+        }
+    )
+
+
+find_free_slots_tool.coroutine = _afind_free_slots
+
+instrument_tool(find_free_slots_tool)
@@ -1,21 +1,25 @@
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 from langchain.tools import tool
 
 from app.config.settings import load_settings
-from app.services.google_calendar import GoogleCalendarClient, GoogleCalendarError
-from app.tools.response import ok, err
+from app.services.client_provider import get_async_calendar_client, get_calendar_client
+from app.services.events import Event
+from app.services.google_calendar import GoogleCalendarError
+from app.services.telemetry import instrument_tool
+from app.tools.memo import amemoized, memoized
+from app.tools.response import calendar_err, err, ok
 
 
 @tool
-def list_next_events_tool(n: int = 5) -> dict:
+def list_next_events_tool(n: int = 5, calendar_ids: list[str] | None = None) -> dict:
     """
     Use this tool to list the next upcoming calendar events when a user asks
     to see their schedule or requests the next N events.
 
     The tool returns the next N upcoming events starting from now, ordered by
-    start time. If the user does not specify N, default to 5.
+    start time. If the user does not specify N, default to 5. Events from
+    several calendars are merged and carry the `calendar` they came from.
 
     Do NOT use this tool if:
     - The user asks to create, edit, or delete an event
@@ -23,6 +27,8 @@ def list_next_events_tool(n: int = 5) -> dict:
 
     Args:
         n (int): Number of upcoming events to list.
+        calendar_ids (list[str], optional): Calendars to read (e.g. a team or
+            room calendar). Defaults to the user's configured calendars.
 
     Returns:
         dict: A structured response with {"ok": bool, "data": {...}, "error": {...}}.
@@ -33,47 +39,50 @@ def list_next_events_tool(n: int = 5) -> dict:
             list_next_events_tool(n=3)
     """
     if n <= 0:
-        return err(
-            "Please request a positive number of events.",
-            status="invalid_argument",
-            reason="n_must_be_positive",
-            code="invalid_argument",
-        )
+        return _invalid_n()
+
+    service = memoized(get_calendar_client())
+    try:
+        events = service.list_events(time_min=_now(), max_results=n, calendar_ids=calendar_ids)
+    except GoogleCalendarError as exc:
+        return calendar_err(exc)
+
+    return _events(events)
 
-    settings = load_settings()
-    now = datetime.now(tz=ZoneInfo(settings.timezone)).isoformat(timespec="seconds")
 
-    service = GoogleCalendarClient()
+async def _alist_next_events(n: int = 5, calendar_ids: list[str] | None = None) -> dict:
+    if n <= 0:
+        return _invalid_n()
+
+    service = amemoized(get_async_calendar_client())
     try:
-        events = service.list_events(time_min=now, max_results=n)
+        events = await service.list_events(time_min=_now(), max_results=n, calendar_ids=calendar_ids)
     except GoogleCalendarError as exc:
-        return err(
-            exc.message,
-            status=exc.status,
-            reason=exc.reason,
-            code="google_calendar_error",
-        )
-
-    if not events:
-        return ok({"events": []})
-        
-    events_list = []
-    for event in events:
-        start = event.get("start", {}).get("dateTime") or event.get("start", {}).get("date")
-        end = event.get("end", {}).get("dateTime") or event.get("end", {}).get("date")
-        summary = event.get("summary", "Untitled event")
-        event_id = event["id"]
-        events_list.append({
-            "summary": summary,
-            "start": start,
-            "end": end,
-            "eventId": event_id
-        })
-        
-    return ok({"events": events_list})
+        return calendar_err(exc)
+
+    return _events(events)
+
+
+def _invalid_n() -> dict:
+    return err(
+        "Please request a positive number of events.",
+        status="invalid_argument",
+        reason="n_must_be_positive",
+        code="invalid_argument",
+    )
+
+
+def _now() -> str:
+    settings = load_settings()
+    return datetime.now(tz=settings.tzinfo).isoformat(timespec="seconds")
+
+
+def _events(events: list[Event]) -> dict:
+    return ok({"events": [event.to_dict() for event in events]})
+
 
 @tool
-def list_today_events_tool() -> dict:
+def list_today_events_tool(calendar_ids: list[str] | None = None) -> dict:
     """
     Use this tool to list the events of today when a user asks
     to see their schedule or requests for the day.
@@ -81,6 +90,10 @@ def list_today_events_tool() -> dict:
     The tool returns all the events of today starting from 00:00 to 00:00
     of the next day, ordered by start time.
     
+    Args:
+        calendar_ids (list[str], optional): Calendars to read (e.g. a team or
+            room calendar). Defaults to the user's configured calendars.
+
     Returns:
         dict: A structured response with {"ok": bool, "data": {...}, "error": {...}}.
 
@@ -89,39 +102,38 @@ def list_today_events_tool() -> dict:
         Tool call:
             list_today_events_tool()
     """
+    service = memoized(get_calendar_client())
+    try:
+        events = service.list_from_to(**_today_window(), calendar_ids=calendar_ids)
+    except GoogleCalendarError as exc:
+        return calendar_err(exc)
+
+    return _events(events)
+
+
+async def _alist_today_events(calendar_ids: list[str] | None = None) -> dict:
+    service = amemoized(get_async_calendar_client())
+    try:
+        events = await service.list_from_to(**_today_window(), calendar_ids=calendar_ids)
+    except GoogleCalendarError as exc:
+        return calendar_err(exc)
+
+    return _events(events)
+
+
+def _today_window() -> dict:
     settings = load_settings()
-    now = datetime.now(tz=ZoneInfo(settings.timezone))
+    now = datetime.now(tz=settings.tzinfo)
     start_day = now.replace().replace(hour=0, minute=0, second=0, microsecond=0)
     end_day = start_day + timedelta(days=1)
-    
-    service = GoogleCalendarClient()
-    try:
-        events = service.list_from_to(
-            time_min=start_day.isoformat(timespec="seconds"),
-            time_max=end_day.isoformat(timespec="seconds"),
-        )
-    except GoogleCalendarError as exc:
-        return err(
-            exc.message,
-            status=exc.status,
-            reason=exc.reason,
-            code="google_calendar_error",
-        )
-    
-    if not events:
-        return ok({"events": []})
-        
-    events_list = []
-    for event in events:
-        start = event.get("start", {}).get("dateTime") or event.get("start", {}).get("date")
-        end = event.get("end", {}).get("dateTime") or event.get("end", {}).get("date")
-        summary = event.get("summary", "Untitled event")
-        event_id = event["id"]
-        events_list.append({
-            "summary": summary,
-            "start": start,
-            "end": end,
-            "eventId": event_id
-        })
-        
-    return ok({"events": events_list})
+    return {
+        "time_min": start_day.isoformat(timespec="seconds"),
+        "time_max": end_day.isoformat(timespec="seconds"),
+    }
+
+
+list_next_events_tool.coroutine = _alist_next_events
+list_today_events_tool.coroutine = _alist_today_events
+
+instrument_tool(list_next_events_tool)
+instrument_tool(list_today_events_tool)
@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Iterator
+
+from app.config.settings import load_settings
+from app.services.client_provider import current_user
+from app.services.conflicts import Window, busy_index, find_conflicts
+from app.services.event_times import event_bounds, to_timestamp
+from app.services.events import Event
+from app.services.fields import list_mask
+from app.services.recurrence import series_window
+
+# Memoized reads carry the busy-time fields so one fetch answers both
+# listings and conflict checks (the local event store keeps the same ones).
+_FIELDS = list_mask("conflicts")
+
+
+def _default_calendars(calendar_ids: list[str] | None) -> bool:
+    """Whether a read covers the configured calendars, which is what the memo holds."""
+    return not calendar_ids or tuple(dict.fromkeys(calendar_ids)) == load_settings().read_calendar_ids
+
+
+def _iso(timestamp: float, tz) -> str:
+    return datetime.fromtimestamp(timestamp, tz).isoformat(timespec="seconds")
+
+
+@dataclass
+class _Range:
+    start: float
+    end: float
+    events: list[tuple[float, float, Event]]
+
+
+@dataclass
+class CallMemo:
+    """
+    Calendar reads made during one agent turn (or session), reused by later
+    tool calls in it. A range that has been listed answers any query inside
+    it; free/busy lookups are kept per calendar. Writes drop what they overlap.
+    """
+
+    created_at: float = field(default_factory=time.monotonic)
+    hits: int = 0
+    misses: int = 0
+    _ranges: list[_Range] = field(default_factory=list)
+    _busy: dict[str, list[tuple[float, float, list[dict]]]] = field(default_factory=dict)
+    _bounds: dict[str, tuple[float, float]] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def events(self, start: float, end: float) -> list[Event] | None:
+        with self._lock:
+            for covered in self._ranges:
+                if covered.start <= start and end <= covered.end:
+                    self.hits += 1
+                    return [event for lo, hi, event in covered.events if lo < end and start < hi]
+            self.misses += 1
+        return None
+
+    def upcoming(self, start: float, count: int) -> list[Event] | None:
+        """The first `count` events ending after `start`, if a listed range proves there are no others."""
+        with self._lock:
+            for covered in self._ranges:
+                if covered.start > start:
+                    continue
+                found = [event for lo, hi, event in covered.events if hi > start]
+                if len(found) >= count or covered.end == math.inf:
+                    self.hits += 1
+                    return found[:count]
+            self.misses += 1
+        return None
+
+    def add_events(self, start: float, end: float, events: list[Event]) -> None:
+        with self._lock:
+            self._ranges.append(_Range(start, end, [(event.start, event.end, event) for event in events]))
+            for event in events:
+                if event.id:
+                    self._bounds[event.id] = (event.start, event.end)
+
+    def busy(self, start: float, end: float, calendar_ids: list[str], tz) -> dict[str, list[dict]] | None:
+        result = {}
+        with self._lock:
+            for calendar_id in calendar_ids:
+                for lo, hi, intervals in self._busy.get(calendar_id, ()):
+                    if lo <= start and end <= hi:
+                        result[calendar_id] = [
+                            interval
+                            for interval in intervals
+                            if to_timestamp(interval["start"], tz) < end and start < to_timestamp(interval["end"], tz)
+                        ]
+                        break
+                else:
+                    self.misses += 1
+                    return None
+            self.hits += 1
+        return result
+
+    def add_busy(self, start: float, end: float, busy: dict[str, list[dict]]) -> None:
+        with self._lock:
+            for calendar_id, intervals in busy.items():
+                self._busy.setdefault(calendar_id, []).append((start, end, intervals))
+
+    def remember(self, event: dict, tz) -> None:
+        """Note where a looked-up event sits, so deleting it drops only that window."""
+        with self._lock:
+            self._bounds[event["id"]] = event_bounds(event, tz)
+
+    def invalidate(self, start: float, end: float) -> None:
+        with self._lock:
+            self._ranges = [r for r in self._ranges if not (r.start < end and start < r.end)]
+            # Writes only touch the user's calendar, but free/busy may list it under
+            # an email address rather than its id, so every overlapping entry goes.
+            self._busy = {
+                calendar_id: [entry for entry in entries if not (entry[0] < end and start < entry[1])]
+                for calendar_id, entries in self._busy.items()
+            }
+
+    def invalidate_event(self, event_id: str) -> None:
+        with self._lock:
+            bounds = self._bounds.pop(event_id, None)
+        self.invalidate(*(bounds or (-math.inf, math.inf)))
+
+
+_memo: ContextVar[CallMemo | None] = ContextVar("tool_call_memo", default=None)
+
+
+@contextmanager
+def memoize_calls(memo: CallMemo | None = None) -> Iterator[CallMemo]:
+    """Reuse calendar reads across tool calls in the current context (e.g. one agent turn)."""
+    memo = memo if memo is not None else CallMemo()
+    token = _memo.set(memo)
+    try:
+        yield memo
+    finally:
+        _memo.reset(token)
+
+
+_sessions_lock = threading.Lock()
+_sessions: OrderedDict[tuple, CallMemo] = OrderedDict()
+_MAX_SESSIONS = 1024
+
+
+def session_memo(session_id: str, max_age_seconds: float) -> CallMemo:
+    """
+    The memo shared by the turns of `session_id` for the acting user and
+    calendars, replaced once it is older than `max_age_seconds`.
+    """
+    key = (session_id, current_user(), load_settings().read_calendar_ids)
+    with _sessions_lock:
+        memo = _sessions.get(key)
+        if memo is None or time.monotonic() - memo.created_at > max_age_seconds:
+            memo = _sessions[key] = CallMemo()
+        _sessions.move_to_end(key)
+        while len(_sessions) > _MAX_SESSIONS:
+            _sessions.popitem(last=False)
+        return memo
+
+
+class _Memoized:
+    """Calendar client front end that answers reads from a `CallMemo` when it can."""
+
+    def __init__(self, service, memo: CallMemo):
+        self._service = service
+        self._memo = memo
+        self._tz = load_settings().tzinfo
+
+    def __getattr__(self, name):
+        return getattr(self._service, name)
+
+    def _window(self, time_min, time_max) -> tuple[float, float]:
+        return to_timestamp(time_min, self._tz), to_timestamp(time_max, self._tz)
+
+    def _hull(self, windows: list[Window]) -> tuple[float, float]:
+        bounds = [self._window(start, end) for start, end in windows]
+        return min(lo for lo, _ in bounds), max(hi for _, hi in bounds)
+
+    def _conflicts(self, events: list[Event], windows: list[Window], include_all_day: bool) -> list[list[Event]]:
+        return find_conflicts(busy_index(events, include_all_day=include_all_day), windows, self._tz)
+
+    def _listed(self, time_min, max_results: int, events: list[Event]) -> None:
+        start = to_timestamp(time_min, self._tz)
+        if len(events) < max_results:
+            self._memo.add_events(start, math.inf, events)
+            return
+        # Everything starting before the last event's start was returned (the list is in start order).
+        last_start = events[-1].start
+        self._memo.add_events(start, last_start, [event for event in events if event.start < last_start])
+
+    def _created(self, start_time, end_time, recurrence: list[str] | None = None) -> None:
+        self._memo.invalidate(*series_window(start_time, end_time, recurrence, self._tz))
+
+
+class MemoizedCalendarClient(_Memoized):
+    def list_from_to(
+        self,
+        time_min, time_max,
+        *,
+        fields: str | None = None,
+        calendar_ids: list[str] | None = None,
+    ):
+        if fields is not None or not _default_calendars(calendar_ids):
+            return self._service.list_from_to(time_min, time_max, fields=fields, calendar_ids=calendar_ids)
+        start, end = self._window(time_min, time_max)
+        events = self._memo.events(start, end)
+        if events is None:
+            events = self._service.list_from_to(time_min, time_max, fields=_FIELDS)
+            self._memo.add_events(start, end, events)
+        return events
+
+    def list_events(
+        self,
+        time_min, max_results=5,
+        *,
+        fields: str | None = None,
+        calendar_ids: list[str] | None = None,
+    ):
+        if fields is not None or not _default_calendars(calendar_ids):
+            return self._service.list_events(time_min, max_results, fields=fields, calendar_ids=calendar_ids)
+        events = self._memo.upcoming(to_timestamp(time_min, self._tz), max_results)
+        if events is None:
+            events = self._service.list_events(time_min, max_results, fields=_FIELDS)
+            self._listed(time_min, max_results, events)
+        return events
+
+    def find_conflicts(
+        self,
+        windows: list[Window],
+        *,
+        include_all_day: bool = False,
+        calendar_ids: list[str] | None = None,
+    ) -> list[list[Event]]:
+        if not windows:
+            return []
+        if not _default_calendars(calendar_ids):
+            return self._service.find_conflicts(windows, include_all_day=include_all_day, calendar_ids=calendar_ids)
+        start, end = self._hull(windows)
+        return self._conflicts(self.list_from_to(_iso(start, self._tz), _iso(end, self._tz)), windows, include_all_day)
+
+    def free_busy(self, time_min, time_max, calendar_ids: list[str] | None = None) -> dict[str, list[dict]]:
+        calendar_ids = calendar_ids or [load_settings().default_calendar_id]
+        start, end = self._window(time_min, time_max)
+        busy = self._memo.busy(start, end, calendar_ids, self._tz)
+        if busy is None:
+            busy = self._service.free_busy(time_min, time_max, calendar_ids)
+            self._memo.add_busy(start, end, busy)
+        return busy
+
+    def get_event(self, event_id: str, **kwargs):
+        event = self._service.get_event(event_id, **kwargs)
+        self._memo.remember(event, self._tz)
+        return event
+
+    def get_events(self, event_ids: list[str]):
+        results = self._service.get_events(event_ids)
+        for result in results:
+            if result.ok:
+                self._memo.remember(result.response, self._tz)
+        return results
+
+    def create_event(self, summary, start_time, end_time, **kwargs):
+        created = self._service.create_event(summary, start_time, end_time, **kwargs)
+        self._created(start_time, end_time, kwargs.get("recurrence"))
+        return created
+
+    def create_events(self, events: list[dict]):
+        results = self._service.create_events(events)
+        for event, result in zip(events, results):
+            if result.ok:
+                self._created(event["start_time"], event["end_time"], event.get("recurrence"))
+        return results
+
+    def delete_event(self, event_id: str):
+        result = self._service.delete_event(event_id)
+        self._memo.invalidate_event(event_id)
+        return result
+
+    def delete_events(self, event_ids: list[str]):
+        results = self._service.delete_events(event_ids)
+        for event_id, result in zip(event_ids, results):
+            if result.ok:
+                self._memo.invalidate_event(event_id)
+        return results
+
+
+class AsyncMemoizedCalendarClient(_Memoized):
+    async def list_from_to(
+        self,
+        time_min, time_max,
+        *,
+        fields: str | None = None,
+        calendar_ids: list[str] | None = None,
+    ):
+        if fields is not None or not _default_calendars(calendar_ids):
+            return await self._service.list_from_to(time_min, time_max, fields=fields, calendar_ids=calendar_ids)
+        start, end = self._window(time_min, time_max)
+        events = self._memo.events(start, end)
+        if events is None:
+            events = await self._service.list_from_to(time_min, time_max, fields=_FIELDS)
+            self._memo.add_events(start, end, events)
+        return events
+
+    async def list_events(
+        self,
+        time_min, max_results=5,
+        *,
+        fields: str | None = None,
+        calendar_ids: list[str] | None = None,
+    ):
+        if fields is not None or not _default_calendars(calendar_ids):
+            return await self._service.list_events(time_min, max_results, fields=fields, calendar_ids=calendar_ids)
+        events = self._memo.upcoming(to_timestamp(time_min, self._tz), max_results)
+        if events is None:
+            events = await self._service.list_events(time_min, max_results, fields=_FIELDS)
+            self._listed(time_min, max_results, events)
+        return events
+
+    async def find_conflicts(
+        self,
+        windows: list[Window],
+        *,
+        include_all_day: bool = False,
+        calendar_ids: list[str] | None = None,
+    ) -> list[list[Event]]:
+        if not windows:
+            return []
+        if not _default_calendars(calendar_ids):
+            return await self._service.find_conflicts(windows, include_all_day=include_all_day, calendar_ids=calendar_ids)
+        start, end = self._hull(windows)
+        events = await self.list_from_to(_iso(start, self._tz), _iso(end, self._tz))
+        return self._conflicts(events, windows, include_all_day)
+
+    async def free_busy(self, time_min, time_max, calendar_ids: list[str] | None = None) -> dict[str, list[dict]]:
+        calendar_ids = calendar_ids or [load_settings().default_calendar_id]
+        start, end = self._window(time_min, time_max)
+        busy = self._memo.busy(start, end, calendar_ids, self._tz)
+        if busy is None:
+            busy = await self._service.free_busy(time_min, time_max, calendar_ids)
+            self._memo.add_busy(start, end, busy)
+        return busy
+
+    async def get_event(self, event_id: str, **kwargs):
+        event = await self._service.get_event(event_id, **kwargs)
+        self._memo.remember(event, self._tz)
+        return event
+
+    async def get_events(self, event_ids: list[str]):
+        results = await self._service.get_events(event_ids)
+        for result in results:
+            if result.ok:
+                self._memo.remember(result.response, self._tz)
+        return results
+
+    async def create_event(self, summary, start_time, end_time, **kwargs):
+        created = await self._service.create_event(summary, start_time, end_time, **kwargs)
+        self._created(start_time, end_time, kwargs.get("recurrence"))
+        return created
+
+    async def create_events(self, events: list[dict]):
+        results = await self._service.create_events(events)
+        for event, result in zip(events, results):
+            if result.ok:
+                self._created(event["start_time"], event["end_time"], event.get("recurrence"))
+        return results
+
+    async def delete_event(self, event_id: str):
+        result = await self._service.delete_event(event_id)
+        self._memo.invalidate_event(event_id)
+        return result
+
+    async def delete_events(self, event_ids: list[str]):
+        results = await self._service.delete_events(event_ids)
+        for event_id, result in zip(event_ids, results):
+            if result.ok:
+                self._memo.invalidate_event(event_id)
+        return results
+
+
+def memoized(service):
+    """`service`, answering reads from the current context's memo if there is one."""
+    memo = _memo.get()
+    return service if memo is None else MemoizedCalendarClient(service, memo)
+
+
+def amemoized(service):
+    """`memoized` for the async client."""
+    memo = _memo.get()
+    return service if memo is None else AsyncMemoizedCalendarClient(service, memo)
@@ -26,3 +26,13 @@ def err(
             "code": code,
         },
     }
+
+
+def calendar_err(exc) -> dict:
+    """Error envelope for a `GoogleCalendarError`."""
+    return err(
+        exc.message,
+        status=exc.status,
+        reason=exc.reason,
+        code="google_calendar_error",
+    )
@@ -0,0 +1,60 @@
+"""
+Cold start of one tool, run in a fresh interpreter by `benchmarks.suite`.
+
+    python -m benchmarks.cold_start app.tools.list_events list_next_events_tool '{"n": 5}' http://127.0.0.1:8080
+
+Prints JSON: the time to import the tool's module, the time of its first call
+(building the calendar client against the fake server included), and how much
+the process' peak RSS grew over each step.
+"""
+from __future__ import annotations
+
+import importlib
+import json
+import sys
+import time
+
+
+def _max_rss_kib() -> int | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def cold_start(module_name: str, tool_name: str, args: dict, calendar_url: str) -> dict:
+    baseline = _max_rss_kib()
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    import_s = time.perf_counter() - started
+    after_import = _max_rss_kib()
+
+    # Not timed as part of the import: the fake client stands in for the real one.
+    from app.services.client_provider import set_calendar_client
+    from benchmarks.fake_calendar import FakeCalendarClient
+
+    started = time.perf_counter()
+    set_calendar_client(FakeCalendarClient(calendar_url))
+    result = getattr(module, tool_name).invoke(args)
+    first_call_s = time.perf_counter() - started
+    after_call = _max_rss_kib()
+
+    report = {
+        "import_s": round(import_s, 4),
+        "first_call_s": round(first_call_s, 4),
+        "ok": bool(isinstance(result, dict) and result.get("ok")),
+    }
+    if baseline is not None:
+        report["import_rss_kib"] = after_import - baseline
+        report["first_call_rss_kib"] = after_call - after_import
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    module_name, tool_name, args, calendar_url = argv or sys.argv[1:]
+    print(json.dumps(cold_start(module_name, tool_name, json.loads(args), calendar_url)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Diff two `benchmarks.suite` result files.
+
+Prints every timing and throughput metric found in both, with the relative
+change, and exits non-zero when any of them got worse by more than
+`--threshold` percent.
+
+    python -m benchmarks.compare baseline.json results.json --threshold 10
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Metric name suffix -> whether a larger value is better (checked in order,
+# so "ops_per_s" is not taken for a duration).
+_METRICS = {"ops_per_s": True, "_ms": False, "_s": False, "_kib": False}
+
+
+def _flatten(data: dict, prefix: str = "") -> dict[str, float]:
+    flat = {}
+    for key, value in data.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(_flatten(value, path))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def _higher_is_better(path: str) -> bool | None:
+    name = path.rsplit(".", 1)[-1]
+    for suffix, higher in _METRICS.items():
+        if name.endswith(suffix):
+            return higher
+    return None
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> tuple[list[str], int]:
+    """Report lines and the number of regressions beyond `threshold` percent."""
+    old, new = _flatten(baseline.get("sizes", {})), _flatten(current.get("sizes", {}))
+    lines, regressions = [], 0
+    for path in sorted(old.keys() & new.keys()):
+        higher = _higher_is_better(path)
+        if higher is None:
+            continue
+        before, after = old[path], new[path]
+        change = (after - before) / before * 100 if before else 0.0
+        worse = change < -threshold if higher else change > threshold
+        regressions += worse
+        lines.append(f"{'!' if worse else ' '} {path:<70} {before:>12g} -> {after:>12g}  {change:+7.1f}%")
+    return lines, regressions
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent change that counts as a regression")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    if baseline.get("meta", {}).get("config") != current.get("meta", {}).get("config"):
+        print("warning: the runs used different settings (see meta.config)")
+    lines, regressions = compare(baseline, current, args.threshold)
+    print("\n".join(lines))
+    print(f"{regressions} regression(s) beyond {args.threshold:g}%")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
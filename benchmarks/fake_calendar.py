@@ -0,0 +1,452 @@
+"""
+A local stand-in for the Calendar v3 endpoints the client uses.
+
+`FakeCalendarServer` answers `events.list` (paging, time windows, sync
+tokens), `events.insert/get/delete`, `freebusy.query` and the batch endpoint
+over real HTTP, so a `GoogleCalendarClient` pointed at it pays the same
+discovery, serialization, transport and parsing costs it pays against Google.
+`fields=` partial-response masks are honoured, so payload sizes stay realistic.
+
+Every request can be delayed (`latency` plus up to `jitter` seconds) and a
+share of them failed with `error_status` (`error_rate`). Calendars are seeded
+with generated events, spread around today in the server's time zone:
+
+    with FakeCalendarServer({"primary": 10_000}, latency=0.02) as server:
+        client = FakeCalendarClient(server.url)
+
+Recurring events are stored as one event; the server does not expand them.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import random
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from copy import deepcopy
+from datetime import date, datetime, timedelta
+from email.parser import FeedParser
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from zoneinfo import ZoneInfo
+
+from app.services.discovery import calendar_discovery_document
+from app.services.google_calendar import GoogleCalendarClient
+
+_API_PREFIX = "/calendar/v3/"
+_BATCH_PATH = "/batch/calendar/v3"
+_MAX_PAGE_SIZE = 2500
+_TITLES = ("Standup", "1:1", "Design review", "Planning", "Lunch", "Customer call", "Interview", "Focus time")
+
+
+class FakeCalendarClient(GoogleCalendarClient):
+    """`GoogleCalendarClient` talking to a `FakeCalendarServer` at `base_url`."""
+
+    def __init__(self, base_url: str):
+        from google.oauth2.credentials import Credentials
+
+        self._base_url = base_url.rstrip("/") + "/"
+        # A token without expiry is always valid, so nothing is ever refreshed.
+        super().__init__(Credentials(token="benchmark"))
+
+    def _build_service(self):
+        from googleapiclient.discovery import build_from_document
+
+        from app.services.response_model import OrjsonModel
+
+        # rootUrl also places the batch endpoint, which `api_endpoint` would not move.
+        document = {**calendar_discovery_document(), "rootUrl": self._base_url}
+        return build_from_document(document, credentials=self._credentials, model=OrjsonModel())
+
+
+def _parse_mask(text: str) -> dict:
+    """Parse a `fields=` mask ("items(id,start),nextPageToken") into a tree; None leaves select everything."""
+    return _parse_fields(text, 0)[0]
+
+
+def _parse_fields(text: str, i: int) -> tuple[dict, int]:
+    tree: dict = {}
+    name = ""
+    while i < len(text):
+        char = text[i]
+        if char == "(":
+            subtree, i = _parse_fields(text, i + 1)
+            _add_field(tree, name, subtree)
+            name = ""
+        elif char == ")":
+            break
+        elif char == ",":
+            _add_field(tree, name, None)
+            name = ""
+        else:
+            name += char
+        i += 1
+    _add_field(tree, name, None)
+    return tree, i
+
+
+def _add_field(tree: dict, name: str, subtree: dict | None) -> None:
+    path = name.strip().split("/")
+    if not path[-1]:
+        return
+    for part in path[:-1]:
+        tree = tree.setdefault(part, {})
+    if subtree is not None or path[-1] not in tree:
+        tree[path[-1]] = subtree
+
+
+def _select(value, tree: dict | None):
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [_select(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {key: _select(value[key], subtree) for key, subtree in tree.items() if key in value}
+    return value
+
+
+class _Record:
+    __slots__ = ("event", "start", "end", "version")
+
+    def __init__(self, event: dict, start: float, end: float, version: int):
+        self.event = event
+        self.start = start
+        self.end = end
+        self.version = version
+
+
+class FakeCalendar:
+    """One calendar's events, indexed by start time, with a change log for sync tokens."""
+
+    def __init__(self, calendar_id: str, tz: ZoneInfo):
+        self.calendar_id = calendar_id
+        self.tz = tz
+        self._records: dict[str, _Record] = {}
+        self._index: list[tuple[float, str]] = []
+        self._max_duration = 0.0
+        self._version = 0
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _timestamp(self, value: dict | str) -> float:
+        if isinstance(value, dict):
+            if "date" in value:
+                return datetime.combine(date.fromisoformat(value["date"]), datetime.min.time(), self.tz).timestamp()
+            value = value["dateTime"]
+        parsed = datetime.fromisoformat(value)
+        return (parsed if parsed.tzinfo else parsed.replace(tzinfo=self.tz)).timestamp()
+
+    def seed(self, count: int, *, seed: int = 0) -> None:
+        """Add `count` generated events: a few a day, centred on today, with full resource bodies."""
+        rng = random.Random(seed)
+        per_day = 6
+        now = datetime.now(self.tz)
+        today = now.date()
+        first_day = today - timedelta(days=count // per_day // 2)
+        for i in range(count):
+            day = first_day + timedelta(days=i // per_day)
+            slot = i % per_day
+            if slot == per_day - 1 and rng.random() < 0.2:
+                event = {"start": {"date": day.isoformat()}, "end": {"date": (day + timedelta(days=1)).isoformat()}}
+            else:
+                start = datetime.combine(day, datetime.min.time(), self.tz) + timedelta(hours=8 + slot * 1.5)
+                end = start + timedelta(minutes=rng.choice((15, 30, 45, 60, 90)))
+                event = {
+                    "start": {"dateTime": start.isoformat(), "timeZone": str(self.tz)},
+                    "end": {"dateTime": end.isoformat(), "timeZone": str(self.tz)},
+                }
+            event["summary"] = rng.choice(_TITLES)
+            event["description"] = "Agenda: " + ", ".join(rng.choices(_TITLES, k=12))
+            event["attendees"] = [
+                {"email": f"person{rng.randrange(500)}@example.com", "responseStatus": rng.choice(("accepted", "tentative"))}
+                for _ in range(rng.randrange(1, 6))
+            ]
+            if rng.random() < 0.1:
+                event["transparency"] = "transparent"
+            self._add(event, now.isoformat())
+
+    def insert(self, body: dict) -> dict:
+        return self._add(deepcopy(body), datetime.now(self.tz).isoformat())
+
+    def _add(self, body: dict, now: str) -> dict:
+        with self._lock:
+            self._next_id += 1
+            self._version += 1
+            event_id = f"evt{self._next_id:07d}"
+            event = {
+                "kind": "calendar#event",
+                "id": event_id,
+                "status": "confirmed",
+                "htmlLink": f"https://calendar.example.com/event?eid={event_id}",
+                "created": now,
+                "updated": now,
+                "organizer": {"email": self.calendar_id, "self": True},
+                **body,
+            }
+            record = _Record(event, self._timestamp(event["start"]), self._timestamp(event["end"]), self._version)
+            self._records[event_id] = record
+            bisect.insort(self._index, (record.start, event_id))
+            self._max_duration = max(self._max_duration, record.end - record.start)
+            return event
+
+    def get(self, event_id: str) -> dict | None:
+        record = self._records.get(event_id)
+        if record is None or record.event["status"] == "cancelled":
+            return None
+        return record.event
+
+    def delete(self, event_id: str) -> int:
+        """Delete `event_id`; returns the HTTP status the API would answer with."""
+        with self._lock:
+            record = self._records.get(event_id)
+            if record is None:
+                return 404
+            if record.event["status"] == "cancelled":
+                return 410
+            self._version += 1
+            # Deleted events stay behind as tombstones so incremental syncs report them.
+            record.event = {"id": event_id, "status": "cancelled"}
+            record.version = self._version
+            self._index.remove((record.start, event_id))
+            return 204
+
+    def window(self, time_min: float | None, time_max: float | None) -> list[dict]:
+        """Live events overlapping [time_min, time_max), in start order."""
+        with self._lock:
+            lo = 0 if time_min is None else bisect.bisect_left(self._index, (time_min - self._max_duration,))
+            hi = len(self._index) if time_max is None else bisect.bisect_left(self._index, (time_max,))
+            records = [self._records[event_id] for _, event_id in self._index[lo:hi]]
+        return [record.event for record in records if time_min is None or record.end > time_min]
+
+    def changes(self, since: int) -> tuple[list[dict], int]:
+        """Events (including tombstones) changed after version `since`, and the current version."""
+        with self._lock:
+            changed = [record.event for record in self._records.values() if record.version > since]
+            return changed, self._version
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+
+class FakeCalendarServer:
+    """
+    Threaded HTTP server serving `calendars` ({calendar id: seeded event count}).
+    Use as a context manager, or `start()` / `stop()`; `url` is the base URL.
+    `requests` counts API calls by operation (a batch's calls included);
+    `http_requests` counts round trips.
+    """
+
+    def __init__(
+        self,
+        calendars: dict[str, int] | None = None,
+        *,
+        timezone: str = "UTC",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.tz = ZoneInfo(timezone)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.calendars: dict[str, FakeCalendar] = {}
+        for offset, (calendar_id, count) in enumerate((calendars or {"primary": 0}).items()):
+            self.calendar(calendar_id).seed(count, seed=seed + offset)
+        self.requests: Counter[str] = Counter()
+        self.http_requests = 0
+        self._count_lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def calendar(self, calendar_id: str) -> FakeCalendar:
+        calendar = self.calendars.get(calendar_id)
+        if calendar is None:
+            calendar = self.calendars[calendar_id] = FakeCalendar(calendar_id, self.tz)
+        return calendar
+
+    def start(self) -> FakeCalendarServer:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-calendar", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> FakeCalendarServer:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _count(self, operation: str) -> None:
+        with self._count_lock:
+            self.requests[operation] += 1
+
+    def _delay_and_fail(self) -> bool:
+        """Sleep the configured latency; True when this request should fail."""
+        with self._random_lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self.error_rate > 0 and self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        return fail
+
+    def handle(self, method: str, target: str, body: bytes) -> tuple[int, dict | None]:
+        """Route one API call (outside of a batch) to its handler: (status, JSON body)."""
+        url = urllib.parse.urlsplit(target)
+        query = {key: values[-1] for key, values in urllib.parse.parse_qs(url.query).items()}
+        path = url.path.removeprefix(_API_PREFIX).split("/")
+        payload = json.loads(body) if body else {}
+        if path == ["freeBusy"] and method == "POST":
+            self._count("freebusy.query")
+            return 200, self._free_busy(payload)
+        if len(path) >= 3 and path[0] == "calendars" and path[2] == "events":
+            calendar = self.calendar(urllib.parse.unquote(path[1]))
+            if len(path) == 3 and method == "GET":
+                self._count("events.list")
+                return self._list(calendar, query)
+            if len(path) == 3 and method == "POST":
+                self._count("events.insert")
+                return 200, _select(calendar.insert(payload), _parse_mask(query["fields"]) if "fields" in query else None)
+            if len(path) == 4:
+                event_id = urllib.parse.unquote(path[3])
+                if method == "GET":
+                    self._count("events.get")
+                    event = calendar.get(event_id)
+                    if event is None:
+                        return _error(404, "notFound", "Not Found")
+                    return 200, _select(event, _parse_mask(query["fields"]) if "fields" in query else None)
+                if method == "DELETE":
+                    self._count("events.delete")
+                    status = calendar.delete(event_id)
+                    if status == 404:
+                        return _error(404, "notFound", "Not Found")
+                    if status == 410:
+                        return _error(410, "deleted", "Resource has been deleted")
+                    return 204, None
+        return _error(404, "notFound", f"No fake for {method} {url.path}")
+
+    def _list(self, calendar: FakeCalendar, query: dict) -> tuple[int, dict]:
+        page_size = min(int(query.get("maxResults", 250)), _MAX_PAGE_SIZE)
+        offset = int(query.get("pageToken") or 0)
+        if "syncToken" in query:
+            since = int(query["syncToken"])
+            if since > calendar.version:
+                return _error(410, "fullSyncRequired", "Sync token is no longer valid")
+            items, version = calendar.changes(since)
+        else:
+            time_min = calendar._timestamp(query["timeMin"]) if "timeMin" in query else None
+            time_max = calendar._timestamp(query["timeMax"]) if "timeMax" in query else None
+            items, version = calendar.window(time_min, time_max), calendar.version
+        response = {
+            "kind": "calendar#events",
+            "summary": calendar.calendar_id,
+            "timeZone": str(calendar.tz),
+            "items": items[offset:offset + page_size],
+        }
+        if offset + page_size < len(items):
+            response["nextPageToken"] = str(offset + page_size)
+        else:
+            response["nextSyncToken"] = str(version)
+        return 200, _select(response, _parse_mask(query["fields"]) if "fields" in query else None)
+
+    def _free_busy(self, payload: dict) -> dict:
+        calendars = {}
+        for item in payload.get("items", []):
+            calendar = self.calendar(item["id"])
+            events = calendar.window(calendar._timestamp(payload["timeMin"]), calendar._timestamp(payload["timeMax"]))
+            calendars[item["id"]] = {
+                "busy": [
+                    {"start": event["start"].get("dateTime", event["start"].get("date")),
+                     "end": event["end"].get("dateTime", event["end"].get("date"))}
+                    for event in events
+                    if event.get("transparency") != "transparent"
+                ]
+            }
+        return {"kind": "calendar#freeBusy", "timeMin": payload["timeMin"], "timeMax": payload["timeMax"], "calendars": calendars}
+
+    def handle_batch(self, content_type: str, body: bytes) -> tuple[str, bytes]:
+        """Answer a multipart/mixed batch: (response content type, response body)."""
+        parser = FeedParser()
+        parser.feed(f"Content-Type: {content_type}\r\n\r\n")
+        parser.feed(body.decode("utf-8"))
+        boundary = "batch_fake_calendar"
+        parts = []
+        for part in parser.close().get_payload():
+            request_line, _, rest = part.get_payload().partition("\n")
+            method, target, _ = request_line.split(" ", 2)
+            _, _, inner_body = rest.replace("\r\n", "\n").partition("\n\n")
+            status, payload = self.handle(method, target, inner_body.encode("utf-8"))
+            content = json.dumps(payload) if payload is not None else ""
+            reason = HTTPStatus(status).phrase
+            parts.append(
+                f"--{boundary}\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-{part['Content-ID'][1:-1]}>\r\n\r\n"
+                f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json; charset=UTF-8\r\n\r\n{content}\r\n"
+            )
+        parts.append(f"--{boundary}--\r\n")
+        return f"multipart/mixed; boundary={boundary}", "".join(parts).encode("utf-8")
+
+
+def _error(status: int, reason: str, message: str) -> tuple[int, dict]:
+    return status, {"error": {"code": status, "message": message, "errors": [{"reason": reason, "message": message}]}}
+
+
+def _handler(server: FakeCalendarServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        # Keep-alive, like the real API; the client's transports reuse connections.
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out as separate writes; without this each response waits on a delayed ACK.
+        disable_nagle_algorithm = True
+
+        def _respond(self, status: int, content_type: str, body: bytes) -> None:
+            self.send_response(status)
+            if body:
+                self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _dispatch(self) -> None:
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            with server._count_lock:
+                server.http_requests += 1
+            if server._delay_and_fail():
+                server._count("injected_error")
+                status, payload = _error(server.error_status, "backendError", "Injected failure")
+                self._respond(status, "application/json", json.dumps(payload).encode("utf-8"))
+                return
+            if self.path.startswith(_BATCH_PATH):
+                server._count("batch")
+                content_type, content = server.handle_batch(self.headers["Content-Type"], body)
+                self._respond(200, content_type, content)
+                return
+            status, payload = server.handle(self.command, self.path, body)
+            content = json.dumps(payload).encode("utf-8") if payload is not None else b""
+            self._respond(status, "application/json; charset=UTF-8", content)
+
+        do_GET = do_POST = do_DELETE = _dispatch
+
+        def log_message(self, format, *args) -> None:
+            pass
+
+    return Handler
@@ -0,0 +1,93 @@
+"""
+A scripted chat model for benchmarking the agent without calling OpenAI.
+
+Each script maps a user prompt to the steps of its turn: a step is a list of
+tool calls (name, args) for the model to emit, or a string for the final
+reply. The step is chosen by how many model replies the turn already has, so
+the same model serves any number of concurrent sessions. `latency` simulates
+the provider's response time; usage metadata is estimated from the text so
+token accounting and telemetry see plausible numbers.
+
+    model = ScriptedChatModel(scripts={
+        "Am I free at 3?": [[("check_conflicts_tool", {...})], "You are free at 3."],
+    })
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Sequence, Union
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+Step = Union[str, list[tuple[str, dict]]]
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class ScriptedChatModel(BaseChatModel):
+    scripts: dict[str, list[Step]]
+    default_reply: str = "Sorry, I can only answer scripted prompts."
+    latency: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools: Sequence[Any], *, tool_choice: Any = None, **kwargs: Any):
+        # The script already knows which tools it calls.
+        return self
+
+    def _reply(self, messages: list[BaseMessage]) -> AIMessage:
+        start = max((i for i, message in enumerate(messages) if isinstance(message, HumanMessage)), default=0)
+        prompt = messages[start].content if messages else ""
+        step = sum(isinstance(message, AIMessage) for message in messages[start + 1:])
+        script = self.scripts.get(prompt, [self.default_reply])
+        action = script[min(step, len(script) - 1)]
+        if isinstance(action, str):
+            message = AIMessage(content=action)
+        else:
+            message = AIMessage(
+                content="",
+                tool_calls=[
+                    {"name": name, "args": args, "id": f"call_{step}_{i}", "type": "tool_call"}
+                    for i, (name, args) in enumerate(action)
+                ],
+            )
+        prompt_text = "".join(str(message.content) for message in messages)
+        output_text = message.content or json.dumps(message.tool_calls, default=str)
+        input_tokens, output_tokens = _estimate_tokens(prompt_text), _estimate_tokens(output_text)
+        message.usage_metadata = {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+        return message
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
@@ -0,0 +1,73 @@
+"""
+Time-to-first-prompt benchmark for the CLI.
+
+Runs `app.main` in a fresh interpreter and measures how long it takes for the
+"> " prompt to appear on stdout, once with the agent built eagerly (the old
+behaviour) and once with the default background warm-up.
+
+    python -m benchmarks.startup --runs 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PROMPT = b"> "
+
+
+def time_to_first_prompt(eager: bool) -> float:
+    env = dict(os.environ)
+    # CalendarAgent construction only needs a syntactically present key.
+    env.setdefault("OPENAI_API_KEY", "benchmark")
+    code = f"from app.main import main; main(eager={eager!r})"
+
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    seen = b""
+    while not seen.endswith(PROMPT):
+        chunk = proc.stdout.read(1)
+        if not chunk:
+            raise RuntimeError("app.main exited before showing a prompt")
+        seen += chunk
+    elapsed = time.perf_counter() - started
+
+    proc.communicate(b"exit\n", timeout=60)
+    return elapsed
+
+
+def run(runs: int) -> dict:
+    results = {}
+    for label, eager in (("eager", True), ("lazy", False)):
+        samples = [time_to_first_prompt(eager) for _ in range(runs)]
+        results[label] = {
+            "runs": runs,
+            "median_s": round(statistics.median(samples), 4),
+            "min_s": round(min(samples), 4),
+            "max_s": round(max(samples), 4),
+        }
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+    print(json.dumps({"time_to_first_prompt": run(args.runs)}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
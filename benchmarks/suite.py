@@ -0,0 +1,351 @@
+"""
+End-to-end benchmarks against a local fake Calendar API and a scripted model.
+
+For each calendar size it starts a `FakeCalendarServer` seeded with that many
+events, points the tools at it, and measures:
+
+- startup: per tool, a fresh interpreter's import time, first-call time and
+  RSS growth (`benchmarks.cold_start`);
+- tools: per tool, steady-state throughput and latency percentiles, and the
+  Calendar API requests each call costs;
+- turns: agent turns (`CalendarAgent.arun`) driven by `ScriptedChatModel`,
+  end to end, with the time split between model, tools and the Calendar API;
+- decode: the client-side cost of one full listing page, decoded and parsed
+  into `Event`s by the stdlib `JsonModel`, `OrjsonModel` and `EventListModel`.
+
+Results are JSON (stdout, or `--output`) with stable keys, so two runs can be
+diffed with `python -m benchmarks.compare old.json new.json`.
+
+    python -m benchmarks.suite --events 10,1000,100000 --latency 0.03 --output results.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Tool name -> module; `benchmarks.cold_start` imports the module in a fresh interpreter.
+TOOL_MODULES = {
+    "list_next_events_tool": "app.tools.list_events",
+    "list_today_events_tool": "app.tools.list_events",
+    "check_conflicts_tool": "app.tools.create_event",
+    "find_free_slots_tool": "app.tools.find_free_slots",
+    "create_event_tool": "app.tools.create_event",
+    "create_events_tool": "app.tools.create_event",
+    "delete_event_tool": "app.tools.delete_event",
+    "delete_events_tool": "app.tools.delete_event",
+}
+
+
+def _configure(args: argparse.Namespace) -> None:
+    """Settings for the run; set before anything reads them, and winning over `.env`."""
+    os.environ.update(
+        {
+            "OPENAI_API_KEY": "benchmark",
+            "OPENAI_MODEL": "scripted",
+            "GOOGLE_CALENDAR_ID": "primary",
+            "CALENDAR_IDS": "",
+            "CALENDAR_MAX_QPS": str(args.max_qps),
+            "EVENT_CACHE_ENABLED": "true" if args.event_cache else "false",
+            "GOOGLE_OAUTH_INTERACTIVE": "false",
+            "CREDENTIAL_STORE": "",
+            "CONVERSATION_STORE": "memory",
+            "RESPONSE_CACHE_ENABLED": "false",
+            "TRACE_LOG": "",
+        }
+    )
+
+
+def _percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+def _latency(samples: list[float]) -> dict:
+    return {
+        "p50_ms": round(_percentile(samples, 0.5) * 1000, 3),
+        "p95_ms": round(_percentile(samples, 0.95) * 1000, 3),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 3),
+    }
+
+
+class _Scenario:
+    """Fixed times (tomorrow, in the calendar's zone) and a supply of deletable event ids."""
+
+    def __init__(self, server, tz):
+        self.server = server
+        day = datetime.now(tz).date() + timedelta(days=1)
+        self.morning = datetime.combine(day, datetime.min.time(), tz) + timedelta(hours=10)
+        self._deletable: list[str] = []
+
+    def at(self, hours: float) -> str:
+        return (self.morning + timedelta(hours=hours)).isoformat()
+
+    def deletable(self, count: int) -> list[str]:
+        calendar = self.server.calendar("primary")
+        while len(self._deletable) < count:
+            event = calendar.insert({"summary": "Disposable", "start": {"dateTime": self.at(-20)}, "end": {"dateTime": self.at(-19)}})
+            self._deletable.append(event["id"])
+        taken, self._deletable = self._deletable[:count], self._deletable[count:]
+        return taken
+
+
+# Tool name -> arguments for one call; write tools get fresh arguments every call.
+TOOL_ARGS: dict[str, Callable[[_Scenario], dict]] = {
+    "list_next_events_tool": lambda s: {"n": 5},
+    "list_today_events_tool": lambda s: {},
+    "check_conflicts_tool": lambda s: {"start": s.at(0), "end": s.at(1)},
+    "find_free_slots_tool": lambda s: {"start": s.at(-1), "end": s.at(56), "duration_minutes": 30},
+    "create_event_tool": lambda s: {"title": "Benchmark", "start": s.at(-22), "end": s.at(-21.5)},
+    "create_events_tool": lambda s: {
+        "events": [{"title": f"Benchmark {i}", "start": s.at(-22 + i), "end": s.at(-21.5 + i)} for i in range(3)]
+    },
+    "delete_event_tool": lambda s: {"event_id": s.deletable(1)[0]},
+    "delete_events_tool": lambda s: {"event_ids": s.deletable(3)},
+}
+
+
+def _turn_scripts(s: _Scenario) -> dict[str, list]:
+    """Prompt -> the scripted model's steps (tool calls, then the reply)."""
+    return {
+        "What does my week look like?": [[("list_next_events_tool", {"n": 10})], "Here is your week."],
+        "Book a design sync tomorrow at 10": [
+            [("check_conflicts_tool", {"start": s.at(0), "end": s.at(1)})],
+            [("create_event_tool", {"title": "Design sync", "start": s.at(0), "end": s.at(1)})],
+            "Booked the design sync for tomorrow at 10.",
+        ],
+        "When can I fit a 30 minute call in the next few days?": [
+            [("find_free_slots_tool", {"start": s.at(-1), "end": s.at(56), "duration_minutes": 30})],
+            "You are free tomorrow at 9.",
+        ],
+        "What's on today, and what comes after?": [
+            [("list_today_events_tool", {}), ("list_next_events_tool", {"n": 3})],
+            "Here is today, and what comes next.",
+        ],
+    }
+
+
+# Scenario name -> prompt; "fast_path" is answered by the router without the model.
+TURNS = {
+    "agenda": "What does my week look like?",
+    "book": "Book a design sync tomorrow at 10",
+    "find_slot": "When can I fit a 30 minute call in the next few days?",
+    "parallel_reads": "What's on today, and what comes after?",
+    "fast_path": "list today's events",
+}
+
+
+def bench_startup(calendar_url: str, scenario: _Scenario) -> dict:
+    results = {}
+    for name, module in TOOL_MODULES.items():
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.cold_start", module, name, json.dumps(TOOL_ARGS[name](scenario)), calendar_url],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        results[name] = json.loads(output)
+    return results
+
+
+def bench_tools(server, scenario: _Scenario, iterations: int) -> dict:
+    from app.agent.calendar_agent import TOOLS
+
+    tools = {tool.name: tool for tool in TOOLS}
+    results = {}
+    for name in TOOL_MODULES:
+        tool = tools[name]
+        tool.invoke(TOOL_ARGS[name](scenario))  # warm-up: syncs the local store, opens connections
+        requests_before = server.http_requests
+        samples, errors = [], 0
+        started = time.perf_counter()
+        for _ in range(iterations):
+            args = TOOL_ARGS[name](scenario)
+            call_started = time.perf_counter()
+            result = tool.invoke(args)
+            samples.append(time.perf_counter() - call_started)
+            errors += not result.get("ok")
+        elapsed = time.perf_counter() - started
+        results[name] = {
+            "calls": iterations,
+            "ops_per_s": round(iterations / elapsed, 2),
+            **_latency(samples),
+            "errors": errors,
+            "api_requests_per_call": round((server.http_requests - requests_before) / iterations, 3),
+        }
+    return results
+
+
+def _histogram_sum(snapshot: dict, name: str) -> float:
+    return sum(series["sum"] for series in snapshot["histograms"].get(name, []))
+
+
+def bench_turns(server, scenario: _Scenario, iterations: int, llm_latency: float) -> dict:
+    from app.agent.calendar_agent import CalendarAgent
+    from app.services.telemetry import get_metrics
+    from benchmarks.fake_llm import ScriptedChatModel
+
+    agent = CalendarAgent(llm=ScriptedChatModel(scripts=_turn_scripts(scenario), latency=llm_latency))
+    metrics = get_metrics()
+
+    async def turns(prompt: str) -> tuple[list[float], int]:
+        samples, errors = [], 0
+        for _ in range(iterations):
+            started = time.perf_counter()
+            try:
+                await agent.arun(prompt)
+            except Exception:
+                errors += 1
+            samples.append(time.perf_counter() - started)
+        return samples, errors
+
+    results = {}
+    for name, prompt in TURNS.items():
+        asyncio.run(agent.arun(prompt))  # warm-up
+        metrics.clear()
+        requests_before = server.http_requests
+        samples, errors = asyncio.run(turns(prompt))
+        snapshot = metrics.snapshot()
+        results[name] = {
+            "turns": iterations,
+            **_latency(samples),
+            "errors": errors,
+            "api_requests_per_turn": round((server.http_requests - requests_before) / iterations, 3),
+            # Tool calls run concurrently, so the parts can add up to more than the turn.
+            "breakdown_ms_per_turn": {
+                part: round(_histogram_sum(snapshot, metric) / iterations * 1000, 3)
+                for part, metric in (("llm", "llm_seconds"), ("tools", "tool_seconds"), ("calendar_api", "calendar_api_seconds"))
+            },
+        }
+    return results
+
+
+def bench_decode(server, tz, iterations: int) -> dict:
+    import httplib2
+    from googleapiclient.model import JsonModel
+
+    from app.services.events import Event
+    from app.services.fields import list_mask
+    from app.services.response_model import EventListModel, OrjsonModel
+
+    # The largest page the API returns, with the fields conflict checks and the memo ask for.
+    query = urlencode({"singleEvents": "true", "orderBy": "startTime", "maxResults": 2500, "fields": list_mask("conflicts")})
+    with urlopen(f"{server.url}/calendar/v3/calendars/primary/events?{query}") as response:
+        content = response.read()
+    ok = httplib2.Response({"status": 200})
+
+    paths = {
+        "stdlib": lambda: [Event.from_api(item, tz) for item in JsonModel().response(ok, content)["items"]],
+        "orjson": lambda: [Event.from_api(item, tz) for item in OrjsonModel().response(ok, content)["items"]],
+        "orjson_events": lambda: EventListModel(tz).response(ok, content)["items"],
+    }
+    results = {"page_events": len(paths["stdlib"]()), "page_bytes": len(content)}
+    for name, decode in paths.items():
+        samples = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            decode()
+            samples.append(time.perf_counter() - started)
+        results[name] = _latency(samples)
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args: argparse.Namespace) -> dict:
+    _configure(args)
+    from app.config.settings import reload_settings
+    from app.services.client_provider import set_calendar_client
+    from benchmarks.fake_calendar import FakeCalendarClient, FakeCalendarServer
+
+    settings = reload_settings()
+    results = {
+        "meta": {
+            "timestamp": datetime.now().astimezone().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": {
+                key: getattr(args, key)
+                for key in ("iterations", "latency", "jitter", "error_rate", "error_status", "llm_latency", "event_cache", "max_qps")
+            },
+        },
+        "sizes": {},
+    }
+    for size in args.events:
+        server = FakeCalendarServer(
+            {"primary": size},
+            timezone=settings.timezone,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            seed=args.seed,
+        )
+        with server:
+            scenario = _Scenario(server, settings.tzinfo)
+            sized = {}
+            if "startup" in args.sections:
+                sized["startup"] = bench_startup(server.url, scenario)
+            # A fresh client per size, so no local store carries over.
+            set_calendar_client(FakeCalendarClient(server.url))
+            if "tools" in args.sections:
+                sized["tools"] = bench_tools(server, scenario, args.iterations)
+            if "turns" in args.sections:
+                sized["turns"] = bench_turns(server, scenario, args.iterations, args.llm_latency)
+            if "decode" in args.sections:
+                sized["decode"] = bench_decode(server, settings.tzinfo, args.iterations)
+            sized["api_requests"] = {"http": server.http_requests, **dict(sorted(server.requests.items()))}
+        results["sizes"][str(size)] = sized
+    return results
+
+
+def _csv(parse: Callable[[str], object]) -> Callable[[str], list]:
+    return lambda value: [parse(part) for part in value.split(",") if part]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=_csv(int), default=[10, 1000, 10000], help="calendar sizes, e.g. 10,1000,100000")
+    parser.add_argument("--iterations", type=int, default=50, help="calls per tool and turns per scenario")
+    parser.add_argument("--sections", type=_csv(str), default=["startup", "tools", "turns", "decode"])
+    parser.add_argument("--latency", type=float, default=0.0, help="fake API latency per request, seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of API requests that fail")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="scripted model latency per call, seconds")
+    parser.add_argument("--no-event-cache", dest="event_cache", action="store_false")
+    parser.add_argument("--max-qps", type=float, default=1_000_000, help="client-side CALENDAR_MAX_QPS")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    text = json.dumps(run(args), indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
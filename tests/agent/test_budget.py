@@ -0,0 +1,133 @@
+import json
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage, ToolMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.agent import budget as budget_module
+from app.agent.budget import PromptBudget, budget_tools, compact_description, encode_result
+from app.agent.calendar_agent import CalendarAgent
+from app.services.events import Event
+from app.tools.create_event import check_conflicts_tool, create_event_tool, create_events_tool
+from app.tools.list_events import list_today_events_tool
+from app.tools.response import err, ok
+
+
+class MockSettings:
+    openai_api = "test"
+    openai_model = "test-model"
+    conversation_max_tokens = 6000
+    conversation_keep_tokens = 2000
+    fast_path_enabled = False
+    response_cache_enabled = False
+    tool_verbose = False
+    tool_result_max_events = 2
+    tool_memo = "turn"
+
+
+def _event(i):
+    return {
+        "summary": f"Meeting {i}",
+        "start": f"2026-10-18T1{i}:00:00+03:00",
+        "end": f"2026-10-18T1{i}:30:00+03:00",
+        "eventId": f"e{i}",
+    }
+
+
+def test_compact_results_drop_nulls_and_shorten_keys_and_times():
+    result = ok({"conflict_count": 1, "conflicts": [_event(0)], "created": datetime(2026, 10, 18, 9, 0, tzinfo=ZoneInfo("UTC"))})
+
+    assert json.loads(encode_result(result)) == {
+        "ok": True,
+        "data": {
+            "count": 1,
+            "conflicts": [{"summary": "Meeting 0", "start": "2026-10-18T10:00+03:00", "end": "10:30", "id": "e0"}],
+            "created": "2026-10-18T09:00Z",
+        },
+    }
+    assert json.loads(encode_result(err("Not found.", status=404))) == {
+        "ok": False,
+        "error": {"message": "Not found.", "status": 404},
+    }
+
+
+def test_long_event_lists_are_paged_with_a_cursor():
+    result = ok({"events": [_event(i) for i in range(5)]})
+
+    first = json.loads(encode_result(result, max_events=2))
+    last = json.loads(encode_result(result, cursor=first["data"]["more"]["cursor"], max_events=3))
+
+    assert [e["id"] for e in first["data"]["events"]] == ["e0", "e1"]
+    assert first["data"]["more"] == {"remaining": 3, "cursor": "2"}
+    assert [e["id"] for e in last["data"]["events"]] == ["e2", "e3", "e4"]
+    assert "more" not in last["data"]
+
+
+def test_compact_descriptions_keep_the_summary_and_exclusions():
+    description = compact_description(check_conflicts_tool)
+
+    assert description.startswith("Check for existing calendar events that conflict")
+    assert "Not for: The user is explicitly asking to create" in description
+    assert "Example usage" not in description
+    assert len(description) < len(check_conflicts_tool.description) / 3
+
+
+def test_compact_descriptions_keep_argument_formats_and_bulk_tools():
+    conflicts = compact_description(check_conflicts_tool)
+    single = compact_description(create_event_tool)
+    bulk = compact_description(create_events_tool)
+
+    assert "\nArgs: start, end as ISO 8601 with UTC offset" in conflicts
+    assert "recurrence as an RFC 5545 RRULE" in conflicts
+    assert "calendar_ids defaults to the user's configured calendars" in conflicts
+    assert "use create_events_tool" in single
+    assert "times as ISO 8601 with UTC offset" in bulk and "use create_event_tool" in bulk
+
+
+def test_budgeted_tools_take_a_cursor_and_keep_the_full_result_as_artifact(monkeypatch):
+    class MockService:
+        def list_from_to(self, time_min, time_max, fields=None, calendar_ids=None):
+            return [Event.from_api({**_event(i), "id": f"e{i}", "start": {"dateTime": _event(i)["start"]},
+                                    "end": {"dateTime": _event(i)["end"]}}, ZoneInfo("UTC")) for i in range(3)]
+
+    monkeypatch.setattr("app.tools.list_events.get_calendar_client", lambda: MockService())
+    (tool,) = budget_tools([list_today_events_tool], max_events=2)
+
+    message = tool.invoke({"type": "tool_call", "name": tool.name, "id": "c1", "args": {"cursor": "2"}})
+
+    assert "cursor" in tool.args
+    assert json.loads(message.content)["data"]["events"][0]["id"] == "e2"
+    assert len(message.artifact["data"]["events"]) == 3
+
+
+def test_agent_turns_report_tokens_sent_and_saved(monkeypatch):
+    class ToolModel(FakeMessagesListChatModel):
+        def bind_tools(self, tools, **kwargs):
+            return self
+
+    class MockService:
+        def list_from_to(self, time_min, time_max, fields=None, calendar_ids=None):
+            return [Event.from_api({"id": f"e{i}", "summary": f"Meeting {i}", "start": {"dateTime": _event(i)["start"]},
+                                    "end": {"dateTime": _event(i)["end"]}}, ZoneInfo("UTC")) for i in range(5)]
+
+    model = ToolModel(responses=[
+        AIMessage(content="", tool_calls=[{"name": "list_today_events_tool", "args": {}, "id": "c1"}]),
+        AIMessage(content="You have 5 meetings."),
+    ])
+    monkeypatch.setattr(budget_module, "_budget", PromptBudget())
+    monkeypatch.setattr("app.agent.calendar_agent.load_settings", lambda: MockSettings())
+    monkeypatch.setattr("app.agent.calendar_agent.ChatOpenAI", lambda **kwargs: model)
+    monkeypatch.setattr("app.tools.list_events.get_calendar_client", lambda: MockService())
+    agent = CalendarAgent(checkpointer=InMemorySaver())
+
+    agent.run("What's on today, in detail?", session_id="s1")
+
+    history = agent.agent.get_state({"configurable": {"thread_id": "s1"}}).values["messages"]
+    tool_message = next(m for m in history if isinstance(m, ToolMessage))
+    assert len(json.loads(tool_message.content)["data"]["events"]) == 2
+    stats = budget_module.get_prompt_budget().stats()
+    assert stats["turns"] == 1
+    assert stats["last_turn"]["model_calls"] == 2
+    assert 0 < stats["tokens_per_turn"] < stats["verbose_tokens_per_turn"]
@@ -0,0 +1,113 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.agent import router as router_module
+from app.agent.calendar_agent import CalendarAgent
+from app.agent.router import FastPathRouter
+from app.services.events import Event
+from app.services.response_cache import ResponseCache, set_response_cache
+from app.tools.create_event import create_event_tool
+
+
+class MockSettings:
+    openai_api = "test"
+    openai_model = "test-model"
+    conversation_max_tokens = 6000
+    conversation_keep_tokens = 2000
+    fast_path_enabled = True
+    response_cache_enabled = True
+    tool_verbose = False
+    tool_result_max_events = 20
+    tool_memo = "turn"
+    timezone = "UTC"
+    tzinfo = ZoneInfo("UTC")
+
+
+class ToolModel(FakeMessagesListChatModel):
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+
+class MockService:
+    def __init__(self):
+        self.listings = 0
+
+    def list_from_to(self, time_min, time_max, fields=None, calendar_ids=None):
+        self.listings += 1
+        return [Event.from_api({"id": "e1", "summary": "Standup", "start": {"dateTime": "2026-10-18T10:00:00+00:00"},
+                                "end": {"dateTime": "2026-10-18T10:15:00+00:00"}}, ZoneInfo("UTC"))]
+
+    def create_event(self, summary, start_time, end_time):
+        return {"summary": summary}
+
+
+def _agent(monkeypatch, replies, cache=None):
+    service = MockService()
+    model = ToolModel(responses=replies)
+    set_response_cache(cache or ResponseCache())
+    monkeypatch.setattr(router_module, "_router", FastPathRouter())
+    monkeypatch.setattr("app.agent.calendar_agent.load_settings", lambda: MockSettings())
+    monkeypatch.setattr("app.agent.calendar_agent.ChatOpenAI", lambda **kwargs: model)
+    monkeypatch.setattr("app.tools.list_events.get_calendar_client", lambda: service)
+    monkeypatch.setattr("app.tools.create_event.get_calendar_client", lambda: service)
+    return CalendarAgent(checkpointer=InMemorySaver()), service
+
+
+def _list_today_turn(reply):
+    return [
+        AIMessage(content="", tool_calls=[{"name": "list_today_events_tool", "args": {}, "id": "c1"}]),
+        AIMessage(content=reply),
+    ]
+
+
+def test_repeated_questions_are_answered_from_the_cache(monkeypatch):
+    agent, service = _agent(monkeypatch, _list_today_turn("Just standup at 10."))
+
+    first = agent.run("What do I have going on today?")
+    second = agent.run("what do I have going on  today")
+
+    assert first == second == "Just standup at 10."
+    assert service.listings == 1
+
+
+def test_creating_an_event_in_the_window_invalidates_the_answer(monkeypatch):
+    agent, service = _agent(monkeypatch, [])
+    today = datetime.now(tz=ZoneInfo("UTC")).replace(hour=12, minute=0, second=0, microsecond=0)
+
+    agent.run("List today's events")
+    agent.run("List today's events")
+    assert service.listings == 1
+
+    create_event_tool.func(title="Lunch", start=today, end=today.replace(hour=13))
+    agent.run("List today's events")
+
+    assert service.listings == 2
+
+
+def test_follow_ups_in_a_session_are_not_served_from_the_cache(monkeypatch):
+    replies = [*_list_today_turn("Standup."), AIMessage(content="Hello!"), *_list_today_turn("Still standup.")]
+    agent, service = _agent(monkeypatch, replies)
+
+    agent.run("What about today?")
+    agent.run("hi", session_id="s1")
+
+    assert agent.run("What about today?", session_id="s1") == "Still standup."
+    assert service.listings == 2
+
+
+def test_alike_prompts_about_different_windows_do_not_share_a_reply(monkeypatch):
+    replies = [AIMessage(content=f"Reply {i}.") for i in range(4)]
+    # Every prompt embeds identically, so only the window/count terms tell them apart.
+    cache = ResponseCache(embed=lambda text: [1.0, 0.0], similarity=0.92)
+    agent, _ = _agent(monkeypatch, replies, cache)
+
+    assert agent.run("What's on this morning?") == "Reply 0."
+    assert agent.run("What's on tomorrow afternoon?") == "Reply 1."
+    assert agent.run("Show my next 3 events please") == "Reply 2."
+    assert agent.run("Show my next 10 events please") == "Reply 3."
+    assert agent.run("what do I have on this morning") == "Reply 0."
+    assert cache.stats()["similar_hits"] == 1
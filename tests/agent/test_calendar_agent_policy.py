@@ -13,12 +13,21 @@ def test_calendar_agent_registers_conflict_check_tool(monkeypatch):
     class MockSettings:
         openai_api = "test"
         openai_model = "test-model"
+        conversation_max_tokens = 6000
+        conversation_keep_tokens = 2000
+        fast_path_enabled = True
+        response_cache_enabled = False
+        tool_verbose = False
+        tool_result_max_events = 20
+        tool_memo = "turn"
 
     class MockLLM:
+        _llm_type = "mock"
+
         def __init__(self, **kwargs):
             captured["llm_kwargs"] = kwargs
 
-    def mock_create_agent(*, model, tools, system_prompt):
+    def mock_create_agent(*, model, tools, system_prompt, **kwargs):
         captured["tools"] = tools
         captured["system_prompt"] = system_prompt
         return object()
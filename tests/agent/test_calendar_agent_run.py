@@ -0,0 +1,37 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.agent.calendar_agent import CalendarAgent
+
+
+class MockSettings:
+    openai_api = "test"
+    openai_model = "test-model"
+    conversation_max_tokens = 6000
+    conversation_keep_tokens = 2000
+    fast_path_enabled = True
+    response_cache_enabled = False
+    tool_verbose = False
+    tool_result_max_events = 20
+    tool_memo = "turn"
+
+
+def _agent(monkeypatch, graph):
+    monkeypatch.setattr("app.agent.calendar_agent.load_settings", lambda: MockSettings())
+    monkeypatch.setattr("app.agent.calendar_agent.ChatOpenAI", lambda **kwargs: SimpleNamespace(_llm_type="mock"))
+    monkeypatch.setattr("app.agent.calendar_agent.create_agent", lambda **kwargs: graph)
+    return CalendarAgent()
+
+
+def test_arun_awaits_the_agent_graph(monkeypatch):
+    calls = {}
+
+    class Graph:
+        async def ainvoke(self, state, config=None):
+            calls["state"] = state
+            return {"messages": [SimpleNamespace(content="You are free.")]}
+
+    agent = _agent(monkeypatch, Graph())
+
+    assert asyncio.run(agent.arun("Am I free at 3?")) == "You are free."
+    assert calls["state"] == {"messages": [("user", "Am I free at 3?")]}
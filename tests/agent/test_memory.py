@@ -0,0 +1,104 @@
+import asyncio
+import operator
+from typing import Annotated, TypedDict
+
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, START, StateGraph
+
+from app.agent.calendar_agent import CalendarAgent
+from app.agent.memory import SqliteSaver
+
+
+class MockSettings:
+    openai_api = "test"
+    openai_model = "test-model"
+    conversation_max_tokens = 6000
+    conversation_keep_tokens = 2000
+    fast_path_enabled = True
+    response_cache_enabled = False
+    tool_verbose = False
+    tool_result_max_events = 20
+    tool_memo = "turn"
+
+
+class RecordingModel(FakeMessagesListChatModel):
+    seen: list = []
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.seen.append([m.content for m in messages])
+        return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+
+def _agent(monkeypatch, replies, checkpointer):
+    model = RecordingModel(responses=[AIMessage(content=reply) for reply in replies], seen=[])
+    monkeypatch.setattr("app.agent.calendar_agent.load_settings", lambda: MockSettings())
+    monkeypatch.setattr("app.agent.calendar_agent.ChatOpenAI", lambda **kwargs: model)
+    return CalendarAgent(checkpointer=checkpointer), model
+
+
+def test_follow_up_turns_see_earlier_turns_of_the_same_session(monkeypatch):
+    agent, model = _agent(monkeypatch, ["2 conflicts found.", "Booked anyway."], InMemorySaver())
+
+    agent.run("Book lunch at 1pm", session_id="s1")
+    assert asyncio.run(agent.arun("book anyway", session_id="s1")) == "Booked anyway."
+
+    assert model.seen[1][-3:] == ["Book lunch at 1pm", "2 conflicts found.", "book anyway"]
+
+
+def test_turns_without_a_session_leave_nothing_behind(monkeypatch):
+    saver = InMemorySaver()
+    agent, model = _agent(monkeypatch, ["one", "two"], saver)
+
+    agent.run("first")
+    agent.run("second")
+
+    assert "first" not in model.seen[1]
+    assert list(saver.list(None)) == []
+
+
+class Counter(TypedDict):
+    log: Annotated[list, operator.add]
+
+
+def _graph(saver):
+    builder = StateGraph(Counter)
+    builder.add_node("step", lambda state: {"log": [len(state["log"])]})
+    builder.add_edge(START, "step")
+    builder.add_edge("step", END)
+    return builder.compile(checkpointer=saver)
+
+
+def test_sqlite_saver_persists_threads_across_instances(tmp_path):
+    path = tmp_path / "conversations.db"
+    config = {"configurable": {"thread_id": "t1"}}
+
+    first = SqliteSaver(path)
+    _graph(first).invoke({"log": ["a"]}, config)
+    first.close()
+
+    second = SqliteSaver(path)
+    state = _graph(second).invoke({"log": ["b"]}, config)
+
+    assert state["log"] == ["a", 1, "b", 3]
+    history = list(second.list(config))
+    assert len(history) >= 4
+    assert history[0].checkpoint["channel_values"]["log"] == ["a", 1, "b", 3]
+    assert len(list(second.list(config, limit=2))) == 2
+
+    second.delete_thread("t1")
+    assert second.get_tuple(config) is None
+
+
+def test_sqlite_saver_async_api(tmp_path):
+    saver = SqliteSaver(tmp_path / "conversations.db")
+    config = {"configurable": {"thread_id": "t2"}}
+
+    state = asyncio.run(_graph(saver).ainvoke({"log": ["x"]}, config))
+
+    assert state["log"] == ["x", 1]
+    assert asyncio.run(saver.aget_tuple(config)).checkpoint["channel_values"]["log"] == ["x", 1]
@@ -0,0 +1,126 @@
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.agent import router as router_module
+from app.agent.calendar_agent import CalendarAgent
+from app.agent.router import FastPathRouter, parse_date, parse_time, when_terms
+from app.services.events import Event
+
+NOW = datetime(2026, 10, 18, 9, 0, tzinfo=ZoneInfo("UTC"))  # a Sunday
+
+
+@pytest.mark.parametrize(
+    "prompt, intent, args",
+    [
+        ("List today's events", "list_today", {}),
+        ("what's on my calendar today?", "list_today", {}),
+        ("Show my next 3 events", "list_next", {"n": 3}),
+        ("show me the next three meetings", "list_next", {"n": 3}),
+        ("Show my upcoming events", "list_next", {"n": 5}),
+        ("Delete the event with id abc123", "delete_event", {"event_id": "abc123"}),
+        ("cancel event id Abc_20261020T100000Z.", "delete_event", {"event_id": "Abc_20261020T100000Z"}),
+        (
+            "Am I free on Feb 2 from 2pm to 3pm?",
+            "check_conflicts",
+            {"start": datetime(2027, 2, 2, 14, 0), "end": datetime(2027, 2, 2, 15, 0)},
+        ),
+        (
+            "am i busy tomorrow between 9:30am and 11:00",
+            "check_conflicts",
+            {"start": datetime(2026, 10, 19, 9, 30), "end": datetime(2026, 10, 19, 11, 0)},
+        ),
+    ],
+)
+def test_unambiguous_commands_are_routed(prompt, intent, args):
+    route = FastPathRouter().match(prompt, now=NOW)
+
+    assert route is not None
+    assert (route.intent, route.args) == (intent, args)
+
+
+@pytest.mark.parametrize(
+    "prompt",
+    [
+        "Schedule a team meeting on Jan 30 at 10am for 1 hour",
+        "Am I free tomorrow from 2 to 3?",
+        "Am I free on Feb 2 from 3pm to 2pm?",
+        "Am I free next monday from 2pm to 3pm?",
+        "Delete my dentist appointment",
+        "Show my next 0 events",
+        "List today's events and then delete the first one",
+    ],
+)
+def test_uncertain_prompts_fall_back_to_the_llm(prompt):
+    assert FastPathRouter().match(prompt, now=NOW) is None
+
+
+def test_date_and_time_parsing():
+    today = date(2026, 10, 18)
+    assert parse_date("sunday", today) == today
+    assert parse_date("friday", today) == date(2026, 10, 23)
+    assert parse_date("2nd february 2026", today) == date(2026, 2, 2)
+    assert parse_date("feb 30", today) is None
+    assert parse_time("12am") == (0, 0)
+    assert parse_time("12:15pm") == (12, 15)
+    assert parse_time("13pm") is None
+
+
+def test_stats_count_hits_and_misses():
+    router = FastPathRouter()
+    router.match("List today's events", now=NOW)
+    router.match("Show my next 3 events", now=NOW)
+    router.match("Plan my week", now=NOW)
+
+    stats = router.stats()
+
+    assert (stats["prompts"], stats["fast_path"], stats["llm"]) == (3, 2, 1)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+    assert stats["by_intent"] == {"list_today": 1, "list_next": 1}
+
+
+class MockSettings:
+    openai_api = "test"
+    openai_model = "test-model"
+    conversation_max_tokens = 6000
+    conversation_keep_tokens = 2000
+    fast_path_enabled = True
+    response_cache_enabled = False
+    tool_verbose = False
+    tool_result_max_events = 20
+    tool_memo = "turn"
+
+
+def test_routed_turns_skip_the_model_and_are_remembered(monkeypatch):
+    model = FakeMessagesListChatModel(responses=[])
+    events = [Event.from_api({"id": "e1", "summary": "Standup", "start": {"dateTime": "2026-10-18T10:00:00+00:00"},
+                              "end": {"dateTime": "2026-10-18T10:15:00+00:00"}}, ZoneInfo("UTC"))]
+
+    class MockService:
+        def list_from_to(self, time_min, time_max, calendar_ids=None):
+            return events
+
+    monkeypatch.setattr(router_module, "_router", FastPathRouter())
+    monkeypatch.setattr("app.agent.calendar_agent.load_settings", lambda: MockSettings())
+    monkeypatch.setattr("app.agent.calendar_agent.ChatOpenAI", lambda **kwargs: model)
+    monkeypatch.setattr("app.tools.list_events.get_calendar_client", lambda: MockService())
+    agent = CalendarAgent(checkpointer=InMemorySaver())
+
+    reply = agent.run("List today's events", session_id="s1")
+
+    assert reply == "Today's events:\n- 10:00–10:15 Standup (id: e1)"
+    history = agent.agent.get_state({"configurable": {"thread_id": "s1"}}).values["messages"]
+    assert [m.content for m in history] == ["List today's events", reply]
+    assert agent.router.stats()["fast_path"] == 1
+
+
+def test_when_terms_resolve_dates_times_spans_and_counts():
+    today = NOW.date()
+
+    assert when_terms("What do I have today?", today) == when_terms("whats on today", today) == ("2026-10-18",)
+    assert when_terms("what's on tomorrow afternoon", today) == ("2026-10-19", "afternoon")
+    assert when_terms("next three meetings", today) == ("3", "next")
+    assert when_terms("Am I free Oct 20 from 2pm to 3pm", today) == ("14:00", "15:00", "2026-10-20", "availability")
@@ -0,0 +1,134 @@
+import asyncio
+import io
+import json
+from types import SimpleNamespace
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.agent.calendar_agent import CalendarAgent
+from app.agent.streaming import AgentEvent
+from app.services.events import Event
+from app.main import render
+
+
+class MockSettings:
+    openai_api = "test"
+    openai_model = "test-model"
+    conversation_max_tokens = 6000
+    conversation_keep_tokens = 2000
+    fast_path_enabled = True
+    response_cache_enabled = False
+    tool_verbose = False
+    tool_result_max_events = 20
+    tool_memo = "turn"
+
+
+class ScriptedModel(BaseChatModel):
+    """Replays `replies`, streaming content word by word and tool calls as chunks."""
+
+    replies: list
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        return ChatResult(generations=[ChatGeneration(message=self.replies.pop(0))])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        reply = self.replies.pop(0)
+        words = reply.content.split(" ") if reply.content else []
+        for i, word in enumerate(words):
+            text = word if i == len(words) - 1 else word + " "
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=text))
+            if run_manager:
+                run_manager.on_llm_new_token(text, chunk=chunk)
+            yield chunk
+        if reply.tool_calls:
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[
+                        {"name": call["name"], "args": json.dumps(call["args"]), "id": call["id"], "index": i}
+                        for i, call in enumerate(reply.tool_calls)
+                    ],
+                )
+            )
+
+
+def _agent(monkeypatch):
+    model = ScriptedModel(
+        replies=[
+            AIMessage(content="", tool_calls=[{"name": "list_next_events_tool", "args": {"n": 1}, "id": "call-1"}]),
+            AIMessage(content="Your next event is Standup."),
+        ]
+    )
+
+    events = [Event(id="e1", summary="Standup", start=0.0, end=900.0, start_iso="", end_iso="")]
+
+    class MockService:
+        def list_events(self, time_min, max_results, fields=None, calendar_ids=None):
+            return events
+
+    class MockAsyncService:
+        async def list_events(self, time_min, max_results, fields=None, calendar_ids=None):
+            return events
+
+    monkeypatch.setattr("app.agent.calendar_agent.load_settings", lambda: MockSettings())
+    monkeypatch.setattr("app.agent.calendar_agent.ChatOpenAI", lambda **kwargs: model)
+    monkeypatch.setattr("app.tools.list_events.get_calendar_client", lambda: MockService())
+    monkeypatch.setattr("app.tools.list_events.get_async_calendar_client", lambda: MockAsyncService())
+    return CalendarAgent(checkpointer=InMemorySaver())
+
+
+def test_stream_yields_tool_progress_then_tokens_then_final(monkeypatch):
+    events = list(_agent(monkeypatch).stream("What's next?"))
+
+    assert [e.type for e in events] == ["tool_start", "tool_end", "token", "token", "token", "token", "token", "final"]
+    assert events[0] == AgentEvent("tool_start", tool="list_next_events_tool", data={"n": 1})
+    assert events[1].data["ok"] is True
+    assert "".join(e.text for e in events if e.type == "token") == "Your next event is Standup."
+    assert events[-1].text == "Your next event is Standup."
+
+
+def test_astream_matches_stream(monkeypatch):
+    async def collect(agent):
+        return [event async for event in agent.astream("What's next?")]
+
+    events = asyncio.run(collect(_agent(monkeypatch)))
+
+    assert [e.type for e in events][:2] == ["tool_start", "tool_end"]
+    assert events[-1] == AgentEvent("final", text="Your next event is Standup.")
+
+
+def test_render_prints_tokens_inline_and_tool_status_lines():
+    out = io.StringIO()
+    render(
+        [
+            AgentEvent("token", text="Checking"),
+            AgentEvent("tool_start", tool="check_conflicts_tool", data={"start": "10:00"}),
+            AgentEvent("tool_end", tool="check_conflicts_tool", data={"ok": False, "error": {"message": "quota"}}),
+            AgentEvent("token", text="Sorry."),
+            AgentEvent("final", text="Checking Sorry."),
+        ],
+        out,
+    )
+
+    assert out.getvalue() == (
+        "Checking\n"
+        "  [check_conflicts_tool(start='10:00')]\n"
+        "  [check_conflicts_tool failed: quota]\n"
+        "Sorry.\n"
+    )
+
+
+def test_render_falls_back_to_the_final_reply():
+    out = io.StringIO()
+    render([SimpleNamespace(type="final", text="Done.")], out)
+    assert out.getvalue() == "Done.\n"
@@ -0,0 +1,37 @@
+import io
+import json
+
+from langchain.agents.middleware.types import ModelResponse
+from langchain_core.messages import AIMessage
+
+from app.agent.tracing import TelemetryMiddleware, turn_span
+from app.services import telemetry
+from app.services.telemetry import JsonLogExporter, get_metrics
+
+
+def _reply(text, input_tokens, output_tokens):
+    usage = {"input_tokens": input_tokens, "output_tokens": output_tokens, "total_tokens": input_tokens + output_tokens}
+    return ModelResponse(result=[AIMessage(text, usage_metadata=usage)])
+
+
+def test_model_calls_are_spans_of_the_turn_and_their_tokens_add_up(monkeypatch):
+    sink = io.StringIO()
+    monkeypatch.setattr(telemetry, "_exporters", [JsonLogExporter(sink)])
+    middleware = TelemetryMiddleware("test-model")
+
+    with turn_span(session=True):
+        middleware.wrap_model_call(None, lambda request: _reply("", 900, 40))
+        middleware.wrap_model_call(None, lambda request: _reply("Done.", 1100, 12))
+
+    turn = json.loads(sink.getvalue())
+    assert turn["attributes"] == {"path": "llm", "session": True, "input_tokens": 2000, "output_tokens": 52}
+    assert [child["name"] for child in turn["children"]] == ["llm.call", "llm.call"]
+    assert turn["children"][0]["attributes"]["input_tokens"] == 900
+
+    snapshot = get_metrics().snapshot()
+    (llm_seconds,) = snapshot["histograms"]["llm_seconds"]
+    assert llm_seconds["count"] == 2
+    tokens = {item["labels"]["kind"]: item["value"] for item in snapshot["counters"]["llm_tokens_total"]}
+    assert tokens == {"input": 2000, "output": 52}
+    (turn_seconds,) = snapshot["histograms"]["turn_seconds"]
+    assert turn_seconds["labels"] == {"path": "llm"}
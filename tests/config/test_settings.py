@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+
+import pytest
+
+from app.config import settings as settings_module
+from app.config.settings import Settings, load_settings, reload_settings, settings_override
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings(monkeypatch):
+    monkeypatch.setattr(settings_module, "_settings", None)
+
+
+def test_load_settings_is_cached_until_reload(monkeypatch):
+    monkeypatch.setenv("GOOGLE_CALENDAR_ID", "first@example.com")
+    first = load_settings()
+    monkeypatch.setenv("GOOGLE_CALENDAR_ID", "second@example.com")
+
+    assert load_settings() is first
+    assert reload_settings().default_calendar_id == "second@example.com"
+    assert load_settings().default_calendar_id == "second@example.com"
+
+
+def test_from_env_rejects_invalid_values(monkeypatch):
+    monkeypatch.setenv("CALENDAR_TIMEZONE", "Mars/Olympus")
+    with pytest.raises(ValueError, match="time zone"):
+        Settings.from_env()
+
+    monkeypatch.setenv("CALENDAR_TIMEZONE", "UTC")
+    monkeypatch.setenv("WORKING_HOURS_START", "18:00")
+    monkeypatch.setenv("WORKING_HOURS_END", "09:00")
+    with pytest.raises(ValueError, match="before"):
+        Settings.from_env()
+
+
+def test_tzinfo_is_resolved_once():
+    settings = Settings(timezone="UTC")
+    assert settings.tzinfo is settings.tzinfo
+    assert str(settings.tzinfo) == "UTC"
+
+
+def test_settings_override_is_scoped_and_reaches_worker_threads(monkeypatch):
+    monkeypatch.setattr(settings_module, "_settings", Settings(timezone="UTC"))
+
+    with settings_override(calendar_id="team@example.com", timezone="Europe/Athens"):
+        ctx = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            seen = pool.submit(ctx.run, load_settings).result()
+
+    assert seen.default_calendar_id == "team@example.com"
+    assert str(seen.tzinfo) == "Europe/Athens"
+    assert load_settings().default_calendar_id == "primary"
+
+
+def test_read_calendar_ids_put_the_default_first_without_duplicates(monkeypatch):
+    monkeypatch.setenv("GOOGLE_CALENDAR_ID", "me@example.com")
+    monkeypatch.setenv("CALENDAR_IDS", "team@example.com, me@example.com,room@example.com")
+
+    settings = Settings.from_env()
+
+    assert settings.calendar_ids == ("team@example.com", "me@example.com", "room@example.com")
+    assert settings.read_calendar_ids == ("me@example.com", "team@example.com", "room@example.com")
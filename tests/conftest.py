@@ -0,0 +1,30 @@
+import pytest
+
+from app.config import settings
+from app.services import rate_limit, response_cache, telemetry
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiter(monkeypatch):
+    # The limiter is process-wide; give every test its own quota and retry budget.
+    monkeypatch.setattr(rate_limit, "_limiter", None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_response_cache(monkeypatch):
+    # Likewise the response cache: replies cached by one test must not answer another.
+    monkeypatch.setattr(response_cache, "_cache", None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_telemetry(monkeypatch):
+    # Metrics are process-wide too, and spans must not reach a TRACE_LOG sink.
+    monkeypatch.setattr(telemetry, "_metrics", telemetry.Metrics())
+    monkeypatch.setattr(telemetry, "_exporters", [])
+
+
+@pytest.fixture(autouse=True)
+def unforced_settings(monkeypatch):
+    # The server pins settings process-wide (e.g. no browser OAuth); keep that to the test.
+    monkeypatch.setattr(settings, "_forced", {})
+    monkeypatch.setattr(settings, "_settings", None)
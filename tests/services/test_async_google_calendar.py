@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+from zoneinfo import ZoneInfo
+
+from googleapiclient.errors import HttpError
+
+from app.services.async_google_calendar import AsyncGoogleCalendarClient
+from app.services.google_calendar import GoogleCalendarClient
+
+
+class _Resp:
+    def __init__(self, status: int):
+        self.status = status
+        self.reason = "error"
+
+
+class _Settings:
+    default_calendar_id = "primary"
+    timezone = "UTC"
+    tzinfo = ZoneInfo("UTC")
+    event_cache_enabled = False
+    event_cache_max_staleness_seconds = 0
+
+
+def _client(monkeypatch):
+    monkeypatch.setattr(GoogleCalendarClient, "_build_service", lambda self: None)
+    monkeypatch.setattr("app.services.google_calendar.load_settings", lambda: _Settings())
+    return GoogleCalendarClient()
+
+
+def test_async_execute_runs_requests_concurrently(monkeypatch):
+    client = AsyncGoogleCalendarClient(_client(monkeypatch), max_workers=4)
+    barrier = threading.Barrier(3, timeout=2)
+
+    class SlowRequest:
+        def execute(self, http=None):
+            # Only passes if all three requests are in flight at the same time.
+            barrier.wait()
+            return {"thread": threading.current_thread().name}
+
+    async def fan_out():
+        return await asyncio.gather(*(client._execute("op", SlowRequest()) for _ in range(3)))
+
+    results = asyncio.run(fan_out())
+
+    assert len({result["thread"] for result in results}) == 3
+
+
+def test_async_execute_backs_off_with_asyncio_sleep(monkeypatch):
+    sync_client = _client(monkeypatch)
+    sync_client._BASE_BACKOFF_SECONDS = 0.0
+    client = AsyncGoogleCalendarClient(sync_client)
+
+    monkeypatch.setattr("app.services.google_calendar.time.sleep", lambda s: (_ for _ in ()).throw(AssertionError))
+    calls = {"count": 0}
+
+    class FlakyRequest:
+        def execute(self, http=None):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                raise HttpError(_Resp(503), b"unavailable")
+            return {"ok": True}
+
+    started = time.perf_counter()
+    result = asyncio.run(client._execute("op", FlakyRequest()))
+
+    assert result == {"ok": True}
+    assert calls["count"] == 2
+    assert time.perf_counter() - started < 1
+
+
+def test_async_execute_shares_the_retry_budget_and_telemetry(monkeypatch):
+    from app.services import telemetry
+    from app.services.google_calendar import GoogleCalendarError
+    from app.services.rate_limit import RateLimiter
+
+    sync_client = _client(monkeypatch)
+    sync_client._limiter = RateLimiter(rate=1000.0, retry_burst=0.0)
+    client = AsyncGoogleCalendarClient(sync_client)
+    calls = {"count": 0}
+
+    class FailingRequest:
+        def execute(self, http=None):
+            calls["count"] += 1
+            raise HttpError(_Resp(503), b"unavailable")
+
+    try:
+        asyncio.run(client._execute("op", FailingRequest()))
+    except GoogleCalendarError as exc:
+        assert exc.status == 503
+    else:
+        raise AssertionError("expected GoogleCalendarError")
+
+    # No retry budget: one attempt, reported like the sync client's.
+    assert calls["count"] == 1
+    (errors,) = telemetry.get_metrics().snapshot()["counters"]["calendar_api_errors_total"]
+    assert errors["labels"] == {"operation": "op", "status": "503"}
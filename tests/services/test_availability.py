@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from app.services.availability import find_free_slots, merge_intervals
+
+UTC = ZoneInfo("UTC")
+
+
+def _ts(day, hour, minute=0):
+    return datetime(2026, 1, day, hour, minute, tzinfo=UTC).timestamp()
+
+
+def _fmt(slots):
+    return [datetime.fromtimestamp(start, UTC).strftime("%a %H:%M") for start, _ in slots]
+
+
+def test_merge_intervals_sweeps_overlapping_and_touching_ranges():
+    assert merge_intervals([(5, 8), (1, 3), (2, 4), (4, 5), (10, 12)]) == [(1, 8), (10, 12)]
+
+
+def test_find_free_slots_respects_busy_time_buffer_and_working_hours():
+    busy = [(_ts(30, 9), _ts(30, 10)), (_ts(30, 9, 30), _ts(30, 11)), (_ts(30, 13), _ts(30, 14))]
+
+    slots = find_free_slots(
+        busy,
+        window_start=datetime(2026, 1, 30, tzinfo=UTC),
+        window_end=datetime(2026, 2, 3, tzinfo=UTC),
+        duration=timedelta(hours=1),
+        tz=UTC,
+        buffer=timedelta(minutes=10),
+        limit=6,
+    )
+
+    # Friday fills up, the weekend is skipped, Monday starts at 09:00.
+    assert _fmt(slots) == ["Fri 11:15", "Fri 14:15", "Fri 15:15", "Fri 16:15", "Mon 09:00", "Mon 10:00"]
+    assert all(end - start == 3600 for start, end in slots)
+
+
+def test_find_free_slots_returns_nothing_when_day_is_booked():
+    slots = find_free_slots(
+        [(_ts(30, 8), _ts(30, 19))],
+        window_start=datetime(2026, 1, 30, tzinfo=UTC),
+        window_end=datetime(2026, 1, 31, tzinfo=UTC),
+        duration=timedelta(minutes=30),
+        tz=UTC,
+    )
+
+    assert slots == []
+
+
+def test_find_free_slots_aligns_starts_in_local_time():
+    kolkata = ZoneInfo("Asia/Kolkata")  # +05:30
+    busy = [(datetime(2026, 1, 30, 9, tzinfo=kolkata).timestamp(), datetime(2026, 1, 30, 9, 40, tzinfo=kolkata).timestamp())]
+
+    slots = find_free_slots(
+        busy,
+        window_start=datetime(2026, 1, 30, tzinfo=kolkata),
+        window_end=datetime(2026, 1, 31, tzinfo=kolkata),
+        duration=timedelta(hours=1),
+        tz=kolkata,
+        granularity=timedelta(hours=1),
+        limit=2,
+    )
+
+    assert [datetime.fromtimestamp(start, kolkata).strftime("%H:%M") for start, _ in slots] == ["10:00", "11:00"]
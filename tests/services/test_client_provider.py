@@ -0,0 +1,85 @@
+import threading
+
+from app.services import client_provider
+from app.services.client_provider import get_calendar_client, reset_calendar_client, set_calendar_client
+from app.services.google_calendar import GoogleCalendarClient
+
+
+def test_get_calendar_client_builds_once_per_process(monkeypatch):
+    builds = {"count": 0}
+
+    def fake_build_service(self):
+        builds["count"] += 1
+        return None
+
+    monkeypatch.setattr(GoogleCalendarClient, "_build_service", fake_build_service)
+    monkeypatch.setattr(client_provider, "_client", None)
+
+    first = get_calendar_client()
+    second = get_calendar_client()
+
+    assert first is second
+    assert builds["count"] == 1
+
+
+def test_set_calendar_client_injects_fake(monkeypatch):
+    monkeypatch.setattr(client_provider, "_client", None)
+    fake = object()
+
+    set_calendar_client(fake)
+    assert get_calendar_client() is fake
+
+    reset_calendar_client()
+    assert client_provider._client is None
+
+
+def test_client_hands_out_one_transport_per_thread(monkeypatch):
+    monkeypatch.setattr(GoogleCalendarClient, "_build_service", lambda self: None)
+
+    class FakeCredentials:
+        valid = True
+
+    client = GoogleCalendarClient(credentials=FakeCredentials())
+    transports = []
+
+    def grab():
+        transports.append(client._http())
+        transports.append(client._http())
+
+    worker = threading.Thread(target=grab)
+    worker.start()
+    worker.join()
+    main_http = client._http()
+
+    assert transports[0] is transports[1]
+    assert main_http is not transports[0]
+    assert main_http is client._http()
+
+
+def test_execute_refreshes_expired_credentials_in_place(monkeypatch):
+    monkeypatch.setattr(GoogleCalendarClient, "_build_service", lambda self: None)
+    refreshed = []
+
+    class FakeCredentials:
+        valid = False
+        refresh_token = "refresh"
+
+    creds = FakeCredentials()
+
+    def fake_refresh(c, *, token_file):
+        refreshed.append(c)
+        c.valid = True
+        return c
+
+    monkeypatch.setattr("app.services.google_calendar.refresh_google_credentials", fake_refresh)
+    monkeypatch.setattr(GoogleCalendarClient, "_http", lambda self: None)
+
+    class DummyRequest:
+        def execute(self, http=None):
+            return {"ok": True}
+
+    client = GoogleCalendarClient(credentials=creds)
+
+    assert client._execute("op", DummyRequest()) == {"ok": True}
+    assert client._execute("op", DummyRequest()) == {"ok": True}
+    assert refreshed == [creds]
@@ -0,0 +1,77 @@
+from zoneinfo import ZoneInfo
+
+from app.services.conflicts import IntervalIndex, busy_index, find_conflicts
+from app.services.events import Event
+
+UTC = ZoneInfo("UTC")
+
+
+def _event(event_id, start, end, **extra):
+    return Event.from_api(
+        {"id": event_id, "start": {"dateTime": start}, "end": {"dateTime": end}, **extra},
+        UTC,
+    )
+
+
+def test_interval_index_returns_only_overlapping_values_in_start_order():
+    index = IntervalIndex([(0, 100, "long"), (10, 20, "a"), (30, 40, "b"), (50, 60, "c")])
+
+    assert index.overlapping(15, 35) == ["long", "a", "b"]
+    assert index.overlapping(20, 30) == ["long"]
+    assert index.overlapping(100, 200) == []
+    assert index.overlapping_many([(0, 5), (55, 56)]) == [["long"], ["long", "c"]]
+
+
+def test_long_blocks_do_not_widen_every_query():
+    day = 86400
+    short = [(i * 3600, i * 3600 + 1800, f"e{i}") for i in range(24 * 60)]
+    index = IntervalIndex([*short, (-10 * day, 70 * day, "leave")], long_span=day)
+    slices = []
+    index._entries = _Recording(index._entries, slices)
+
+    assert index.overlapping(30 * day, 30 * day + 3600) == ["leave", "e720"]
+    assert index.overlapping(80 * day, 81 * day) == []
+    assert len(index) == len(short) + 1
+    # Only the entries of the day before the window are looked at, not the 30 days since "leave" began.
+    assert len(slices) <= 25
+
+
+def test_iter_overlapping_merges_long_blocks_in_start_order_and_stops_early():
+    index = IntervalIndex([(0, 10, "a"), (5, 500, "trip"), (20, 30, "b"), (40, 50, "c")], long_span=100)
+    found = index.iter_overlapping(0, float("inf"))
+
+    assert next(found) == "a"
+    assert list(found) == ["trip", "b", "c"]
+
+
+class _Recording(list):
+    """A list that records which positions are read."""
+
+    def __init__(self, items, reads):
+        super().__init__(items)
+        self._reads = reads
+
+    def __getitem__(self, i):
+        self._reads.append(i)
+        return super().__getitem__(i)
+
+
+def test_find_conflicts_answers_many_windows_against_one_index():
+    events = [
+        _event("standup", "2026-01-30T09:00:00Z", "2026-01-30T09:15:00Z"),
+        _event("lunch", "2026-01-30T12:00:00Z", "2026-01-30T13:00:00Z", transparency="transparent"),
+        _event("review", "2026-01-30T14:00:00Z", "2026-01-30T15:00:00Z"),
+    ]
+    index = busy_index(events)
+
+    results = find_conflicts(
+        index,
+        [
+            ("2026-01-30T09:10:00+00:00", "2026-01-30T10:00:00+00:00"),
+            ("2026-01-30T12:00:00+00:00", "2026-01-30T13:00:00+00:00"),
+            ("2026-01-30T15:00:00+00:00", "2026-01-30T16:00:00+00:00"),
+        ],
+        UTC,
+    )
+
+    assert [[event.id for event in found] for found in results] == [["standup"], [], []]
@@ -0,0 +1,222 @@
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from google.auth.exceptions import TransportError
+from google.oauth2.credentials import Credentials
+
+from app.services import client_provider
+from app.services.auth.credential_store import (
+    CredentialPool,
+    FileTokenStore,
+    SqliteTokenStore,
+    TokenRefreshScheduler,
+)
+from app.services.auth.google_oauth import CredentialsUnavailableError, load_google_credentials
+from app.services.client_provider import acting_as, get_calendar_client, set_credential_pool
+from app.services.google_calendar import GoogleCalendarError
+
+
+def _token(user_id, *, expires_in):
+    expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=expires_in)
+    return json.dumps(
+        {
+            "token": f"access-{user_id}",
+            "refresh_token": f"refresh-{user_id}",
+            "client_id": "client",
+            "client_secret": "secret",
+            "expiry": expiry.isoformat() + "Z",
+        }
+    )
+
+
+@pytest.fixture
+def refreshes(monkeypatch):
+    calls = []
+
+    def fake_refresh(self, request):
+        calls.append(self.refresh_token)
+        time.sleep(0.01)
+        self.token = f"renewed-{len(calls)}"
+        self.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+
+    monkeypatch.setattr(Credentials, "refresh", fake_refresh)
+    return calls
+
+
+@pytest.mark.parametrize("make_store", [FileTokenStore, lambda path: SqliteTokenStore(path / "tokens.db")])
+def test_token_stores_round_trip(tmp_path, make_store):
+    store = make_store(tmp_path)
+
+    assert store.load("ann@example.com") is None
+    store.save("ann@example.com", "one")
+    store.save("ann@example.com", "two")
+    store.save("bob/../x", "three")
+
+    assert store.load("ann@example.com") == "two"
+    assert store.load("bob/../x") == "three"
+    store.delete("ann@example.com")
+    assert store.load("ann@example.com") is None
+
+
+def test_concurrent_requests_refresh_an_expired_token_once(tmp_path, refreshes):
+    store = FileTokenStore(tmp_path)
+    store.save("ann", _token("ann", expires_in=-60))
+    pool = CredentialPool(store)
+    seen = []
+
+    workers = [threading.Thread(target=lambda: seen.append(pool.get("ann"))) for _ in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert refreshes == ["refresh-ann"]
+    assert all(creds is seen[0] for creds in seen)
+    assert json.loads(store.load("ann"))["token"] == "renewed-1"
+
+
+def test_pool_keeps_recently_used_users_and_rejects_unknown_ones(tmp_path):
+    store = FileTokenStore(tmp_path)
+    for user_id in ("ann", "bob", "cat"):
+        store.save(user_id, _token(user_id, expires_in=3600))
+    pool = CredentialPool(store, capacity=2)
+
+    pool.get("ann")
+    pool.get("bob")
+    pool.get("ann")
+    pool.get("cat")
+
+    assert "ann" in pool and "cat" in pool and "bob" not in pool
+    assert pool.loads == 3
+    with pytest.raises(CredentialsUnavailableError, match="nobody"):
+        pool.get("nobody")
+
+
+def test_refresh_due_renews_tokens_before_they_expire(tmp_path, refreshes):
+    store = FileTokenStore(tmp_path)
+    store.save("soon", _token("soon", expires_in=300))
+    store.save("later", _token("later", expires_in=7200))
+    pool = CredentialPool(store, refresh_margin_seconds=600)
+    soon = pool.get("soon")
+    pool.get("later")
+
+    assert refreshes == []
+    assert pool.refresh_due() == 1
+    assert refreshes == ["refresh-soon"]
+    assert soon.token == "renewed-1"
+    assert pool.refresh_due() == 0
+
+
+def test_refresh_due_logs_a_failing_user_and_refreshes_the_others(tmp_path, monkeypatch, caplog):
+    store = FileTokenStore(tmp_path)
+    for user in ("ann", "bob"):
+        store.save(user, _token(user, expires_in=300))
+    pool = CredentialPool(store, refresh_margin_seconds=600)
+    pool.get("ann")
+    bob = pool.get("bob")
+
+    def flaky_refresh(self, request):
+        if self.refresh_token == "refresh-ann":
+            raise TransportError("connection reset")
+        self.token = "renewed"
+        self.expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+
+    monkeypatch.setattr(Credentials, "refresh", flaky_refresh)
+
+    with caplog.at_level(logging.WARNING, logger="app.services.auth.credential_store"):
+        assert pool.refresh_due() == 1
+
+    assert bob.token == "renewed"
+    assert "ann" in pool
+    assert "'ann'" in caplog.text
+
+
+def test_evicted_users_release_their_refresh_lock(tmp_path):
+    store = FileTokenStore(tmp_path)
+    for user in ("ann", "bob", "cid"):
+        store.save(user, _token(user, expires_in=3600))
+    pool = CredentialPool(store, capacity=2)
+
+    for user in ("ann", "bob", "cid"):
+        pool.put(user, pool.get(user))
+
+    assert "ann" not in pool
+    assert set(pool._user_locks) == {"bob", "cid"}
+    pool.evict("bob")
+    assert set(pool._user_locks) == {"cid"}
+
+
+def test_scheduler_refreshes_in_the_background(tmp_path, refreshes):
+    store = FileTokenStore(tmp_path)
+    store.save("ann", _token("ann", expires_in=300))
+    pool = CredentialPool(store, refresh_margin_seconds=600)
+    pool.get("ann")
+
+    with TokenRefreshScheduler(pool, interval_seconds=0.01):
+        deadline = time.monotonic() + 2
+        while not refreshes and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert refreshes == ["refresh-ann"]
+
+
+def test_scheduler_logs_failed_passes_and_keeps_running(tmp_path, caplog):
+    pool = CredentialPool(FileTokenStore(tmp_path))
+    passes = []
+
+    def broken_refresh_due():
+        passes.append(1)
+        raise OSError("store unavailable")
+
+    pool.refresh_due = broken_refresh_due
+
+    with caplog.at_level(logging.ERROR, logger="app.services.auth.credential_store"):
+        with TokenRefreshScheduler(pool, interval_seconds=0.01):
+            deadline = time.monotonic() + 2
+            while len(passes) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+    assert len(passes) >= 2
+    assert "Token refresh pass failed" in caplog.text
+    assert "store unavailable" in caplog.text
+
+
+def test_non_interactive_load_raises_instead_of_opening_a_browser(tmp_path, monkeypatch):
+    def no_browser(*args, **kwargs):
+        raise AssertionError("OAuth flow must not start")
+
+    monkeypatch.setattr("google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file", no_browser)
+
+    with pytest.raises(CredentialsUnavailableError, match="authorize"):
+        load_google_credentials(
+            credentials_file=tmp_path / "credentials.json",
+            token_file=tmp_path / "token.json",
+            interactive=False,
+        )
+
+
+def test_acting_as_routes_to_per_user_clients(tmp_path, monkeypatch):
+    store = FileTokenStore(tmp_path)
+    store.save("ann", _token("ann", expires_in=3600))
+    set_credential_pool(CredentialPool(store))
+    monkeypatch.setattr(client_provider, "_client", None)
+
+    class DummyRequest:
+        def execute(self, http=None):
+            return {"token": http.credentials.token}
+
+    try:
+        with acting_as("ann"):
+            ann = get_calendar_client()
+            assert get_calendar_client() is ann
+            assert ann._execute("op", DummyRequest()) == {"token": "access-ann"}
+        with acting_as("nobody"):
+            with pytest.raises(GoogleCalendarError) as excinfo:
+                get_calendar_client()._execute("op", DummyRequest())
+        assert "nobody" in excinfo.value.reason
+    finally:
+        set_credential_pool(None)
@@ -0,0 +1,20 @@
+from app.services.discovery import calendar_discovery_document
+
+
+def test_calendar_discovery_document_is_bundled_and_cached():
+    document = calendar_discovery_document()
+
+    assert document["name"] == "calendar"
+    assert document["version"] == "v3"
+    assert "events" in document["resources"]
+    assert calendar_discovery_document() is document
+
+
+def test_build_from_bundled_document_needs_no_network():
+    import httplib2
+    from googleapiclient.discovery import build_from_document
+
+    service = build_from_document(calendar_discovery_document(), http=httplib2.Http())
+    request = service.events().list(calendarId="primary")
+
+    assert request.uri.startswith("https://www.googleapis.com/calendar/v3/calendars/primary/events")
@@ -0,0 +1,303 @@
+import threading
+import time
+from zoneinfo import ZoneInfo
+
+from app.services.event_store import EventStore
+from app.services.fields import list_mask
+from app.services.google_calendar import GoogleCalendarClient, GoogleCalendarError
+
+
+def _event(event_id, start, end, **extra):
+    return {
+        "id": event_id,
+        "summary": event_id,
+        "start": {"dateTime": start},
+        "end": {"dateTime": end},
+        **extra,
+    }
+
+
+def test_event_store_window_returns_overlapping_events_in_start_order():
+    store = EventStore("primary", ZoneInfo("UTC"))
+    store.apply_sync(
+        [
+            _event("late", "2026-01-30T15:00:00Z", "2026-01-30T16:00:00Z"),
+            _event("long", "2026-01-30T08:00:00Z", "2026-01-30T12:00:00Z"),
+            _event("before", "2026-01-30T07:00:00Z", "2026-01-30T08:00:00Z"),
+            {"id": "allday", "summary": "Holiday", "start": {"date": "2026-01-30"}, "end": {"date": "2026-01-31"}},
+        ],
+        sync_token="token-1",
+    )
+
+    window = store.window("2026-01-30T10:00:00+00:00", "2026-01-30T11:00:00+00:00")
+
+    assert [event.id for event in window] == ["allday", "long"]
+    assert [event.id for event in store.upcoming("2026-01-30T09:00:00+00:00", 2)] == ["allday", "long"]
+    assert store.sync_token == "token-1"
+
+
+def test_event_store_incremental_sync_applies_updates_and_cancellations():
+    store = EventStore("primary", ZoneInfo("UTC"))
+    store.apply_sync(
+        [
+            _event("a", "2026-01-30T10:00:00Z", "2026-01-30T11:00:00Z"),
+            _event("b", "2026-01-30T12:00:00Z", "2026-01-30T13:00:00Z"),
+        ],
+        sync_token="t1",
+    )
+    store.apply_sync(
+        [
+            {"id": "a", "status": "cancelled"},
+            _event("b", "2026-01-30T14:00:00Z", "2026-01-30T15:00:00Z"),
+        ],
+        sync_token="t2",
+    )
+
+    events = store.window("2026-01-30T00:00:00Z", "2026-01-31T00:00:00Z")
+
+    assert [(event.id, event.start_iso) for event in events] == [("b", "2026-01-30T14:00:00Z")]
+
+
+class _Request:
+    def __init__(self, response):
+        self._response = response
+
+    def execute(self, http=None):
+        if isinstance(self._response, Exception):
+            raise self._response
+        return self._response
+
+
+class _FakeService:
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.calls = []
+
+    def events(self):
+        return self
+
+    def list(self, **params):
+        self.calls.append(params)
+        return _Request(self.pages.pop(0))
+
+    def insert(self, calendarId, body, fields=None):
+        return _Request({"id": "new", **body})
+
+    def delete(self, calendarId, eventId):
+        return _Request("")
+
+
+class _Settings:
+    default_calendar_id = "primary"
+    read_calendar_ids = ("primary",)
+    timezone = "UTC"
+    tzinfo = ZoneInfo("UTC")
+    event_cache_enabled = True
+    event_cache_max_staleness_seconds = 300
+
+
+def _client(monkeypatch, service):
+    monkeypatch.setattr(GoogleCalendarClient, "_build_service", lambda self: service)
+    monkeypatch.setattr("app.services.google_calendar.load_settings", lambda: _Settings())
+    return GoogleCalendarClient()
+
+
+def test_client_full_syncs_once_then_serves_reads_from_cache(monkeypatch):
+    service = _FakeService(
+        [
+            {"items": [_event("a", "2026-01-30T10:00:00Z", "2026-01-30T11:00:00Z")], "nextPageToken": "p2"},
+            {"items": [_event("b", "2026-01-30T12:00:00Z", "2026-01-30T13:00:00Z")], "nextSyncToken": "sync-1"},
+        ]
+    )
+    client = _client(monkeypatch, service)
+
+    today = client.list_from_to("2026-01-30T00:00:00+00:00", "2026-01-31T00:00:00+00:00")
+    upcoming = client.list_events("2026-01-30T11:30:00+00:00", max_results=5)
+
+    assert [event.id for event in today] == ["a", "b"]
+    assert [event.id for event in upcoming] == ["b"]
+    assert len(service.calls) == 2
+    assert service.calls[1]["pageToken"] == "p2"
+    assert "syncToken" not in service.calls[0]
+
+
+def test_client_serves_the_busy_field_mask_from_cache_but_not_custom_masks(monkeypatch):
+    service = _FakeService(
+        [
+            {"items": [_event("a", "2026-01-30T10:00:00Z", "2026-01-30T11:00:00Z")], "nextSyncToken": "sync-1"},
+            {"items": []},
+        ]
+    )
+    client = _client(monkeypatch, service)
+
+    cached = client.list_from_to("2026-01-30T00:00:00Z", "2026-01-31T00:00:00Z", fields=list_mask("conflicts"))
+    client.list_from_to("2026-01-30T00:00:00Z", "2026-01-31T00:00:00Z", fields="items(id,description)")
+
+    assert [event.id for event in cached] == ["a"]
+    assert len(service.calls) == 2
+    assert service.calls[1]["fields"] == "items(id,description)"
+
+
+def test_client_writes_through_and_resyncs_incrementally_when_stale(monkeypatch):
+    service = _FakeService(
+        [
+            {"items": [_event("a", "2026-01-30T10:00:00Z", "2026-01-30T11:00:00Z")], "nextSyncToken": "sync-1"},
+            {"items": [], "nextSyncToken": "sync-2"},
+        ]
+    )
+    client = _client(monkeypatch, service)
+    client.list_from_to("2026-01-30T00:00:00Z", "2026-01-31T00:00:00Z")
+
+    client.create_event("New", "2026-01-30T15:00:00+00:00", "2026-01-30T16:00:00+00:00")
+    client.delete_event("a")
+    client._stores["primary"].synced_at -= 1000
+
+    events = client.list_from_to("2026-01-30T00:00:00Z", "2026-01-31T00:00:00Z")
+
+    assert [event.id for event in events] == ["new"]
+    assert service.calls[1]["syncToken"] == "sync-1"
+
+
+def test_client_falls_back_to_full_sync_when_sync_token_expires(monkeypatch):
+    service = _FakeService(
+        [
+            {"items": [_event("a", "2026-01-30T10:00:00Z", "2026-01-30T11:00:00Z")], "nextSyncToken": "sync-1"},
+            {"items": [_event("c", "2026-01-30T12:00:00Z", "2026-01-30T13:00:00Z")], "nextSyncToken": "sync-2"},
+        ]
+    )
+    client = _client(monkeypatch, service)
+    client.list_from_to("2026-01-30T00:00:00Z", "2026-01-31T00:00:00Z")
+    client._stores["primary"].synced_at -= 1000
+
+    def fetch_changes(calendar_id, sync_token, original=client._fetch_changes):
+        if sync_token:
+            raise GoogleCalendarError("Gone", status=410)
+        return original(calendar_id, sync_token)
+
+    monkeypatch.setattr(client, "_fetch_changes", fetch_changes)
+
+    events = client.list_from_to("2026-01-30T00:00:00Z", "2026-01-31T00:00:00Z")
+
+    assert [event.id for event in events] == ["c"]
+    assert client._stores["primary"].sync_token == "sync-2"
+
+
+def test_client_find_conflicts_uses_cached_busy_index(monkeypatch):
+    service = _FakeService(
+        [
+            {
+                "items": [
+                    _event("busy", "2026-01-30T10:00:00Z", "2026-01-30T11:00:00Z"),
+                    _event("free", "2026-01-30T10:00:00Z", "2026-01-30T11:00:00Z", transparency="transparent"),
+                ],
+                "nextSyncToken": "sync-1",
+            }
+        ]
+    )
+    client = _client(monkeypatch, service)
+
+    results = client.find_conflicts(
+        [
+            ("2026-01-30T10:30:00+00:00", "2026-01-30T12:00:00+00:00"),
+            ("2026-01-30T11:00:00+00:00", "2026-01-30T12:00:00+00:00"),
+        ]
+    )
+
+    assert [[event.id for event in found] for found in results] == [["busy"], []]
+    assert len(service.calls) == 1
+
+
+def test_client_creates_a_series_in_one_insert_and_resyncs_for_its_instances(monkeypatch):
+    instances = [
+        _event(f"series_{day}", f"2026-01-{day}T09:00:00Z", f"2026-01-{day}T09:30:00Z", recurringEventId="series")
+        for day in (30, 31)
+    ]
+    service = _FakeService(
+        [
+            {"items": [], "nextSyncToken": "sync-1"},
+            {"items": instances, "nextSyncToken": "sync-2"},
+        ]
+    )
+    inserted = []
+    service.insert = lambda calendarId, body, fields=None: inserted.append(body) or _Request({"id": "series", **body})
+    client = _client(monkeypatch, service)
+    client.list_from_to("2026-01-30T00:00:00Z", "2026-02-01T00:00:00Z")
+
+    client.create_event(
+        "Standup",
+        "2026-01-30T09:00:00+00:00",
+        "2026-01-30T09:30:00+00:00",
+        recurrence=["RRULE:FREQ=DAILY;COUNT=2"],
+    )
+    events = client.list_from_to("2026-01-30T00:00:00Z", "2026-02-01T00:00:00Z")
+
+    assert [body["recurrence"] for body in inserted] == [["RRULE:FREQ=DAILY;COUNT=2"]]
+    assert [event.id for event in events] == ["series_30", "series_31"]
+    assert service.calls[1]["syncToken"] == "sync-1"
+
+
+def test_concurrent_readers_of_a_stale_store_share_one_sync(monkeypatch):
+    service = _FakeService(
+        [
+            {"items": [_event("a", "2026-01-30T10:00:00Z", "2026-01-30T11:00:00Z")], "nextSyncToken": "sync-1"},
+            {"items": [], "nextSyncToken": "sync-2"},
+        ]
+    )
+    client = _client(monkeypatch, service)
+    client.list_from_to("2026-01-30T00:00:00Z", "2026-01-31T00:00:00Z")
+    client._stores["primary"].synced_at -= 1000
+    fetches = []
+
+    def slow_fetch(calendar_id, sync_token, original=client._fetch_changes):
+        fetches.append(sync_token)
+        time.sleep(0.05)
+        return original(calendar_id, sync_token)
+
+    monkeypatch.setattr(client, "_fetch_changes", slow_fetch)
+    seen = []
+    readers = [
+        threading.Thread(target=lambda: seen.append(client.list_from_to("2026-01-30T00:00:00Z", "2026-01-31T00:00:00Z")))
+        for _ in range(8)
+    ]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join()
+
+    assert fetches == ["sync-1"]
+    assert [[event.id for event in events] for events in seen] == [["a"]] * 8
+
+
+def test_reads_are_not_blocked_while_a_sync_fetches():
+    store = EventStore("primary", ZoneInfo("UTC"))
+    store.apply_sync([_event("a", "2026-01-30T10:00:00Z", "2026-01-30T11:00:00Z")], sync_token="t1")
+    fetching, release = threading.Event(), threading.Event()
+
+    def fetch(sync_token):
+        fetching.set()
+        release.wait(2)
+        return [], "t2", False
+
+    syncer = threading.Thread(target=store.refresh, args=(fetch,))
+    syncer.start()
+    fetching.wait(2)
+    started = time.monotonic()
+    events = store.window("2026-01-30T00:00:00Z", "2026-01-31T00:00:00Z")
+    release.set()
+    syncer.join()
+
+    assert [event.id for event in events] == ["a"]
+    assert time.monotonic() - started < 1
+    assert store.sync_token == "t2"
+
+
+def test_sync_creates_the_store_of_a_new_calendar(monkeypatch):
+    service = _FakeService(
+        [{"items": [_event("t", "2026-01-30T10:00:00Z", "2026-01-30T11:00:00Z")], "nextSyncToken": "sync-1"}]
+    )
+    client = _client(monkeypatch, service)
+
+    client.sync("team@example.com")
+
+    assert client._stores["team@example.com"].sync_token == "sync-1"
+    assert service.calls[0]["calendarId"] == "team@example.com"
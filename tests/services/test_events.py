@@ -0,0 +1,60 @@
+from zoneinfo import ZoneInfo
+
+from app.services.events import Event
+
+UTC = ZoneInfo("UTC")
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def _event(**extra):
+    return Event.from_api(
+        {"id": "x", "start": {"dateTime": "2026-01-30T10:00:00Z"}, "end": {"dateTime": "2026-01-30T11:00:00Z"}, **extra},
+        UTC,
+    )
+
+
+def test_from_api_parses_bounds_once_and_keeps_the_api_strings():
+    event = Event.from_api(
+        {
+            "id": "abc",
+            "summary": "Standup",
+            "start": {"dateTime": "2026-01-30T09:00:00-05:00"},
+            "end": {"dateTime": "2026-01-30T09:15:00-05:00"},
+        },
+        UTC,
+    )
+
+    assert (event.id, event.summary, event.all_day) == ("abc", "Standup", False)
+    assert event.end - event.start == 15 * 60
+    assert (event.start_iso, event.end_iso) == ("2026-01-30T09:00:00-05:00", "2026-01-30T09:15:00-05:00")
+
+
+def test_all_day_events_start_at_midnight_in_the_calendar_zone():
+    event = Event.from_api({"id": "x", "start": {"date": "2026-01-30"}, "end": {"date": "2026-01-31"}}, NEW_YORK)
+
+    assert event.all_day
+    assert (event.start_iso, event.end_iso) == ("2026-01-30", "2026-01-31")
+    assert event.end - event.start == 24 * 3600
+    assert event.start == 1769749200  # 2026-01-30T00:00:00-05:00
+
+
+def test_is_busy_skips_free_declined_cancelled_and_all_day_events():
+    assert _event().is_busy()
+    assert not _event(transparency="transparent").is_busy()
+    assert not _event(status="cancelled").is_busy()
+    assert not _event(attendees=[{"self": True, "responseStatus": "declined"}, {"responseStatus": "accepted"}]).is_busy()
+    all_day = Event.from_api({"id": "x", "start": {"date": "2026-01-30"}, "end": {"date": "2026-01-31"}}, UTC)
+    assert not all_day.is_busy()
+    assert all_day.is_busy(include_all_day=True)
+
+
+def test_to_dict_is_the_tool_payload():
+    event = Event.from_api({"id": "x", "start": {"date": "2026-01-30"}, "end": {"date": "2026-01-31"}}, UTC)
+
+    assert event.to_dict() == {"summary": "Untitled event", "start": "2026-01-30", "end": "2026-01-31", "eventId": "x"}
+    assert _event(summary="Review").tagged("team").to_dict(with_id=False) == {
+        "summary": "Review",
+        "start": "2026-01-30T10:00:00Z",
+        "end": "2026-01-30T11:00:00Z",
+        "calendar": "team",
+    }
@@ -0,0 +1,13 @@
+from app.services.fields import event_mask, list_mask
+
+
+def test_list_mask_projects_items_and_keeps_paging_tokens():
+    assert list_mask("list_events") == "items(id,summary,start,end),nextPageToken"
+    assert list_mask("sync_events", sync=True).endswith(",nextPageToken,nextSyncToken")
+    assert "attendees(self,responseStatus)" in list_mask("conflicts")
+
+
+def test_masks_can_be_widened_without_duplicates():
+    assert event_mask("get_event") == "id,summary,start,end"
+    assert event_mask("get_event", "description", "summary") == "id,summary,start,end,description"
+    assert list_mask("list_events", "location") == "items(id,summary,start,end,location),nextPageToken"
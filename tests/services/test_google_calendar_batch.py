@@ -0,0 +1,131 @@
+from zoneinfo import ZoneInfo
+
+from googleapiclient.errors import HttpError
+
+from app.services.google_calendar import GoogleCalendarClient
+
+
+class _Resp:
+    def __init__(self, status: int):
+        self.status = status
+        self.reason = "error"
+
+
+class _Request:
+    def __init__(self, kind, **params):
+        self.kind = kind
+        self.params = params
+
+
+class _Batch:
+    def __init__(self, service, callback):
+        self._service = service
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, request_id):
+        self._requests.append((request_id, request))
+
+    def execute(self, http=None):
+        if len(self._service.batches) in self._service.failing_batches:
+            self._service.batches.append(None)
+            raise self._service.failing_batches[len(self._service.batches) - 1]
+        self._service.batches.append([request_id for request_id, _ in self._requests])
+        for request_id, request in self._requests:
+            outcome = self._service.outcome(request)
+            if isinstance(outcome, Exception):
+                self._callback(request_id, None, outcome)
+            else:
+                self._callback(request_id, outcome, None)
+
+
+class _FakeService:
+    def __init__(self, outcomes):
+        # event id -> list of outcomes, consumed one per attempt
+        self.outcomes = outcomes
+        self.batches = []
+        # batch number -> error the whole HTTP call fails with
+        self.failing_batches = {}
+
+    def events(self):
+        return self
+
+    def insert(self, calendarId, body, fields=None):
+        return _Request("insert", body=body)
+
+    def delete(self, calendarId, eventId):
+        return _Request("delete", eventId=eventId)
+
+    def new_batch_http_request(self, callback):
+        return _Batch(self, callback)
+
+    def outcome(self, request):
+        key = request.params.get("eventId") or request.params["body"]["summary"]
+        return self.outcomes[key].pop(0)
+
+
+class _Settings:
+    default_calendar_id = "primary"
+    timezone = "UTC"
+    tzinfo = ZoneInfo("UTC")
+    event_cache_enabled = False
+    event_cache_max_staleness_seconds = 0
+
+
+def _client(monkeypatch, service):
+    monkeypatch.setattr(GoogleCalendarClient, "_build_service", lambda self: service)
+    monkeypatch.setattr("app.services.google_calendar.load_settings", lambda: _Settings())
+    monkeypatch.setattr("app.services.google_calendar.time.sleep", lambda s: None)
+    return GoogleCalendarClient()
+
+
+def test_batch_retries_only_transient_sub_request_failures(monkeypatch):
+    service = _FakeService(
+        {
+            "a": [""],
+            "b": [HttpError(_Resp(503), b"busy"), ""],
+            "c": [HttpError(_Resp(404), b"not found")],
+        }
+    )
+    client = _client(monkeypatch, service)
+
+    results = client.delete_events(["a", "b", "c"])
+
+    assert [result.ok for result in results] == [True, True, False]
+    assert results[2].error.status == 404
+    assert service.batches == [["0", "1", "2"], ["1"]]
+
+
+def test_batch_splits_into_chunks_of_fifty(monkeypatch):
+    summaries = [f"event-{i}" for i in range(120)]
+    service = _FakeService({summary: [{"id": summary, "summary": summary}] for summary in summaries})
+    client = _client(monkeypatch, service)
+
+    results = client.create_events(
+        [
+            {"summary": summary, "start_time": "2026-01-30T10:00:00+00:00", "end_time": "2026-01-30T11:00:00+00:00"}
+            for summary in summaries
+        ]
+    )
+
+    assert [len(batch) for batch in service.batches] == [50, 50, 20]
+    assert [result.response["id"] for result in results] == summaries
+
+
+def test_a_failed_chunk_keeps_the_results_of_the_others(monkeypatch):
+    summaries = [f"event-{i}" for i in range(120)]
+    service = _FakeService({summary: [{"id": summary, "summary": summary}] for summary in summaries})
+    service.failing_batches = {1: ConnectionResetError("connection reset")}
+    client = _client(monkeypatch, service)
+
+    results = client.create_events(
+        [
+            {"summary": summary, "start_time": "2026-01-30T10:00:00+00:00", "end_time": "2026-01-30T11:00:00+00:00"}
+            for summary in summaries
+        ]
+    )
+
+    assert [result.ok for result in results] == [True] * 50 + [False] * 50 + [True] * 20
+    assert "connection reset" in results[50].error.reason
+    assert results[0].response["id"] == "event-0"
+    assert results[119].response["id"] == "event-119"
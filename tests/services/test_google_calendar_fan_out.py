@@ -0,0 +1,118 @@
+import json
+import threading
+from zoneinfo import ZoneInfo
+
+import httplib2
+
+from app.services.events import Event
+from app.services.google_calendar import GoogleCalendarClient
+
+
+class _Request:
+    """Stands in for `HttpRequest`: the body is handed to `postproc` as JSON bytes."""
+
+    def __init__(self, response):
+        self._response = response
+        self.postproc = lambda resp, content: json.loads(content)
+
+    def execute(self, http=None):
+        return self.postproc(httplib2.Response({"status": 200}), json.dumps(self._response).encode())
+
+
+class _CalendarsService:
+    """Answers `events().list` per calendar, waiting until every calendar has been asked."""
+
+    def __init__(self, items_by_calendar):
+        self.items_by_calendar = items_by_calendar
+        self.calls = []
+        self._all_asked = threading.Barrier(len(items_by_calendar), timeout=5)
+
+    def events(self):
+        return self
+
+    def list(self, pageToken=None, **params):
+        self.calls.append(params["calendarId"])
+        # Only passes if the calendars are read concurrently.
+        self._all_asked.wait()
+        return _Request({"items": self.items_by_calendar[params["calendarId"]]})
+
+
+class _Settings:
+    default_calendar_id = "me"
+    read_calendar_ids = ("me", "team", "room")
+    timezone = "UTC"
+    tzinfo = ZoneInfo("UTC")
+    event_cache_enabled = False
+    event_cache_max_staleness_seconds = 0
+
+
+def _event(event_id, start, end, **extra):
+    return {"id": event_id, "start": {"dateTime": start}, "end": {"dateTime": end}, **extra}
+
+
+def _client(monkeypatch, service):
+    monkeypatch.setattr(GoogleCalendarClient, "_build_service", lambda self: service)
+    monkeypatch.setattr("app.services.google_calendar.load_settings", lambda: _Settings())
+    return GoogleCalendarClient()
+
+
+def _service():
+    return _CalendarsService(
+        {
+            "me": [
+                _event("standup", "2026-01-30T09:00:00Z", "2026-01-30T09:15:00Z"),
+                _event("lunch", "2026-01-30T12:00:00Z", "2026-01-30T13:00:00Z"),
+            ],
+            "team": [_event("review", "2026-01-30T10:00:00Z", "2026-01-30T11:00:00Z")],
+            "room": [
+                _event("booked", "2026-01-30T08:00:00Z", "2026-01-30T09:30:00Z"),
+                _event("free", "2026-01-30T12:30:00Z", "2026-01-30T13:00:00Z", transparency="transparent"),
+            ],
+        }
+    )
+
+
+def test_list_from_to_reads_calendars_concurrently_and_merges_in_start_order(monkeypatch):
+    service = _service()
+    client = _client(monkeypatch, service)
+
+    events = client.list_from_to("2026-01-30T00:00:00Z", "2026-01-31T00:00:00Z")
+    upcoming = client.list_events("2026-01-30T00:00:00Z", max_results=2)
+
+    assert [(event.id, event.calendar_id) for event in events] == [
+        ("booked", "room"),
+        ("standup", "me"),
+        ("review", "team"),
+        ("lunch", "me"),
+        ("free", "room"),
+    ]
+    assert [event.id for event in upcoming] == ["booked", "standup"]
+    assert sorted(service.calls[:3]) == ["me", "room", "team"]
+
+
+def test_find_conflicts_checks_every_calendar(monkeypatch):
+    client = _client(monkeypatch, _service())
+
+    (first, second) = client.find_conflicts(
+        [
+            ("2026-01-30T09:00:00+00:00", "2026-01-30T10:30:00+00:00"),
+            ("2026-01-30T12:30:00+00:00", "2026-01-30T12:45:00+00:00"),
+        ]
+    )
+
+    assert [(event.id, event.calendar_id) for event in first] == [
+        ("booked", "room"),
+        ("standup", "me"),
+        ("review", "team"),
+    ]
+    assert [(event.id, event.calendar_id) for event in second] == [("lunch", "me")]
+
+
+def test_an_explicit_single_calendar_is_read_untagged(monkeypatch):
+    service = _CalendarsService({"team": [_event("review", "2026-01-30T10:00:00Z", "2026-01-30T11:00:00Z")]})
+    client = _client(monkeypatch, service)
+
+    events = client.list_from_to("2026-01-30T00:00:00Z", "2026-01-31T00:00:00Z", calendar_ids=["team"])
+
+    assert events == [Event.from_api(_event("review", "2026-01-30T10:00:00Z", "2026-01-30T11:00:00Z"), ZoneInfo("UTC"))]
+    assert service.calls == ["team"]
@@ -0,0 +1,114 @@
+import json
+from zoneinfo import ZoneInfo
+
+import httplib2
+
+from app.services.google_calendar import GoogleCalendarClient
+
+
+class _Request:
+    """Stands in for `HttpRequest`: the body is handed to `postproc` as JSON bytes."""
+
+    def __init__(self, response):
+        self._response = response
+        self.postproc = lambda resp, content: json.loads(content)
+
+    def execute(self, http=None):
+        return self.postproc(httplib2.Response({"status": 200}), json.dumps(self._response).encode())
+
+
+class _PagedService:
+    def __init__(self, pages):
+        self.pages = {page_token: page for page_token, page in pages.items()}
+        self.calls = []
+
+    def events(self):
+        return self
+
+    def list(self, pageToken=None, **params):
+        self.calls.append({"pageToken": pageToken, **params})
+        return _Request(self.pages[pageToken])
+
+
+class _Settings:
+    default_calendar_id = "primary"
+    read_calendar_ids = ("primary",)
+    timezone = "UTC"
+    tzinfo = ZoneInfo("UTC")
+    event_cache_enabled = False
+    event_cache_max_staleness_seconds = 0
+
+
+def _client(monkeypatch, service):
+    monkeypatch.setattr(GoogleCalendarClient, "_build_service", lambda self: service)
+    monkeypatch.setattr("app.services.google_calendar.load_settings", lambda: _Settings())
+    return GoogleCalendarClient()
+
+
+def _item(event_id, day):
+    return {
+        "id": event_id,
+        "start": {"dateTime": f"2026-01-{day}T09:00:00Z"},
+        "end": {"dateTime": f"2026-01-{day}T10:00:00Z"},
+    }
+
+
+def _pages():
+    return {
+        None: {"items": [_item("a", 30), _item("b", 30)], "nextPageToken": "p2"},
+        "p2": {"items": [_item("c", 31)], "nextPageToken": "p3"},
+        "p3": {"items": [_item("d", 31)]},
+    }
+
+
+def test_list_from_to_follows_every_page(monkeypatch):
+    service = _PagedService(_pages())
+    client = _client(monkeypatch, service)
+
+    events = client.list_from_to("2026-01-30T00:00:00Z", "2026-02-28T00:00:00Z")
+
+    assert [event.id for event in events] == ["a", "b", "c", "d"]
+    assert [call["pageToken"] for call in service.calls] == [None, "p2", "p3"]
+    assert service.calls[0]["timeMax"] == "2026-02-28T00:00:00Z"
+
+
+def test_iter_events_fetches_pages_lazily(monkeypatch):
+    service = _PagedService(_pages())
+    client = _client(monkeypatch, service)
+
+    events = client.iter_events(time_min="2026-01-30T00:00:00Z", page_size=2)
+
+    assert next(events)["id"] == "a"
+    assert len(service.calls) == 1
+    assert service.calls[0]["maxResults"] == 2
+
+
+def test_iter_events_with_prefetch_preserves_order(monkeypatch):
+    service = _PagedService(_pages())
+    client = _client(monkeypatch, service)
+
+    events = list(client.iter_events(time_min="2026-01-30T00:00:00Z", prefetch=True, fields="items(id),nextPageToken"))
+
+    assert [event["id"] for event in events] == ["a", "b", "c", "d"]
+    assert all(call["fields"] == "items(id),nextPageToken" for call in service.calls)
+
+
+def test_list_events_stops_after_max_results(monkeypatch):
+    service = _PagedService(_pages())
+    client = _client(monkeypatch, service)
+
+    events = client.list_events("2026-01-30T00:00:00Z", max_results=3)
+
+    assert [event.id for event in events] == ["a", "b", "c"]
+    assert len(service.calls) == 2
+
+
+def test_list_calls_default_to_the_listing_field_mask(monkeypatch):
+    service = _PagedService(_pages())
+    client = _client(monkeypatch, service)
+
+    client.list_from_to("2026-01-30T00:00:00Z", "2026-02-28T00:00:00Z")
+    client.list_events("2026-01-30T00:00:00Z", max_results=1, fields="items(id,description),nextPageToken")
+
+    assert service.calls[0]["fields"] == "items(id,summary,start,end),nextPageToken"
+    assert service.calls[-1]["fields"] == "items(id,description),nextPageToken"
@@ -24,7 +24,7 @@ def test_execute_retries_transient_http_errors(monkeypatch):
     calls = {"count": 0}
 
     class DummyRequest:
-        def execute(self):
+        def execute(self, http=None):
             calls["count"] += 1
             if calls["count"] <= 2:
                 raise HttpError(_Resp(503), b"service unavailable")
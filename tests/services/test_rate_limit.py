@@ -0,0 +1,95 @@
+from googleapiclient.errors import HttpError
+
+from app.services.google_calendar import GoogleCalendarClient, GoogleCalendarError
+from app.services.rate_limit import RateLimiter, retry_after_seconds
+
+
+def test_token_bucket_makes_callers_wait_once_burst_is_spent():
+    limiter = RateLimiter(rate=2.0)
+
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == 0.0
+    assert 0.4 < limiter.reserve() <= 0.5
+    assert limiter.stats()["requests"] == 3
+
+
+def test_aimd_halves_rate_on_throttle_and_grows_back_additively():
+    limiter = RateLimiter(rate=8.0, increase=1.0)
+
+    limiter.on_throttle()
+    assert limiter.rate == 4.0
+    limiter.on_success()
+    limiter.on_success()
+    assert limiter.rate == 6.0
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.rate == 8.0
+
+
+def test_retry_budget_caps_retries_to_a_fraction_of_requests():
+    limiter = RateLimiter(rate=1000.0, retry_ratio=0.1, retry_burst=2.0)
+
+    assert limiter.try_retry()
+    assert limiter.try_retry()
+    assert not limiter.try_retry()
+    for _ in range(10):
+        limiter.reserve()
+    assert limiter.try_retry()
+    assert limiter.stats()["retries"] == 3
+    assert limiter.stats()["retries_denied"] == 1
+
+
+def test_retry_after_accepts_seconds_and_missing_headers():
+    assert retry_after_seconds({"retry-after": "7"}) == 7.0
+    assert retry_after_seconds({}) is None
+    assert retry_after_seconds(object()) is None
+
+
+class _Resp(dict):
+    def __init__(self, status, headers=None):
+        super().__init__(headers or {})
+        self.status = status
+        self.reason = "error"
+
+
+def test_execute_honors_retry_after_and_slows_the_shared_limiter(monkeypatch):
+    monkeypatch.setattr(GoogleCalendarClient, "_build_service", lambda self: None)
+    client = GoogleCalendarClient()
+    client._limiter = RateLimiter(rate=10.0)
+    client._BASE_BACKOFF_SECONDS = 0.0
+
+    sleeps = []
+    monkeypatch.setattr("app.services.google_calendar.time.sleep", lambda s: sleeps.append(s))
+    calls = {"count": 0}
+
+    class ThrottledRequest:
+        def execute(self, http=None):
+            calls["count"] += 1
+            if calls["count"] == 1:
+                raise HttpError(_Resp(429, {"retry-after": "3"}), b"rate limited")
+            return {"ok": True}
+
+    assert client._execute("op", ThrottledRequest()) == {"ok": True}
+    assert sleeps[0] == 3.0
+    assert client._limiter.rate < 10.0
+    assert client._limiter.stats()["throttled"] == 1
+
+
+def test_execute_gives_up_when_retry_budget_is_exhausted(monkeypatch):
+    monkeypatch.setattr(GoogleCalendarClient, "_build_service", lambda self: None)
+    client = GoogleCalendarClient()
+    client._limiter = RateLimiter(rate=1000.0, retry_burst=0.0)
+    calls = {"count": 0}
+
+    class FailingRequest:
+        def execute(self, http=None):
+            calls["count"] += 1
+            raise HttpError(_Resp(503), b"unavailable")
+
+    try:
+        client._execute("op", FailingRequest())
+    except GoogleCalendarError as exc:
+        assert exc.status == 503
+    else:
+        raise AssertionError("expected GoogleCalendarError")
+    assert calls["count"] == 1
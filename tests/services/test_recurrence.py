@@ -0,0 +1,100 @@
+import math
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.services.recurrence import RecurrenceError, expand, format_rrule, parse_rrule, series_window
+
+UTC = ZoneInfo("UTC")
+NY = ZoneInfo("America/New_York")
+
+
+def _days(rule, start):
+    return [occurrence.date().isoformat() for occurrence in expand(parse_rrule(rule), start)]
+
+
+def test_weekly_byday_with_count_starts_at_dtstart():
+    start = datetime(2026, 1, 21, 9, 0, tzinfo=UTC)  # a Wednesday
+
+    assert _days("RRULE:FREQ=WEEKLY;BYDAY=MO,WE;COUNT=4", start) == [
+        "2026-01-21",
+        "2026-01-26",
+        "2026-01-28",
+        "2026-02-02",
+    ]
+
+
+def test_monthly_ordinals_until_and_skipped_short_months():
+    last_friday = _days("FREQ=MONTHLY;BYDAY=-1FR;UNTIL=20260430", datetime(2026, 1, 30, 15, 0, tzinfo=UTC))
+    assert last_friday == ["2026-01-30", "2026-02-27", "2026-03-27", "2026-04-24"]
+
+    # No February 31st: the month is skipped, not clamped.
+    assert _days("FREQ=MONTHLY;COUNT=3", datetime(2026, 1, 31, 9, 0, tzinfo=UTC)) == [
+        "2026-01-31",
+        "2026-03-31",
+        "2026-05-31",
+    ]
+
+
+def test_yearly_byday_without_bymonth_covers_the_whole_year():
+    mondays = _days("FREQ=YEARLY;BYDAY=MO;COUNT=6", datetime(2026, 1, 5, 9, 0, tzinfo=UTC))
+    assert mondays == ["2026-01-05", "2026-01-12", "2026-01-19", "2026-01-26", "2026-02-02", "2026-02-09"]
+
+    occurrences = expand(parse_rrule("FREQ=YEARLY;BYDAY=MO;UNTIL=20261231"), datetime(2026, 1, 5, 9, 0, tzinfo=UTC))
+    assert len(occurrences) == 52
+    assert _days("FREQ=YEARLY;BYMONTHDAY=15;COUNT=3", datetime(2026, 1, 15, 9, 0, tzinfo=UTC)) == [
+        "2026-01-15",
+        "2026-02-15",
+        "2026-03-15",
+    ]
+    assert _days("FREQ=YEARLY;COUNT=2", datetime(2026, 3, 10, 9, 0, tzinfo=UTC)) == ["2026-03-10", "2027-03-10"]
+
+
+def test_sparse_daily_rules_are_searched_across_years():
+    start = datetime(2026, 1, 30, 10, tzinfo=UTC)
+
+    assert _days("FREQ=DAILY;BYMONTH=12;BYMONTHDAY=25;COUNT=3", start) == ["2026-12-25", "2027-12-25", "2028-12-25"]
+    assert series_window(
+        "2026-12-25T10:00:00+00:00", "2026-12-25T11:00:00+00:00", ["RRULE:FREQ=DAILY;BYMONTH=12;BYMONTHDAY=25;COUNT=3"], UTC
+    )[1] == datetime(2028, 12, 25, 11, tzinfo=UTC).timestamp()
+    # A rule that can never match still ends.
+    assert _days("FREQ=DAILY;BYMONTH=2;BYMONTHDAY=31;COUNT=2", start) == []
+
+
+def test_numbered_byday_error_names_both_frequencies():
+    with pytest.raises(RecurrenceError, match="FREQ=MONTHLY or YEARLY"):
+        parse_rrule("FREQ=WEEKLY;BYDAY=1MO")
+
+
+def test_occurrences_keep_wall_clock_time_across_dst():
+    occurrences = expand(parse_rrule("FREQ=WEEKLY;INTERVAL=2;COUNT=3"), datetime(2026, 2, 26, 9, 30, tzinfo=NY))
+
+    assert [occurrence.isoformat() for occurrence in occurrences] == [
+        "2026-02-26T09:30:00-05:00",
+        "2026-03-12T09:30:00-04:00",
+        "2026-03-26T09:30:00-04:00",
+    ]
+
+
+@pytest.mark.parametrize(
+    "rule",
+    ["FREQ=HOURLY", "FREQ=WEEKLY;BYSETPOS=1", "FREQ=DAILY;COUNT=2;UNTIL=20260101", "FREQ=WEEKLY;BYDAY=XX", "BYDAY=MO", "FREQ=WEEKLY;BYMONTHDAY=1"],
+)
+def test_parse_rrule_rejects_unsupported_rules(rule):
+    with pytest.raises(RecurrenceError):
+        parse_rrule(rule)
+
+
+def test_format_rrule_and_series_window():
+    assert format_rrule("freq=daily;count=3") == "RRULE:FREQ=DAILY;COUNT=3"
+
+    start, end = "2026-01-30T10:00:00+00:00", "2026-01-30T11:00:00+00:00"
+    assert series_window(start, end, None, UTC) == (
+        datetime(2026, 1, 30, 10, tzinfo=UTC).timestamp(),
+        datetime(2026, 1, 30, 11, tzinfo=UTC).timestamp(),
+    )
+    assert series_window(start, end, ["RRULE:FREQ=DAILY;COUNT=3"], UTC)[1] == datetime(
+        2026, 2, 1, 11, tzinfo=UTC
+    ).timestamp()
+    assert series_window(start, end, ["RRULE:FREQ=DAILY"], UTC)[1] == math.inf
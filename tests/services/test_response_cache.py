@@ -0,0 +1,98 @@
+import math
+
+from app.services.client_provider import acting_as
+from app.services.response_cache import ResponseCache, invalidate_event, set_response_cache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_the_ttl():
+    clock = Clock()
+    cache = ResponseCache(ttl_seconds=60, clock=clock)
+    cache.put("today", "Nothing today.", [(0, 100)])
+
+    clock.now = 59
+    assert cache.get("today") == "Nothing today."
+    clock.now = 61
+    assert cache.get("today") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entries_are_evicted_first():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", "A", [])
+    cache.put("b", "B", [])
+    cache.get("a")
+    cache.put("c", "C", [])
+
+    assert cache.get("a") == "A"
+    assert cache.get("b") is None
+    assert cache.get("c") == "C"
+
+
+def test_mutations_drop_only_overlapping_entries():
+    cache = ResponseCache()
+    cache.put("morning", "free", [(0, 100)])
+    cache.put("afternoon", "busy", [(200, 300)])
+    cache.put("upcoming", "next 5", [(50, math.inf)])
+
+    assert cache.invalidate(100, 150) == 1
+
+    assert cache.get("morning") == "free"
+    assert cache.get("afternoon") == "busy"
+    assert cache.get("upcoming") is None
+
+
+def test_answers_are_scoped_to_the_acting_user(monkeypatch):
+    cache = ResponseCache()
+    monkeypatch.setattr("app.services.client_provider.get_credential_pool", lambda: None)
+    with acting_as("alice"):
+        cache.put("today", "Alice's day", [(0, 100)])
+
+    assert cache.get("today") is None
+    with acting_as("bob"):
+        cache.invalidate(0, 100)
+    with acting_as("alice"):
+        assert cache.get("today") == "Alice's day"
+
+
+def test_answers_computed_before_a_mutation_are_not_stored():
+    cache = ResponseCache()
+    generation = cache.generation
+    cache.invalidate(0, 10)
+
+    cache.put("today", "stale", [(0, 100)], generation=generation)
+
+    assert cache.get("today") is None
+
+
+def test_similar_prompts_share_an_answer_within_their_group():
+    vectors = {
+        "what's on today": [1.0, 0.0],
+        "what do i have today": [0.98, 0.2],
+        "delete everything": [0.0, 1.0],
+    }
+    cache = ResponseCache(embed=vectors.__getitem__, similarity=0.95)
+    cache.put("k1", "Standup at 10.", [(0, 100)], text="what's on today", group="2026-10-18")
+
+    assert cache.get("k2", text="what do i have today", group="2026-10-18") == "Standup at 10."
+    assert cache.get("k3", text="what do i have today", group="2026-10-19") is None
+    assert cache.get("k4", text="delete everything", group="2026-10-18") is None
+    assert cache.stats()["similar_hits"] == 1
+
+
+def test_invalidate_event_without_times_clears_the_calendar():
+    cache = ResponseCache()
+    set_response_cache(cache)
+    cache.put("a", "A", [(0, 100)])
+    cache.put("b", "B", [(10**9, 10**9 + 100)])
+
+    invalidate_event({"summary": "no times requested"})
+
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,56 @@
+import json
+from zoneinfo import ZoneInfo
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+
+from app.services.events import Event
+from app.services.response_model import EventListModel, OrjsonModel
+
+UTC = ZoneInfo("UTC")
+
+
+def _page():
+    return {
+        "items": [
+            {
+                "id": "a",
+                "summary": "Standup ☕",
+                "start": {"dateTime": "2026-01-30T09:00:00Z"},
+                "end": {"dateTime": "2026-01-30T09:15:00Z"},
+            },
+            {"id": "b", "start": {"date": "2026-01-31"}, "end": {"date": "2026-02-01"}},
+        ],
+        "nextPageToken": "p2",
+    }
+
+
+def _ok():
+    return httplib2.Response({"status": 200})
+
+
+def test_orjson_model_decodes_like_the_stdlib_model():
+    content = json.dumps(_page()).encode()
+
+    assert OrjsonModel().response(_ok(), content) == JsonModel().response(_ok(), content)
+    assert OrjsonModel().response(httplib2.Response({"status": 204}), b"") == {}
+
+
+def test_orjson_model_falls_back_to_text_and_unwraps_data():
+    assert OrjsonModel().deserialize(b"not json") == "not json"
+    assert OrjsonModel(data_wrapper=True).deserialize(b'{"data": {"id": "a"}}') == {"id": "a"}
+
+
+def test_error_responses_still_raise_http_error():
+    with pytest.raises(HttpError):
+        OrjsonModel().response(httplib2.Response({"status": 404}), b'{"error": {"message": "Not Found"}}')
+
+
+def test_event_list_model_parses_items_into_events():
+    body = EventListModel(UTC).response(_ok(), json.dumps(_page()).encode())
+
+    assert body["nextPageToken"] == "p2"
+    assert body["items"] == [Event.from_api(item, UTC) for item in _page()["items"]]
+    assert body["items"][0].summary == "Standup ☕"
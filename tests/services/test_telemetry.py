@@ -0,0 +1,105 @@
+import io
+import json
+
+from googleapiclient.errors import HttpError
+from langchain.tools import tool
+
+from app.services import telemetry
+from app.services.google_calendar import GoogleCalendarClient
+from app.services.telemetry import JsonLogExporter, get_metrics, instrument_tool, prometheus_text, span
+
+
+class _Resp:
+    def __init__(self, status: int, reason: str = "service unavailable"):
+        self.status = status
+        self.reason = reason
+
+
+def _histogram(name, **labels):
+    for item in get_metrics().snapshot()["histograms"].get(name, []):
+        if item["labels"] == labels:
+            return item
+    return None
+
+
+def _counter(name, **labels):
+    for item in get_metrics().snapshot()["counters"].get(name, []):
+        if item["labels"] == labels:
+            return item["value"]
+    return 0
+
+
+def test_spans_nest_and_the_root_is_exported_as_one_json_line(monkeypatch):
+    sink = io.StringIO()
+    monkeypatch.setattr(telemetry, "_exporters", [JsonLogExporter(sink)])
+
+    with span("agent.turn", path="llm") as turn:
+        with span("tool.list_today_events_tool", metric="tool_seconds", tool="list_today_events_tool"):
+            with span("calendar.list_from_to"):
+                pass
+        turn.attributes["input_tokens"] = 120
+
+    (line,) = sink.getvalue().splitlines()
+    exported = json.loads(line)
+    assert exported["name"] == "agent.turn"
+    assert exported["attributes"] == {"path": "llm", "input_tokens": 120}
+    (tool_span,) = exported["children"]
+    assert [child["name"] for child in tool_span["children"]] == ["calendar.list_from_to"]
+    assert _histogram("tool_seconds", tool="list_today_events_tool")["count"] == 1
+
+
+def test_execute_records_latency_retries_and_backoff_per_operation(monkeypatch):
+    monkeypatch.setattr(GoogleCalendarClient, "_build_service", lambda self: None)
+    monkeypatch.setattr("app.services.google_calendar.time.sleep", lambda s: None)
+    monkeypatch.setattr("app.services.google_calendar.random.uniform", lambda a, b: 0.0)
+    client = GoogleCalendarClient()
+    client._BASE_BACKOFF_SECONDS = 0.25
+    attempts = []
+
+    class FlakyRequest:
+        def execute(self, http=None):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise HttpError(_Resp(503), b"service unavailable")
+            return {"id": "abc"}
+
+    with span("tool.get") as parent:
+        client._execute("get_event", FlakyRequest())
+
+    (call,) = parent.children
+    assert call.name == "calendar.get_event"
+    assert call.attributes == {"operation": "get_event", "retries": 1, "backoff_seconds": 0.25}
+    assert _histogram("calendar_api_seconds", operation="get_event")["count"] == 1
+    assert _counter("calendar_api_retries_total", operation="get_event") == 1
+    assert _counter("calendar_api_backoff_seconds_total", operation="get_event") == 0.25
+
+
+def test_instrumented_tools_count_calls_and_errors():
+    @tool
+    def flaky_tool(fail: bool) -> dict:
+        """Fail on request."""
+        return {"ok": not fail, "data": None, "error": None}
+
+    instrument_tool(flaky_tool)
+    instrument_tool(flaky_tool)  # idempotent
+    flaky_tool.invoke({"fail": False})
+    flaky_tool.invoke({"fail": True})
+
+    assert _histogram("tool_seconds", tool="flaky_tool")["count"] == 2
+    assert _counter("tool_errors_total", tool="flaky_tool") == 1
+
+
+def test_prometheus_text_renders_cumulative_buckets_and_counters():
+    metrics = telemetry.Metrics()
+    metrics.observe("calendar_api_seconds", 0.02, operation="list_from_to")
+    metrics.observe("calendar_api_seconds", 0.3, operation="list_from_to")
+    metrics.increment("calendar_api_errors_total", operation="create_event", status=403)
+
+    text = prometheus_text(metrics)
+
+    assert "# TYPE calendar_api_seconds histogram" in text
+    assert 'calendar_api_seconds_bucket{operation="list_from_to",le="0.01"} 0' in text
+    assert 'calendar_api_seconds_bucket{operation="list_from_to",le="0.025"} 1' in text
+    assert 'calendar_api_seconds_bucket{operation="list_from_to",le="+Inf"} 2' in text
+    assert 'calendar_api_seconds_count{operation="list_from_to"} 2' in text
+    assert 'calendar_api_errors_total{operation="create_event",status="403"} 1' in text
@@ -0,0 +1,43 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+import app.agent.calendar_agent as calendar_agent
+import app.config.settings as settings_module
+import app.services.client_provider as client_provider
+from app.main import build_agent
+from app.services.auth.google_oauth import CredentialsUnavailableError
+
+
+@pytest.fixture
+def warm_up(monkeypatch, tmp_path):
+    token = tmp_path / "token.json"
+    token.write_text("{}")
+    monkeypatch.setattr(calendar_agent, "CalendarAgent", lambda: "agent")
+    monkeypatch.setattr(settings_module, "load_settings", lambda: SimpleNamespace(google_token_file=token))
+
+    def fail_with(error):
+        def get_calendar_client():
+            raise error
+
+        monkeypatch.setattr(client_provider, "get_calendar_client", get_calendar_client)
+
+    return fail_with
+
+
+@pytest.mark.parametrize("error", [CredentialsUnavailableError("no token"), OSError("offline")])
+def test_warm_up_failures_are_logged_not_raised(warm_up, caplog, error):
+    warm_up(error)
+
+    with caplog.at_level(logging.WARNING, logger="app.main"):
+        assert build_agent() == "agent"
+
+    assert "Could not warm the Google Calendar client" in caplog.text
+
+
+def test_unexpected_warm_up_errors_propagate(warm_up):
+    warm_up(ValueError("bug"))
+
+    with pytest.raises(ValueError):
+        build_agent()
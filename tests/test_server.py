@@ -0,0 +1,262 @@
+import asyncio
+
+import httpx
+from langchain.tools import tool
+
+from app.config.settings import load_settings, reload_settings, settings_override
+from app.server import CalendarServer
+
+
+class FakeAgent:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.prompts = []
+        self.sessions = []
+
+    async def arun(self, prompt, session_id=None):
+        self.prompts.append(prompt)
+        self.sessions.append(session_id)
+        await asyncio.sleep(self.delay)
+        return f"echo: {prompt}"
+
+
+@tool
+def echo_tool(text: str) -> dict:
+    """Echo `text` back."""
+    return {"ok": True, "data": {"text": text}, "error": None}
+
+
+def _server(*, delay=0.0, **kwargs):
+    built = []
+
+    def factory():
+        agent = FakeAgent(delay)
+        built.append(agent)
+        return agent
+
+    options = {"workers": 2, "max_concurrency": 8, "request_timeout": 1.0, "shutdown_grace": 1.0}
+    options.update(kwargs)
+    return CalendarServer(agent_factory=factory, tools=[echo_tool], **options), built
+
+
+def _client(server):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=server), base_url="http://test")
+
+
+def test_chat_reuses_warm_agents():
+    server, built = _server()
+
+    async def scenario():
+        async with _client(server) as client:
+            replies = await asyncio.gather(*(client.post("/chat", json={"message": f"hi {i}"}) for i in range(6)))
+            health = await client.get("/health")
+        return replies, health
+
+    replies, health = asyncio.run(scenario())
+
+    assert [r.json()["data"]["reply"] for r in replies] == [f"echo: hi {i}" for i in range(6)]
+    assert len(built) == 2
+    assert sum(len(agent.prompts) for agent in built) == 6
+    data = health.json()["data"]
+    assert (data["workers"], data["idle"], data["inflight"]) == (2, 2, 0)
+    assert "hit_rate" in data["fast_path"]
+
+
+def test_tool_endpoint_invokes_tool_and_validates_arguments():
+    server, _ = _server()
+
+    async def scenario():
+        async with _client(server) as client:
+            return (
+                await client.post("/tools/echo_tool", json={"text": "hello"}),
+                await client.post("/tools/echo_tool", json={}),
+                await client.post("/tools/missing_tool", json={}),
+                await client.get("/chat"),
+            )
+
+    called, invalid, missing, wrong_method = asyncio.run(scenario())
+
+    assert called.status_code == 200
+    assert called.json()["data"] == {"text": "hello"}
+    assert invalid.status_code == 400
+    assert missing.status_code == 404
+    assert wrong_method.status_code == 405
+
+
+def test_timeouts_and_overload_are_reported():
+    server, _ = _server(delay=1.0, workers=1, max_concurrency=1, request_timeout=0.05)
+
+    async def scenario():
+        async with _client(server) as client:
+            first = asyncio.create_task(client.post("/chat", json={"message": "slow"}))
+            await asyncio.sleep(0.01)
+            second = await client.post("/chat", json={"message": "rejected"})
+            return await first, second
+
+    timed_out, rejected = asyncio.run(scenario())
+
+    assert timed_out.status_code == 504
+    assert timed_out.json()["error"]["code"] == "timeout"
+    assert rejected.status_code == 503
+    assert rejected.json()["error"]["code"] == "overloaded"
+
+
+def test_shutdown_drains_in_flight_requests_and_rejects_new_ones():
+    server, _ = _server(delay=0.1, workers=1)
+
+    async def scenario():
+        async with _client(server) as client:
+            in_flight = asyncio.create_task(client.post("/chat", json={"message": "finish me"}))
+            await asyncio.sleep(0.02)
+            shutdown = asyncio.create_task(server.shutdown())
+            await asyncio.sleep(0)
+            late = await client.post("/chat", json={"message": "too late"})
+            await shutdown
+            assert in_flight.done()
+            return await in_flight, late
+
+    finished, late = asyncio.run(scenario())
+
+    assert finished.json()["data"]["reply"] == "echo: finish me"
+    assert late.status_code == 503
+    assert late.json()["error"]["code"] == "shutting_down"
+
+
+def test_chat_sessions_are_scoped_to_the_user():
+    server, built = _server(workers=1)
+
+    async def scenario():
+        async with _client(server) as client:
+            await client.post("/chat", json={"message": "a", "session_id": "s1"})
+            await client.post("/chat", json={"message": "b", "session_id": "s1"}, headers={"X-User-Id": "ann"})
+            await client.post("/chat", json={"message": "c"})
+            return await client.post("/chat", json={"message": "d", "session_id": 3})
+
+    invalid = asyncio.run(scenario())
+
+    assert built[0].sessions == ["s1", "ann:s1", None]
+    assert invalid.status_code == 400
+
+
+def test_metrics_endpoint_serves_prometheus_text_and_json():
+    from app.services.telemetry import get_metrics
+
+    server, _ = _server()
+    get_metrics().observe("tool_seconds", 0.02, tool="echo_tool")
+
+    async def scenario():
+        async with _client(server) as client:
+            return await client.get("/metrics"), await client.get("/metrics?format=json")
+
+    text, as_json = asyncio.run(scenario())
+
+    assert text.headers["content-type"].startswith("text/plain")
+    assert 'tool_seconds_count{tool="echo_tool"} 1' in text.text
+    assert as_json.json()["data"]["histograms"]["tool_seconds"][0]["count"] == 1
+
+
+def test_unexpected_errors_get_a_500_envelope():
+    server, built = _server(workers=1)
+
+    async def scenario():
+        async with _client(server) as client:
+            await server.startup()
+
+            async def fail(prompt, session_id=None):
+                raise RuntimeError("model unavailable")
+
+            built[0].arun = fail
+            failed = await client.post("/chat", json={"message": "hi"})
+            health = await client.get("/health")
+        return failed, health
+
+    failed, health = asyncio.run(scenario())
+
+    assert failed.status_code == 500
+    assert failed.json()["error"]["code"] == "internal_error"
+    assert "model unavailable" not in failed.text
+    assert health.json()["data"]["idle"] == 1
+
+
+def test_built_in_server_answers_when_the_agent_fails():
+    from app.server import _serve_connection
+
+    server, built = _server(workers=1)
+
+    async def scenario():
+        await server.startup()
+
+        async def fail(prompt, session_id=None):
+            raise RuntimeError("model unavailable")
+
+        built[0].arun = fail
+        listener = await asyncio.start_server(lambda r, w: _serve_connection(server, r, w), "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            body = b'{"message": "hi"}'
+            writer.write(b"POST /chat HTTP/1.1\r\ncontent-length: %d\r\n\r\n%s" % (len(body), body))
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+        return response
+
+    response = asyncio.run(scenario())
+
+    assert response.startswith(b"HTTP/1.1 500 ")
+    assert b'"internal_error"' in response
+
+
+def test_any_way_of_running_the_app_disables_the_browser_oauth_flow(monkeypatch):
+    # As under `uvicorn app.server:app`: no `main()`, and the environment asks for the browser flow.
+    monkeypatch.setenv("GOOGLE_OAUTH_INTERACTIVE", "true")
+    server, _ = _server()
+
+    async def scenario():
+        async with _client(server) as client:
+            return await client.get("/health")
+
+    assert asyncio.run(scenario()).status_code == 200
+    assert load_settings().google_oauth_interactive is False
+    assert reload_settings().google_oauth_interactive is False
+    with settings_override(timezone="UTC") as settings:
+        assert settings.google_oauth_interactive is False
+
+
+def test_oversized_bodies_are_rejected_with_413():
+    server, built = _server(max_body_bytes=64)
+
+    async def scenario():
+        async with _client(server) as client:
+            return (
+                await client.post("/chat", json={"message": "x" * 100}),
+                await client.post("/chat", json={"message": "fits"}),
+            )
+
+    too_large, fits = asyncio.run(scenario())
+
+    assert too_large.status_code == 413
+    assert too_large.json()["error"]["code"] == "payload_too_large"
+    assert fits.status_code == 200
+    assert sum(len(agent.prompts) for agent in built) == 1
+
+
+def test_built_in_server_does_not_read_oversized_bodies():
+    from app.server import _serve_connection
+
+    server, _ = _server(max_body_bytes=64)
+
+    async def scenario():
+        await server.startup()
+        listener = await asyncio.start_server(lambda r, w: _serve_connection(server, r, w), "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            # The declared body is never sent: the server must answer without waiting for it.
+            writer.write(b"POST /chat HTTP/1.1\r\ncontent-length: 10000000\r\n\r\n")
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), 2)
+            writer.close()
+        return response
+
+    assert asyncio.run(scenario()).startswith(b"HTTP/1.1 413 ")
@@ -1,6 +1,7 @@
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+from app.services.events import Event
 from app.tools.create_event import check_conflicts_tool
 
 
@@ -9,21 +10,26 @@ def test_check_conflicts_tool_expands_window_and_returns_conflicts(monkeypatch):
 
     class MockSettings:
         timezone = "UTC"
+        tzinfo = ZoneInfo("UTC")
 
     class MockService:
-        def list_from_to(self, time_min, time_max):
-            calls["time_min"] = time_min
-            calls["time_max"] = time_max
+        def find_conflicts(self, windows, calendar_ids=None):
+            ((calls["time_min"], calls["time_max"]),) = windows
             return [
-                {
-                    "summary": "Existing Meeting",
-                    "start": {"dateTime": "2026-01-30T10:15:00+00:00"},
-                    "end": {"dateTime": "2026-01-30T10:45:00+00:00"},
-                }
+                [
+                    Event.from_api(
+                        {
+                            "summary": "Existing Meeting",
+                            "start": {"dateTime": "2026-01-30T10:15:00+00:00"},
+                            "end": {"dateTime": "2026-01-30T10:45:00+00:00"},
+                        },
+                        MockSettings.tzinfo,
+                    )
+                ]
             ]
 
     monkeypatch.setattr("app.tools.create_event.load_settings", lambda: MockSettings())
-    monkeypatch.setattr("app.tools.create_event.GoogleCalendarClient", lambda: MockService())
+    monkeypatch.setattr("app.tools.create_event.get_calendar_client", lambda: MockService())
 
     start = datetime(2026, 1, 30, 10, 0, 0)
     end = datetime(2026, 1, 30, 11, 0, 0)
@@ -53,9 +59,10 @@ def test_check_conflicts_tool_returns_error_shape(monkeypatch):
 
     class MockSettings:
         timezone = "UTC"
+        tzinfo = ZoneInfo("UTC")
 
     class MockService:
-        def list_from_to(self, time_min, time_max):
+        def find_conflicts(self, windows, calendar_ids=None):
             raise GoogleCalendarError(
                 "Down",
                 status=500,
@@ -63,7 +70,7 @@ def test_check_conflicts_tool_returns_error_shape(monkeypatch):
             )
 
     monkeypatch.setattr("app.tools.create_event.load_settings", lambda: MockSettings())
-    monkeypatch.setattr("app.tools.create_event.GoogleCalendarClient", lambda: MockService())
+    monkeypatch.setattr("app.tools.create_event.get_calendar_client", lambda: MockService())
 
     start = datetime(2026, 1, 30, 10, 0, 0)
     end = datetime(2026, 1, 30, 11, 0, 0)
@@ -83,15 +90,15 @@ def test_check_conflicts_tool_converts_timezone_and_respects_buffer(monkeypatch)
 
     class MockSettings:
         timezone = "America/Los_Angeles"
+        tzinfo = ZoneInfo("America/Los_Angeles")
 
     class MockService:
-        def list_from_to(self, time_min, time_max):
-            calls["time_min"] = time_min
-            calls["time_max"] = time_max
-            return []
+        def find_conflicts(self, windows, calendar_ids=None):
+            ((calls["time_min"], calls["time_max"]),) = windows
+            return [[]]
 
     monkeypatch.setattr("app.tools.create_event.load_settings", lambda: MockSettings())
-    monkeypatch.setattr("app.tools.create_event.GoogleCalendarClient", lambda: MockService())
+    monkeypatch.setattr("app.tools.create_event.get_calendar_client", lambda: MockService())
 
     start = datetime(2026, 1, 30, 10, 0, 0, tzinfo=ZoneInfo("UTC"))
     end = datetime(2026, 1, 30, 11, 0, 0, tzinfo=ZoneInfo("UTC"))
@@ -105,3 +112,98 @@ def test_check_conflicts_tool_converts_timezone_and_respects_buffer(monkeypatch)
         "data": {"conflict_count": 0, "conflicts": []},
         "error": None,
     }
+
+
+def test_check_conflicts_tool_ainvoke_uses_async_client(monkeypatch):
+    import asyncio
+
+    calls = {}
+
+    class MockSettings:
+        timezone = "UTC"
+        tzinfo = ZoneInfo("UTC")
+
+    class MockAsyncService:
+        async def find_conflicts(self, windows, calendar_ids=None):
+            ((calls["time_min"], calls["time_max"]),) = windows
+            return [[]]
+
+    monkeypatch.setattr("app.tools.create_event.load_settings", lambda: MockSettings())
+    monkeypatch.setattr("app.tools.create_event.get_async_calendar_client", lambda: MockAsyncService())
+
+    result = asyncio.run(
+        check_conflicts_tool.ainvoke(
+            {"start": datetime(2026, 1, 30, 10, 0), "end": datetime(2026, 1, 30, 11, 0), "buffer_minutes": 5}
+        )
+    )
+
+    assert calls == {"time_min": "2026-01-30T09:55:00+00:00", "time_max": "2026-01-30T11:05:00+00:00"}
+    assert result == {"ok": True, "data": {"conflict_count": 0, "conflicts": []}, "error": None}
+
+
+def test_check_conflicts_tool_checks_a_whole_series_in_one_call(monkeypatch):
+    calls = []
+
+    class MockSettings:
+        timezone = "UTC"
+        tzinfo = ZoneInfo("UTC")
+
+    class MockService:
+        def find_conflicts(self, windows, calendar_ids=None):
+            calls.append(windows)
+            clash = Event.from_api(
+                {
+                    "summary": "Dentist",
+                    "start": {"dateTime": "2026-02-04T09:15:00+00:00"},
+                    "end": {"dateTime": "2026-02-04T10:00:00+00:00"},
+                },
+                MockSettings.tzinfo,
+            )
+            return [[clash] if start.startswith("2026-02-04") else [] for start, _ in windows]
+
+    monkeypatch.setattr("app.tools.create_event.load_settings", lambda: MockSettings())
+    monkeypatch.setattr("app.tools.create_event.get_calendar_client", lambda: MockService())
+
+    result = check_conflicts_tool.func(
+        start=datetime(2026, 1, 26, 9, 0),
+        end=datetime(2026, 1, 26, 9, 30),
+        recurrence="FREQ=WEEKLY;BYDAY=MO,WE;COUNT=4",
+    )
+
+    (windows,) = calls
+    assert [start for start, _ in windows] == [
+        "2026-01-26T09:00:00+00:00",
+        "2026-01-28T09:00:00+00:00",
+        "2026-02-02T09:00:00+00:00",
+        "2026-02-04T09:00:00+00:00",
+    ]
+    assert result["data"] == {
+        "conflict_count": 1,
+        "conflicts": [
+            {
+                "summary": "Dentist",
+                "start": "2026-02-04T09:15:00+00:00",
+                "end": "2026-02-04T10:00:00+00:00",
+                "occurrence": "2026-02-04T09:00:00+00:00",
+            }
+        ],
+        "occurrences_checked": 4,
+    }
+
+
+def test_check_conflicts_tool_rejects_an_invalid_rrule(monkeypatch):
+    class MockSettings:
+        timezone = "UTC"
+        tzinfo = ZoneInfo("UTC")
+
+    monkeypatch.setattr("app.tools.create_event.load_settings", lambda: MockSettings())
+
+    result = check_conflicts_tool.func(
+        start=datetime(2026, 1, 26, 9, 0),
+        end=datetime(2026, 1, 26, 9, 30),
+        recurrence="FREQ=SECONDLY",
+    )
+
+    assert result["ok"] is False
+    assert result["error"]["code"] == "invalid_argument"
+    assert result["error"]["reason"] == "invalid_recurrence"
@@ -7,6 +7,7 @@ def test_create_event_tool_calls_service_and_returns_data(monkeypatch):
 
     class MockSettings:
         timezone = "UTC"
+        tzinfo = ZoneInfo("UTC")
     
     class MockService:
         def create_event(self, summary, start_time, end_time):
@@ -16,7 +17,7 @@ def test_create_event_tool_calls_service_and_returns_data(monkeypatch):
             return {"summary": summary}
         
     monkeypatch.setattr(
-        "app.tools.create_event.GoogleCalendarClient",
+        "app.tools.create_event.get_calendar_client",
         lambda: MockService()
     )
     monkeypatch.setattr("app.tools.create_event.load_settings", lambda: MockSettings())
@@ -46,6 +47,7 @@ def test_create_event_tool_returns_error_shape(monkeypatch):
 
     class MockSettings:
         timezone = "UTC"
+        tzinfo = ZoneInfo("UTC")
 
     class MockService:
         def create_event(self, summary, start_time, end_time):
@@ -56,7 +58,7 @@ def test_create_event_tool_returns_error_shape(monkeypatch):
             )
 
     monkeypatch.setattr(
-        "app.tools.create_event.GoogleCalendarClient",
+        "app.tools.create_event.get_calendar_client",
         lambda: MockService(),
     )
     monkeypatch.setattr("app.tools.create_event.load_settings", lambda: MockSettings())
@@ -79,6 +81,7 @@ def test_create_event_tool_localizes_naive_datetimes(monkeypatch):
 
     class MockSettings:
         timezone = "America/Los_Angeles"
+        tzinfo = ZoneInfo("America/Los_Angeles")
 
     class MockService:
         def create_event(self, summary, start_time, end_time):
@@ -87,7 +90,7 @@ def test_create_event_tool_localizes_naive_datetimes(monkeypatch):
             return {"summary": summary}
 
     monkeypatch.setattr(
-        "app.tools.create_event.GoogleCalendarClient",
+        "app.tools.create_event.get_calendar_client",
         lambda: MockService(),
     )
     monkeypatch.setattr("app.tools.create_event.load_settings", lambda: MockSettings())
@@ -106,6 +109,7 @@ def test_create_event_tool_converts_aware_datetimes_to_settings_timezone(monkeyp
 
     class MockSettings:
         timezone = "America/Los_Angeles"
+        tzinfo = ZoneInfo("America/Los_Angeles")
 
     class MockService:
         def create_event(self, summary, start_time, end_time):
@@ -114,7 +118,7 @@ def test_create_event_tool_converts_aware_datetimes_to_settings_timezone(monkeyp
             return {"summary": summary}
 
     monkeypatch.setattr(
-        "app.tools.create_event.GoogleCalendarClient",
+        "app.tools.create_event.get_calendar_client",
         lambda: MockService(),
     )
     monkeypatch.setattr("app.tools.create_event.load_settings", lambda: MockSettings())
@@ -126,3 +130,74 @@ def test_create_event_tool_converts_aware_datetimes_to_settings_timezone(monkeyp
 
     assert calls["start"] == "2026-01-30T02:00:00-08:00"
     assert calls["end"] == "2026-01-30T03:00:00-08:00"
+
+
+def test_create_events_tool_reports_each_event(monkeypatch):
+    from app.services.google_calendar import BatchItemResult, GoogleCalendarError
+    from app.tools.create_event import EventInput, create_events_tool
+
+    calls = {}
+
+    class MockSettings:
+        timezone = "UTC"
+        tzinfo = ZoneInfo("UTC")
+
+    class MockService:
+        def create_events(self, events):
+            calls["events"] = events
+            return [
+                BatchItemResult(response={"id": "evt_1", "summary": "Focus"}),
+                BatchItemResult(error=GoogleCalendarError("Boom", status=400, reason="Bad request")),
+            ]
+
+    monkeypatch.setattr("app.tools.create_event.get_calendar_client", lambda: MockService())
+    monkeypatch.setattr("app.tools.create_event.load_settings", lambda: MockSettings())
+
+    first = EventInput(title="Focus", start=datetime(2026, 1, 23, 14, 0), end=datetime(2026, 1, 23, 17, 0))
+    second = EventInput(title="Focus", start=datetime(2026, 1, 30, 14, 0), end=datetime(2026, 1, 30, 17, 0))
+
+    result = create_events_tool.func(events=[first, second])
+
+    assert calls["events"][1] == {
+        "summary": "Focus",
+        "start_time": "2026-01-30T14:00:00+00:00",
+        "end_time": "2026-01-30T17:00:00+00:00",
+    }
+    assert result["ok"] is True
+    assert result["data"]["created_count"] == 1
+    assert result["data"]["failed_count"] == 1
+    assert result["data"]["results"][0]["data"]["eventId"] == "evt_1"
+    assert result["data"]["results"][1]["error"]["status"] == 400
+
+
+def test_create_event_tool_creates_a_series_with_one_call(monkeypatch):
+    calls = []
+
+    class MockSettings:
+        timezone = "UTC"
+        tzinfo = ZoneInfo("UTC")
+
+    class MockService:
+        def create_event(self, summary, start_time, end_time, recurrence=None):
+            calls.append(recurrence)
+            return {"summary": summary}
+
+    monkeypatch.setattr("app.tools.create_event.get_calendar_client", lambda: MockService())
+    monkeypatch.setattr("app.tools.create_event.load_settings", lambda: MockSettings())
+
+    start = datetime(2026, 1, 26, 9, 30)
+    end = datetime(2026, 1, 26, 9, 45)
+    result = create_event_tool.func(
+        title="Standup",
+        start=start,
+        end=end,
+        recurrence="FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR;COUNT=20",
+    )
+
+    assert calls == [["RRULE:FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR;COUNT=20"]]
+    assert result["data"] == {
+        "summary": "Standup",
+        "start": start,
+        "end": end,
+        "recurrence": "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR;COUNT=20",
+    }
@@ -13,7 +13,7 @@ def test_delete_event_tool_fetches_summary_and_deletes(monkeypatch):
             calls["deleted"] = True
             calls["deleted_id"] = event_id
 
-    monkeypatch.setattr("app.tools.delete_event.GoogleCalendarClient", lambda: MockService())
+    monkeypatch.setattr("app.tools.delete_event.get_calendar_client", lambda: MockService())
 
     result = delete_event_tool.func(event_id="event_1")
 
@@ -38,7 +38,7 @@ def test_delete_event_tool_returns_error_shape(monkeypatch):
                 reason="Not found",
             )
 
-    monkeypatch.setattr("app.tools.delete_event.GoogleCalendarClient", lambda: MockService())
+    monkeypatch.setattr("app.tools.delete_event.get_calendar_client", lambda: MockService())
 
     result = delete_event_tool.func(event_id="event_1")
 
@@ -48,3 +48,88 @@ def test_delete_event_tool_returns_error_shape(monkeypatch):
     assert result["error"]["status"] == 404
     assert result["error"]["reason"] == "Not found"
     assert result["error"]["code"] == "google_calendar_error"
+
+
+def test_delete_events_tool_skips_unknown_ids_and_reports_each(monkeypatch):
+    from app.services.google_calendar import BatchItemResult, GoogleCalendarError
+    from app.tools.delete_event import delete_events_tool
+
+    calls = {}
+
+    class MockService:
+        def get_events(self, event_ids):
+            return [
+                BatchItemResult(response={"summary": "One"}),
+                BatchItemResult(error=GoogleCalendarError("Missing", status=404, reason="Not found")),
+                BatchItemResult(response={"summary": "Three"}),
+            ]
+
+        def delete_events(self, event_ids):
+            calls["deleted"] = event_ids
+            return [BatchItemResult(response=""), BatchItemResult(response="")]
+
+    monkeypatch.setattr("app.tools.delete_event.get_calendar_client", lambda: MockService())
+
+    result = delete_events_tool.func(event_ids=["e1", "e2", "e3"])
+
+    assert calls["deleted"] == ["e1", "e3"]
+    assert result["data"]["deleted_count"] == 2
+    assert result["data"]["failed_count"] == 1
+    assert result["data"]["results"][0]["data"] == {"summary": "One", "eventId": "e1"}
+    assert result["data"]["results"][1]["error"]["status"] == 404
+
+
+def test_delete_events_tool_deletes_repeated_ids_once(monkeypatch):
+    from app.services.google_calendar import BatchItemResult
+    from app.tools.delete_event import delete_events_tool
+
+    calls = {}
+
+    class MockService:
+        def get_events(self, event_ids):
+            calls["looked_up"] = event_ids
+            return [BatchItemResult(response={"summary": event_id}) for event_id in event_ids]
+
+        def delete_events(self, event_ids):
+            calls["deleted"] = event_ids
+            return [BatchItemResult(response="") for _ in event_ids]
+
+    monkeypatch.setattr("app.tools.delete_event.get_calendar_client", lambda: MockService())
+
+    result = delete_events_tool.func(event_ids=["e1", "e2", "e1"])
+
+    assert calls == {"looked_up": ["e1", "e2"], "deleted": ["e1", "e2"]}
+    assert result["data"]["deleted_count"] == 2
+    assert result["data"]["failed_count"] == 0
+
+
+def test_deleting_an_event_evicts_only_cached_answers_overlapping_it(monkeypatch):
+    from datetime import datetime
+
+    from app.services.response_cache import ResponseCache, set_response_cache
+
+    class MockService:
+        def get_event(self, event_id):
+            return {
+                "id": event_id,
+                "summary": "Standup",
+                "start": {"dateTime": "2026-01-30T10:00:00+00:00"},
+                "end": {"dateTime": "2026-01-30T10:30:00+00:00"},
+            }
+
+        def delete_event(self, event_id):
+            pass
+
+    def ts(text):
+        return datetime.fromisoformat(text).timestamp()
+
+    cache = ResponseCache()
+    set_response_cache(cache)
+    cache.put("morning", "Standup at 10.", [(ts("2026-01-30T09:00:00+00:00"), ts("2026-01-30T12:00:00+00:00"))])
+    cache.put("evening", "Nothing tonight.", [(ts("2026-01-30T18:00:00+00:00"), ts("2026-01-30T22:00:00+00:00"))])
+    monkeypatch.setattr("app.tools.delete_event.get_calendar_client", lambda: MockService())
+
+    assert delete_event_tool.func(event_id="standup")["ok"] is True
+
+    assert cache.get("morning") is None
+    assert cache.get("evening") == "Nothing tonight."
@@ -0,0 +1,136 @@
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from app.tools.find_free_slots import find_free_slots_tool
+
+
+class MockSettings:
+    timezone = "UTC"
+    tzinfo = ZoneInfo("UTC")
+    default_calendar_id = "primary"
+    read_calendar_ids = ("primary",)
+    working_hours_start = "09:00"
+    working_hours_end = "12:00"
+
+
+def test_find_free_slots_tool_queries_all_calendars_once(monkeypatch):
+    calls = []
+
+    class MockService:
+        def free_busy(self, time_min, time_max, calendar_ids):
+            calls.append((time_min, time_max, calendar_ids))
+            return {
+                "primary": [{"start": "2026-01-30T09:00:00Z", "end": "2026-01-30T10:00:00Z"}],
+                "anna@example.com": [{"start": "2026-01-30T10:30:00Z", "end": "2026-01-30T11:00:00Z"}],
+            }
+
+    monkeypatch.setattr("app.tools.find_free_slots.load_settings", lambda: MockSettings())
+    monkeypatch.setattr("app.tools.find_free_slots.get_calendar_client", lambda: MockService())
+
+    result = find_free_slots_tool.func(
+        start=datetime(2026, 1, 30, 0, 0),
+        end=datetime(2026, 1, 31, 0, 0),
+        duration_minutes=30,
+        attendees=["anna@example.com"],
+    )
+
+    assert calls == [
+        ("2026-01-30T00:00:00+00:00", "2026-01-31T00:00:00+00:00", ["primary", "anna@example.com"]),
+    ]
+    assert result == {
+        "ok": True,
+        "data": {
+            "calendars": ["primary", "anna@example.com"],
+            "slots": [
+                {"start": "2026-01-30T10:00:00+00:00", "end": "2026-01-30T10:30:00+00:00"},
+                {"start": "2026-01-30T11:00:00+00:00", "end": "2026-01-30T11:30:00+00:00"},
+                {"start": "2026-01-30T11:30:00+00:00", "end": "2026-01-30T12:00:00+00:00"},
+            ],
+        },
+        "error": None,
+    }
+
+
+def test_find_free_slots_tool_returns_error_shape(monkeypatch):
+    from app.services.google_calendar import GoogleCalendarError
+
+    class MockService:
+        def free_busy(self, time_min, time_max, calendar_ids):
+            raise GoogleCalendarError("Denied", status=403, reason="Forbidden")
+
+    monkeypatch.setattr("app.tools.find_free_slots.load_settings", lambda: MockSettings())
+    monkeypatch.setattr("app.tools.find_free_slots.get_calendar_client", lambda: MockService())
+
+    result = find_free_slots_tool.func(
+        start=datetime(2026, 1, 30, 0, 0),
+        end=datetime(2026, 1, 31, 0, 0),
+        duration_minutes=30,
+    )
+
+    assert result["ok"] is False
+    assert result["error"]["status"] == 403
+    assert result["error"]["code"] == "google_calendar_error"
+
+
+def test_find_free_slots_tool_rejects_non_positive_duration():
+    result = find_free_slots_tool.func(
+        start=datetime(2026, 1, 30, 0, 0),
+        end=datetime(2026, 1, 31, 0, 0),
+        duration_minutes=0,
+    )
+
+    assert result["ok"] is False
+    assert result["error"]["code"] == "invalid_argument"
+
+
+def test_find_free_slots_tool_also_avoids_the_configured_extra_calendars(monkeypatch):
+    calls = []
+
+    class TeamSettings(MockSettings):
+        read_calendar_ids = ("primary", "team@example.com")
+
+    class MockService:
+        def free_busy(self, time_min, time_max, calendar_ids):
+            calls.append(calendar_ids)
+            return {
+                "primary": [],
+                "team@example.com": [{"start": "2026-01-30T09:00:00Z", "end": "2026-01-30T11:30:00Z"}],
+                "anna@example.com": [],
+            }
+
+    monkeypatch.setattr("app.tools.find_free_slots.load_settings", lambda: TeamSettings())
+    monkeypatch.setattr("app.tools.find_free_slots.get_calendar_client", lambda: MockService())
+
+    result = find_free_slots_tool.func(
+        start=datetime(2026, 1, 30, 0, 0),
+        end=datetime(2026, 1, 31, 0, 0),
+        duration_minutes=30,
+        attendees=["anna@example.com", "team@example.com"],
+    )
+
+    assert calls == [["primary", "team@example.com", "anna@example.com"]]
+    assert result["data"]["slots"] == [{"start": "2026-01-30T11:30:00+00:00", "end": "2026-01-30T12:00:00+00:00"}]
+
+
+def test_find_free_slots_tool_widens_the_query_by_the_buffer(monkeypatch):
+    calls = []
+
+    class MockService:
+        def free_busy(self, time_min, time_max, calendar_ids):
+            calls.append((time_min, time_max))
+            # Ends just before the range: only found because the query was widened.
+            return {"primary": [{"start": "2026-01-30T08:30:00Z", "end": "2026-01-30T09:00:00Z"}]}
+
+    monkeypatch.setattr("app.tools.find_free_slots.load_settings", lambda: MockSettings())
+    monkeypatch.setattr("app.tools.find_free_slots.get_calendar_client", lambda: MockService())
+
+    result = find_free_slots_tool.func(
+        start=datetime(2026, 1, 30, 9, 0),
+        end=datetime(2026, 1, 30, 12, 0),
+        duration_minutes=30,
+        buffer_minutes=15,
+        max_results=1,
+    )
+
+    assert calls == [("2026-01-30T08:45:00+00:00", "2026-01-30T12:15:00+00:00")]
+    assert result["data"]["slots"] == [{"start": "2026-01-30T09:15:00+00:00", "end": "2026-01-30T09:45:00+00:00"}]
@@ -1,5 +1,7 @@
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
+from app.services.events import Event
 from app.tools.list_events import list_next_events_tool, list_today_events_tool
 
 
@@ -14,22 +16,26 @@ def test_list_next_events_tool_calls_service_and_formats_events(monkeypatch):
 
     class MockSettings:
         timezone = "UTC"
+        tzinfo = ZoneInfo("UTC")
 
     class MockService:
-        def list_events(self, time_min, max_results=5):
+        def list_events(self, time_min, max_results=5, calendar_ids=None):
             calls["time_min"] = time_min
             calls["max_results"] = max_results
             return [
-                {
-                    "id": "evt_1",
-                    "summary": "Standup",
-                    "start": {"dateTime": "2026-01-30T10:00:00+00:00"},
-                    "end": {"dateTime": "2026-01-30T10:15:00+00:00"},
-                }
+                Event.from_api(
+                    {
+                        "id": "evt_1",
+                        "summary": "Standup",
+                        "start": {"dateTime": "2026-01-30T10:00:00+00:00"},
+                        "end": {"dateTime": "2026-01-30T10:15:00+00:00"},
+                    },
+                    MockSettings.tzinfo,
+                )
             ]
 
     monkeypatch.setattr("app.tools.list_events.load_settings", lambda: MockSettings())
-    monkeypatch.setattr("app.tools.list_events.GoogleCalendarClient", lambda: MockService())
+    monkeypatch.setattr("app.tools.list_events.get_calendar_client", lambda: MockService())
     monkeypatch.setattr("app.tools.list_events.datetime", FixedDateTime)
 
     result = list_next_events_tool.func(n=1)
@@ -66,15 +72,16 @@ def test_list_today_events_tool_calls_service_for_day_window(monkeypatch):
 
     class MockSettings:
         timezone = "UTC"
+        tzinfo = ZoneInfo("UTC")
 
     class MockService:
-        def list_from_to(self, time_min, time_max):
+        def list_from_to(self, time_min, time_max, calendar_ids=None):
             calls["time_min"] = time_min
             calls["time_max"] = time_max
             return []
 
     monkeypatch.setattr("app.tools.list_events.load_settings", lambda: MockSettings())
-    monkeypatch.setattr("app.tools.list_events.GoogleCalendarClient", lambda: MockService())
+    monkeypatch.setattr("app.tools.list_events.get_calendar_client", lambda: MockService())
     monkeypatch.setattr("app.tools.list_events.datetime", FixedDateTime)
 
     result = list_today_events_tool.func()
@@ -89,9 +96,10 @@ def test_list_today_events_tool_returns_error_shape(monkeypatch):
 
     class MockSettings:
         timezone = "UTC"
+        tzinfo = ZoneInfo("UTC")
 
     class MockService:
-        def list_from_to(self, time_min, time_max):
+        def list_from_to(self, time_min, time_max, calendar_ids=None):
             raise GoogleCalendarError(
                 "Fail",
                 status=502,
@@ -99,7 +107,7 @@ def test_list_today_events_tool_returns_error_shape(monkeypatch):
             )
 
     monkeypatch.setattr("app.tools.list_events.load_settings", lambda: MockSettings())
-    monkeypatch.setattr("app.tools.list_events.GoogleCalendarClient", lambda: MockService())
+    monkeypatch.setattr("app.tools.list_events.get_calendar_client", lambda: MockService())
     monkeypatch.setattr("app.tools.list_events.datetime", FixedDateTime)
 
     result = list_today_events_tool.func()
@@ -117,9 +125,10 @@ def test_list_next_events_tool_returns_error_shape(monkeypatch):
 
     class MockSettings:
         timezone = "UTC"
+        tzinfo = ZoneInfo("UTC")
 
     class MockService:
-        def list_events(self, time_min, max_results=5):
+        def list_events(self, time_min, max_results=5, calendar_ids=None):
             raise GoogleCalendarError(
                 "Oops",
                 status=503,
@@ -127,7 +136,7 @@ def test_list_next_events_tool_returns_error_shape(monkeypatch):
             )
 
     monkeypatch.setattr("app.tools.list_events.load_settings", lambda: MockSettings())
-    monkeypatch.setattr("app.tools.list_events.GoogleCalendarClient", lambda: MockService())
+    monkeypatch.setattr("app.tools.list_events.get_calendar_client", lambda: MockService())
     monkeypatch.setattr("app.tools.list_events.datetime", FixedDateTime)
 
     result = list_next_events_tool.func(n=2)
@@ -145,15 +154,16 @@ def test_list_today_events_tool_respects_timezone(monkeypatch):
 
     class MockSettings:
         timezone = "America/Los_Angeles"
+        tzinfo = ZoneInfo("America/Los_Angeles")
 
     class MockService:
-        def list_from_to(self, time_min, time_max):
+        def list_from_to(self, time_min, time_max, calendar_ids=None):
             calls["time_min"] = time_min
             calls["time_max"] = time_max
             return []
 
     monkeypatch.setattr("app.tools.list_events.load_settings", lambda: MockSettings())
-    monkeypatch.setattr("app.tools.list_events.GoogleCalendarClient", lambda: MockService())
+    monkeypatch.setattr("app.tools.list_events.get_calendar_client", lambda: MockService())
     monkeypatch.setattr("app.tools.list_events.datetime", FixedDateTime)
 
     result = list_today_events_tool.func()
@@ -0,0 +1,178 @@
+import asyncio
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.services.events import Event
+from app.tools.create_event import check_conflicts_tool, create_event_tool
+from app.tools.delete_event import delete_event_tool
+from app.tools.find_free_slots import find_free_slots_tool
+from app.tools.list_events import list_next_events_tool, list_today_events_tool
+from app.tools.memo import memoize_calls
+
+UTC = ZoneInfo("UTC")
+TODAY = datetime.combine(datetime.now(tz=UTC).date(), time.min, tzinfo=UTC)
+
+
+class MockSettings:
+    timezone = "UTC"
+    tzinfo = UTC
+    default_calendar_id = "primary"
+    read_calendar_ids = ("primary",)
+    working_hours_start = "09:00"
+    working_hours_end = "18:00"
+
+
+def _event(event_id, hour, minutes=30, *, days=0, **extra):
+    start = TODAY + timedelta(days=days, hours=hour)
+    return Event.from_api(
+        {
+            "id": event_id,
+            "summary": event_id.title(),
+            "start": {"dateTime": start.isoformat()},
+            "end": {"dateTime": (start + timedelta(minutes=minutes)).isoformat()},
+            **extra,
+        },
+        UTC,
+    )
+
+
+class MockService:
+    def __init__(self, events):
+        self.events = events
+        self.calls = []
+
+    def list_from_to(self, time_min, time_max, fields=None, calendar_ids=None):
+        self.calls.append("list_from_to")
+        lo, hi = datetime.fromisoformat(time_min).timestamp(), datetime.fromisoformat(time_max).timestamp()
+        return [e for e in self.events if e.start < hi and lo < e.end]
+
+    def list_events(self, time_min, max_results, fields=None, calendar_ids=None):
+        self.calls.append("list_events")
+        return self.events[:max_results]
+
+    def find_conflicts(self, windows, calendar_ids=None):
+        self.calls.append("find_conflicts")
+        return [[]]
+
+    def free_busy(self, time_min, time_max, calendar_ids):
+        self.calls.append("free_busy")
+        return {calendar_id: [] for calendar_id in calendar_ids}
+
+    def get_event(self, event_id):
+        self.calls.append("get_event")
+        (event,) = [e for e in self.events if e.id == event_id]
+        return {"id": event.id, "summary": event.summary, "start": {"dateTime": event.start_iso}, "end": {"dateTime": event.end_iso}}
+
+    def delete_event(self, event_id):
+        self.calls.append("delete_event")
+
+    def create_event(self, summary, start_time, end_time):
+        self.calls.append("create_event")
+        return {"summary": summary}
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = MockService([_event("standup", 10), _event("review", 14, 60), _event("gym", 19, transparency="transparent")])
+    for module in ("create_event", "delete_event", "find_free_slots", "list_events"):
+        monkeypatch.setattr(f"app.tools.{module}.get_calendar_client", lambda: service)
+    for module in ("create_event", "find_free_slots", "list_events", "memo"):
+        monkeypatch.setattr(f"app.tools.{module}.load_settings", lambda: MockSettings())
+    monkeypatch.setattr("app.services.response_cache.load_settings", lambda: MockSettings())
+    return service
+
+
+def test_conflict_checks_inside_a_listed_day_reuse_the_listing(service):
+    with memoize_calls() as memo:
+        listed = list_today_events_tool.func()
+        busy = check_conflicts_tool.func(start=TODAY + timedelta(hours=14, minutes=30), end=TODAY + timedelta(hours=15))
+        free = check_conflicts_tool.func(start=TODAY + timedelta(hours=19), end=TODAY + timedelta(hours=20))
+
+    assert len(listed["data"]["events"]) == 3
+    assert [c["summary"] for c in busy["data"]["conflicts"]] == ["Review"]
+    # Transparent ("free") events still don't count as conflicts.
+    assert free["data"]["conflicts"] == []
+    assert service.calls == ["list_from_to"]
+    assert memo.hits == 2
+
+
+def test_upcoming_events_are_answered_from_a_longer_listing(service):
+    service.events = [_event("standup", 10, days=1), _event("review", 14, days=1), _event("gym", 19, days=1)]
+    with memoize_calls():
+        list_next_events_tool.func(n=3)
+        shorter = list_next_events_tool.func(n=2)
+
+    assert [e["eventId"] for e in shorter["data"]["events"]] == ["standup", "review"]
+    assert service.calls == ["list_events"]
+
+
+def test_writes_invalidate_only_the_ranges_they_touch(service):
+    morning = TODAY + timedelta(hours=9), TODAY + timedelta(hours=11)
+    evening = TODAY + timedelta(hours=18), TODAY + timedelta(hours=20)
+    with memoize_calls():
+        check_conflicts_tool.func(start=morning[0], end=morning[1])
+        check_conflicts_tool.func(start=evening[0], end=evening[1])
+        create_event_tool.func(title="Coffee", start=morning[0], end=morning[0] + timedelta(minutes=30))
+        check_conflicts_tool.func(start=evening[0], end=evening[1])
+        check_conflicts_tool.func(start=morning[0], end=morning[1])
+
+    assert service.calls == ["list_from_to", "list_from_to", "create_event", "list_from_to"]
+
+
+def test_deleting_a_listed_event_drops_its_range(service):
+    with memoize_calls():
+        check_conflicts_tool.func(start=TODAY + timedelta(hours=9), end=TODAY + timedelta(hours=11))
+        check_conflicts_tool.func(start=TODAY + timedelta(hours=18), end=TODAY + timedelta(hours=20))
+        delete_event_tool.func(event_id="standup")
+        check_conflicts_tool.func(start=TODAY + timedelta(hours=18), end=TODAY + timedelta(hours=20))
+        check_conflicts_tool.func(start=TODAY + timedelta(hours=9), end=TODAY + timedelta(hours=11))
+
+    assert service.calls.count("list_from_to") == 3
+
+
+def test_deleting_an_unlisted_event_keeps_ranges_it_does_not_touch(service):
+    with memoize_calls():
+        check_conflicts_tool.func(start=TODAY + timedelta(hours=18), end=TODAY + timedelta(hours=20))
+        delete_event_tool.func(event_id="standup")
+        check_conflicts_tool.func(start=TODAY + timedelta(hours=18), end=TODAY + timedelta(hours=20))
+
+    assert service.calls == ["list_from_to", "get_event", "delete_event"]
+
+
+def test_free_busy_for_a_narrower_window_is_not_requested_again(service):
+    with memoize_calls():
+        find_free_slots_tool.func(start=TODAY, end=TODAY + timedelta(days=2), duration_minutes=30)
+        find_free_slots_tool.func(start=TODAY + timedelta(days=1), end=TODAY + timedelta(days=2), duration_minutes=30)
+        find_free_slots_tool.func(start=TODAY, end=TODAY + timedelta(days=1), duration_minutes=30, attendees=["anna@example.com"])
+
+    assert service.calls == ["free_busy", "free_busy"]
+
+
+def test_async_tools_share_the_memo(monkeypatch, service):
+    class AsyncService:
+        async def list_from_to(self, time_min, time_max, fields=None, calendar_ids=None):
+            return service.list_from_to(time_min, time_max, fields)
+
+    monkeypatch.setattr("app.tools.create_event.get_async_calendar_client", lambda: AsyncService())
+    monkeypatch.setattr("app.tools.list_events.get_async_calendar_client", lambda: AsyncService())
+
+    async def turn():
+        with memoize_calls():
+            await list_today_events_tool.ainvoke({})
+            return await check_conflicts_tool.ainvoke(
+                {"start": TODAY + timedelta(hours=10), "end": TODAY + timedelta(hours=11)}
+            )
+
+    result = asyncio.run(turn())
+
+    assert result["data"]["conflict_count"] == 1
+    assert service.calls == ["list_from_to"]
+
+
+def test_calls_outside_a_turn_go_straight_to_the_service(service):
+    check_conflicts_tool.func(start=TODAY + timedelta(hours=10), end=TODAY + timedelta(hours=11))
+    check_conflicts_tool.func(start=TODAY + timedelta(hours=10), end=TODAY + timedelta(hours=11))
+
+    assert service.calls == ["find_conflicts", "find_conflicts"]